@@ -1,19 +1,82 @@
 import heapq
 import math
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union
+
+if TYPE_CHECKING:  # NumPy es opcional: solo para las anotaciones
+    import numpy as np
+    from priority_queues import Cola
+
+# Matriz de distancias y, con next_hop=True, tambien la de siguientes nodos.
+# Con engine="numpy" las dos son ndarray (del dtype pedido e int32).
+Matriz = Union[List[List[float]], "np.ndarray"]
+MatrizNext = Union[List[List[int]], "np.ndarray"]
 
 class WeightedGraph:
     def __init__(self, n: int):
         self.n = n
         self.adj = {i: [] for i in range(n)}
+        self._radj = None  # Adyacencia inversa, se construye bajo demanda
+        self.version = 0   # Sube con cada cambio de aristas (invalida caches)
     
     def add_edge(self, u: int, v: int, w: float):
         self.adj[u].append((v, w))
+        self.version += 1
+        if self._radj is not None:
+            self._radj[v].append((u, w))
         # Para no dirigido: self.adj[v].append((u, w))
     
+    def remove_edge(self, u: int, v: int):
+        """Quita todas las aristas u -> v (p. ej. al cerrar una calle)."""
+        restantes = [(x, w) for x, w in self.adj[u] if x != v]
+        if len(restantes) == len(self.adj[u]):
+            raise ValueError(f"No existe la arista {u} -> {v}")
+        self.adj[u] = restantes
+        if self._radj is not None:
+            self._radj[v] = [(x, w) for x, w in self._radj[v] if x != u]
+        self.version += 1
+    
+    def update_weight(self, u: int, v: int, w: float):
+        """Cambia el peso de u -> v (si hay paralelas, todas quedan con w)."""
+        if not any(x == v for x, _ in self.adj[u]):
+            raise ValueError(f"No existe la arista {u} -> {v}")
+        self.adj[u] = [(x, w if x == v else peso) for x, peso in self.adj[u]]
+        if self._radj is not None:
+            self._radj[v] = [(x, w if x == u else peso) for x, peso in self._radj[v]]
+        self.version += 1
+    
+    def reverse_adj(self) -> Dict[int, List[Tuple[int, float]]]:
+        """
+        Adyacencia inversa (aristas entrantes). Se construye una sola vez y
+        add_edge/remove_edge/update_weight la mantienen al dia.
+        """
+        if self._radj is None:
+            radj = {i: [] for i in range(self.n)}
+            for u in range(self.n):
+                for v, w in self.adj[u]:
+                    radj[v].append((u, w))
+            self._radj = radj
+        return self._radj
+    
+    def to_csr(self):
+        """
+        Congela el grafo en un CSRGraph compacto (ver csr_graph.py).
+        Conviene hacerlo una vez terminada la carga: el CSR ocupa mucha menos
+        memoria y su dijkstra/floyd_warshall recorren buffers contiguos.
+        """
+        from csr_graph import CSRGraph
+        return CSRGraph.from_weighted_graph(self)
+    
     # Dijkstra
-    def dijkstra(self, src: int) -> Tuple[List[float], List[int]]:
+    def dijkstra(self, src: int, queue: "Cola" = "heapq") -> Tuple[List[float], List[int]]:
+        """
+        queue elige la cola de prioridad: "heapq" (borrado perezoso) o una de
+        priority_queues.py con decrease-key: "binary", "pairing", "bucket"
+        (esta ultima solo para pesos enteros). Tambien acepta una cola ya
+        creada y vacia, para leer sus contadores al terminar.
+        """
+        if queue != "heapq":
+            return self._dijkstra_indexado(src, queue)
         dist = [math.inf] * self.n
         parent = [-1] * self.n
         dist[src] = 0
@@ -33,37 +96,280 @@ class WeightedGraph:
         
         return dist, parent
     
+    def _dijkstra_indexado(self, src: int, queue: "Cola") -> Tuple[List[float], List[int]]:
+        from priority_queues import make_queue
+        dist = [math.inf] * self.n
+        parent = [-1] * self.n
+        dist[src] = 0
+        pq = make_queue(queue)
+        pq.push(src, 0)
+        
+        # Cada nodo esta a lo mas una vez en la cola: no hay entradas viejas
+        while pq:
+            u, d = pq.pop()
+            for v, w in self.adj[u]:
+                if d + w < dist[v]:
+                    dist[v] = d + w
+                    parent[v] = u
+                    pq.push(v, dist[v])
+        
+        return dist, parent
+    
+    def delta_stepping(self, src: int, delta: float = None, workers: int = 1):
+        """
+        Mismas distancias que dijkstra(), procesando cubetas de ancho delta
+        en lote con NumPy (ver delta_stepping.py). Retorna ndarrays.
+        """
+        from delta_stepping import delta_stepping
+        return delta_stepping(self, src, delta, workers)
+    
+    # Busquedas acotadas (isocronas)
+    def dijkstra_bounded(self, src: int, radius: float) -> Tuple[Dict[int, float], Dict[int, int]]:
+        """
+        Dijkstra que solo asienta los nodos con distancia <= radius
+        ("que intersecciones alcanzo en 10 minutos desde src").
+        Retorna diccionarios (dist, parent) con solo esos nodos; el trabajo
+        es proporcional a la region alcanzada, no al grafo completo.
+        """
+        dist, parent, _ = self._dijkstra_acotado([src], radius)
+        return dist, parent
+    
+    def multi_source_bounded(self, sources, radius: float) -> Tuple[Dict[int, float], Dict[int, int]]:
+        """
+        Igual que dijkstra_bounded pero desde varios origenes a la vez
+        (p. ej. todos los depositos). Retorna (dist, origin): distancia al
+        origen mas cercano y cual es ese origen.
+        """
+        dist, _, origin = self._dijkstra_acotado(sources, radius)
+        return dist, origin
+    
+    def _dijkstra_acotado(self, sources, radius: float):
+        tentativa = {}
+        parent = {}
+        origin = {}
+        pq = []
+        for s in sources:
+            if not 0 <= s < self.n:
+                raise IndexError("Nodo fuera de rango")
+            tentativa[s] = 0
+            parent[s] = -1
+            origin[s] = s
+            pq.append((0, s))
+        heapq.heapify(pq)
+        
+        dist = {}  # Solo nodos asentados
+        while pq:
+            d, u = heapq.heappop(pq)
+            if d > radius:
+                break  # El frente ya salio del radio: lo demas esta mas lejos
+            if u in dist: continue
+            dist[u] = d
+            
+            for v, w in self.adj[u]:
+                nd = d + w
+                if nd <= radius and v not in dist and nd < tentativa.get(v, math.inf):
+                    tentativa[v] = nd
+                    parent[v] = u
+                    origin[v] = origin[u]
+                    heapq.heappush(pq, (nd, v))
+        
+        parent = {v: parent[v] for v in dist}
+        origin = {v: origin[v] for v in dist}
+        return dist, parent, origin
+    
+    # Consultas punto a punto
+    def shortest_path(self, src: int, dst: int, method: str = "dijkstra",
+                      heuristic=None) -> Tuple[float, List[int]]:
+        """
+        Ruta mas corta de src a dst. Retorna (distancia, camino); si dst no es
+        alcanzable retorna (inf, []).
+        
+        A diferencia de dijkstra(), se detiene en cuanto la ruta queda fija:
+        - "dijkstra": Dijkstra normal que termina al sacar dst del heap.
+        - "bidirectional": busca desde src y hacia atras desde dst (usa
+          reverse_adj) y para cuando los dos frentes ya no pueden mejorar.
+        - "astar": A* con heuristic(u, dst), que debe ser admisible (nunca
+          sobreestimar la distancia real de u a dst).
+        """
+        if not (0 <= src < self.n and 0 <= dst < self.n):
+            raise IndexError("Nodo fuera de rango")
+        if method == "dijkstra":
+            return self._astar(src, dst, lambda u, t: 0)
+        if method == "astar":
+            if heuristic is None:
+                raise ValueError("A* requiere una heuristica")
+            return self._astar(src, dst, heuristic)
+        if method == "bidirectional":
+            return self._bidireccional(src, dst)
+        raise ValueError(f"Metodo desconocido: {method}")
+    
+    def k_shortest_paths(self, src: int, dst: int, k: int = None):
+        """
+        Rutas alternativas: generador de (costo, camino) sin ciclos en orden
+        de costo (Yen, ver k_shortest_paths.py). Se puede dejar de iterar en
+        cualquier momento.
+        """
+        from k_shortest_paths import yen_k_shortest_paths
+        return yen_k_shortest_paths(self, src, dst, k)
+    
+    @staticmethod
+    def _camino(parent: Dict[int, int], dst: int) -> List[int]:
+        """Reconstruye el camino siguiendo los padres hasta la fuente."""
+        camino = [dst]
+        while parent[camino[-1]] != -1:
+            camino.append(parent[camino[-1]])
+        camino.reverse()
+        return camino
+    
+    def _astar(self, src: int, dst: int, heuristic) -> Tuple[float, List[int]]:
+        # Diccionarios en lugar de listas de tamano n: solo se toca
+        # la region explorada
+        dist = {src: 0}
+        parent = {src: -1}
+        pq = [(heuristic(src, dst), 0, src)]  # (f = g + h, g, node)
+        
+        while pq:
+            f, d, u = heapq.heappop(pq)
+            if d > dist[u]: continue  # Entrada vieja
+            if u == dst:
+                return d, self._camino(parent, dst)
+            
+            for v, w in self.adj[u]:
+                nd = d + w
+                if nd < dist.get(v, math.inf):
+                    dist[v] = nd
+                    parent[v] = u
+                    heapq.heappush(pq, (nd + heuristic(v, dst), nd, v))
+        
+        return math.inf, []
+    
+    def _bidireccional(self, src: int, dst: int) -> Tuple[float, List[int]]:
+        if src == dst:
+            return 0, [src]
+        
+        adjs = (self.adj, self.reverse_adj())
+        dists = ({src: 0}, {dst: 0})
+        parents = ({src: -1}, {dst: -1})
+        pqs = ([(0, src)], [(0, dst)])
+        settled = (set(), set())
+        mejor, punto = math.inf, -1
+        
+        while pqs[0] and pqs[1]:
+            # Criterio de parada: ningun camino que cruce los frentes
+            # puede mejorar el mejor encontrado
+            if pqs[0][0][0] + pqs[1][0][0] >= mejor:
+                break
+            # Avanzar el frente con el heap mas pequeno
+            lado = 0 if len(pqs[0]) <= len(pqs[1]) else 1
+            d, u = heapq.heappop(pqs[lado])
+            if u in settled[lado]: continue
+            settled[lado].add(u)
+            
+            dist, otro = dists[lado], dists[1 - lado]
+            for v, w in adjs[lado][u]:
+                nd = d + w
+                if nd < dist.get(v, math.inf):
+                    dist[v] = nd
+                    parents[lado][v] = u
+                    heapq.heappush(pqs[lado], (nd, v))
+                if v in otro and nd + otro[v] < mejor:
+                    mejor, punto = nd + otro[v], v
+        
+        if punto == -1:
+            return math.inf, []
+        
+        # src -> punto con los padres hacia adelante, punto -> dst con los de atras
+        camino = self._camino(parents[0], punto)
+        nodo = parents[1][punto]
+        while nodo != -1:
+            camino.append(nodo)
+            nodo = parents[1][nodo]
+        return mejor, camino
+    
+    # Johnson
+    def johnson(self, workers: int = None):
+        """
+        Todos los pares con Johnson (admite pesos negativos). Es un generador
+        de (src, fila) en orden de src: la matriz completa nunca esta en
+        memoria. Los Dijkstra se reparten en `workers` procesos (johnson.py).
+        """
+        from johnson import johnson_rows
+        return johnson_rows(self, workers)
+    
     # Floyd-Warshall
-    def floyd_warshall(self) -> List[List[float]]:
+    def floyd_warshall(self, engine: str = "python", next_hop: bool = False,
+                       **opciones) -> Union[Matriz, Tuple[Matriz, MatrizNext]]:
+        """
+        Distancias entre todos los pares.
+        engine="numpy" usa la version vectorizada de floyd_warshall.py
+        (acepta dtype y block_size) y devuelve un ndarray n x n; con
+        engine="python" son listas de listas.
+        next_hop=True retorna (dist, nxt), donde nxt[i][j] es el nodo que
+        sigue a i en la ruta minima hacia j (-1 si no hay ruta); la ruta
+        completa se obtiene con route(nxt, i, j).
+        """
+        if engine == "numpy":
+            from floyd_warshall import floyd_warshall_numpy
+            return floyd_warshall_numpy(self, next_hop=next_hop, **opciones)
+        if engine != "python":
+            raise ValueError(f"Motor desconocido: {engine}")
+        
         dist = [[math.inf] * self.n for _ in range(self.n)]
+        nxt = [[-1] * self.n for _ in range(self.n)] if next_hop else None
         for i in range(self.n):
             dist[i][i] = 0
+            if next_hop:
+                nxt[i][i] = i
         
         for u in range(self.n):
             for v, w in self.adj[u]:
                 dist[u][v] = w
+                if next_hop:
+                    nxt[u][v] = v
         
         for k in range(self.n):
             for i in range(self.n):
                 for j in range(self.n):
                     if dist[i][k] + dist[k][j] < dist[i][j]:
                         dist[i][j] = dist[i][k] + dist[k][j]
+                        if next_hop:
+                            nxt[i][j] = nxt[i][k]
         
         # Detectar ciclos negativos
         for i in range(self.n):
             if dist[i][i] < 0:
                 raise ValueError("Ciclo negativo detectado")
         
-        return dist
+        return (dist, nxt) if next_hop else dist
+    
+    @staticmethod
+    def route(nxt, i: int, j: int) -> List[int]:
+        """
+        Ruta de i a j con la matriz next-hop de floyd_warshall, en tiempo
+        proporcional al largo de la ruta ([] si no hay ruta).
+        Una ruta simple tiene a lo sumo n - 1 saltos: si no se llega a j en
+        ese limite (nxt con un ciclo o corrupta) se lanza ValueError.
+        """
+        if nxt[i][j] == -1:
+            return []
+        origen, n = i, len(nxt)
+        camino = [i]
+        while i != j:
+            i = int(nxt[i][j])
+            if i == -1 or len(camino) == n:
+                raise ValueError(f"Matriz next-hop invalida para la ruta {origen} -> {j}")
+            camino.append(i)
+        return camino
 
 # Ejemplo de uso
-g = WeightedGraph(6)
-g.add_edge(0,1,10); g.add_edge(0,2,5)
-g.add_edge(1,3,3); g.add_edge(2,3,2); g.add_edge(2,4,8)
-g.add_edge(3,4,4); g.add_edge(1,5,15); g.add_edge(4,5,7)
+if __name__ == "__main__":
+    g = WeightedGraph(6)
+    g.add_edge(0,1,10); g.add_edge(0,2,5)
+    g.add_edge(1,3,3); g.add_edge(2,3,2); g.add_edge(2,4,8)
+    g.add_edge(3,4,4); g.add_edge(1,5,15); g.add_edge(4,5,7)
 
-dist, parent = g.dijkstra(0)
-print(f"Dist a F: {dist[5]}")  # 18
+    dist, parent = g.dijkstra(0)
+    print(f"Dist a F: {dist[5]}")  # 18
 
-fw = g.floyd_warshall()
-print(f"FW dist 0-5: {fw[0][5]}")  # 18
\ No newline at end of file
+    fw = g.floyd_warshall()
+    print(f"FW dist 0-5: {fw[0][5]}")  # 18
\ No newline at end of file
@@ -1,13 +1,83 @@
+from tree_iter import RecorridoEnOrden
+
+
 class NodoAVL:
     def __init__(self, valor):
         self.valor = valor
         self.izquierdo = None
         self.derecho = None
         self.altura = 1  # Altura del nodo (hoja = 1)
+        self.tamano = 1  # Nodos en el subárbol (para rank/select)
+        self.version = None  # Escritura persistente que lo creó
 
-class AVL:
-    def __init__(self):
+class AVL(RecorridoEnOrden):
+    """
+    Árbol AVL (sin duplicados).
+    
+    Con persistente=True ninguna operación modifica un nodo existente: cada
+    insertar/eliminar copia solo los O(log n) nodos del camino (y los de las
+    rotaciones) y al final publica la nueva raíz con una sola asignación.
+    Las versiones anteriores siguen intactas y comparten el resto de los
+    nodos, así que snapshot() entrega en O(1) una versión inmutable que un
+    hilo lector puede recorrer sin locks mientras otro hilo escribe (con un
+    solo escritor a la vez).
+    
+    Cada escritura persistente marca los nodos que crea con su propia
+    versión: un nodo ya copiado en esta escritura (p. ej. del camino, antes
+    de una rotación) se modifica directamente en lugar de copiarse otra vez.
+    """
+    
+    def __init__(self, persistente=False):
         self.raiz = None
+        self.persistente = persistente
+        self._version = object() if persistente else None
+    
+    def _nueva_version(self):
+        """Empieza una escritura: ningún nodo existente le pertenece."""
+        if self.persistente:
+            self._version = object()
+    
+    def _nuevo_nodo(self, valor):
+        nodo = NodoAVL(valor)
+        nodo.version = self._version
+        return nodo
+    
+    def _mutable(self, nodo):
+        """
+        Nodo que se puede modificar: el mismo en modo normal, una copia en
+        modo persistente (la versión vieja no se toca). Los nodos creados
+        en la escritura actual ya no son de ninguna versión publicada.
+        """
+        if not self.persistente or nodo is None or nodo.version is self._version:
+            return nodo
+        copia = NodoAVL.__new__(NodoAVL)
+        copia.valor = nodo.valor
+        copia.izquierdo = nodo.izquierdo
+        copia.derecho = nodo.derecho
+        copia.altura = nodo.altura
+        copia.tamano = nodo.tamano
+        copia.version = self._version
+        return copia
+    
+    def snapshot(self):
+        """
+        Versión actual como un AVL persistente independiente, en O(1).
+        Requiere modo persistente: en modo normal los nodos cambian en el
+        lugar y la "foto" no sería estable.
+        """
+        if not self.persistente:
+            raise ValueError("snapshot requiere AVL(persistente=True)")
+        self._nueva_version()  # Los nodos actuales pasan a ser compartidos
+        return self._con_raiz(self.raiz, persistente=True)
+    
+    def buscar(self, valor):
+        """Retorna True si el valor está en el árbol."""
+        nodo = self.raiz
+        while nodo:
+            if valor == nodo.valor:
+                return True
+            nodo = nodo.izquierdo if valor < nodo.valor else nodo.derecho
+        return False
     
     def altura(self, nodo):
         """Retorna la altura de un nodo (0 si es None)."""
@@ -19,10 +89,22 @@ class AVL:
             return 0
         return self.altura(nodo.izquierdo) - self.altura(nodo.derecho)
     
+    def tamano(self, nodo):
+        """Retorna el número de nodos del subárbol (0 si es None)."""
+        return nodo.tamano if nodo else 0
+    
     def actualizar_altura(self, nodo):
-        """Actualiza la altura de un nodo basándose en sus hijos."""
+        """
+        Actualiza la altura de un nodo basándose en sus hijos.
+        También actualiza su tamaño: las rotaciones ya llaman a este método
+        en el orden correcto (hijo primero), así que los tamaños quedan bien.
+        """
         nodo.altura = 1 + max(self.altura(nodo.izquierdo), 
                               self.altura(nodo.derecho))
+        nodo.tamano = 1 + self.tamano(nodo.izquierdo) + self.tamano(nodo.derecho)
+    
+    def __len__(self):
+        return self.tamano(self.raiz)
     
     def rotacion_derecha(self, z):
         """
@@ -35,7 +117,8 @@ class AVL:
          / \
         T1  T2
         """
-        y = z.izquierdo
+        z = self._mutable(z)
+        y = self._mutable(z.izquierdo)
         T3 = y.derecho
         
         # Realizar rotación
@@ -63,7 +146,8 @@ class AVL:
                / \
               T3  T4
         """
-        y = z.derecho
+        z = self._mutable(z)
+        y = self._mutable(z.derecho)
         T2 = y.izquierdo
         
         # Realizar rotación
@@ -78,19 +162,24 @@ class AVL:
     
     def insertar(self, valor):
         """Inserta un valor y rebalancea si es necesario."""
+        if self.persistente and self.buscar(valor):
+            return  # Evita copiar el camino para nada
+        self._nueva_version()
         self.raiz = self._insertar_recursivo(self.raiz, valor)
     
     def _insertar_recursivo(self, nodo, valor):
         # 1. Inserción BST normal
         if not nodo:
-            return NodoAVL(valor)
+            return self._nuevo_nodo(valor)
         
+        if valor == nodo.valor:
+            return nodo  # Sin duplicados
+        
+        nodo = self._mutable(nodo)
         if valor < nodo.valor:
             nodo.izquierdo = self._insertar_recursivo(nodo.izquierdo, valor)
-        elif valor > nodo.valor:
-            nodo.derecho = self._insertar_recursivo(nodo.derecho, valor)
         else:
-            return nodo  # Sin duplicados
+            nodo.derecho = self._insertar_recursivo(nodo.derecho, valor)
         
         # 2. Actualizar altura del nodo actual
         self.actualizar_altura(nodo)
@@ -120,18 +209,242 @@ class AVL:
         
         return nodo
     
+    def _rebalancear(self, nodo):
+        """
+        Aplica la rotación que corresponda según los factores de balance
+        (no según el valor insertado, que en eliminar/join no existe).
+        Asume que la altura de nodo ya está actualizada.
+        """
+        fb = self.factor_balance(nodo)
+        if fb > 1:
+            # Caso LR si el hijo izquierdo carga a la derecha
+            if self.factor_balance(nodo.izquierdo) < 0:
+                nodo.izquierdo = self.rotacion_izquierda(nodo.izquierdo)
+            return self.rotacion_derecha(nodo)
+        if fb < -1:
+            # Caso RL si el hijo derecho carga a la izquierda
+            if self.factor_balance(nodo.derecho) > 0:
+                nodo.derecho = self.rotacion_derecha(nodo.derecho)
+            return self.rotacion_izquierda(nodo)
+        return nodo
+    
+    def eliminar(self, valor):
+        """Elimina un valor (si existe) y rebalancea hacia arriba."""
+        if self.persistente and not self.buscar(valor):
+            return  # Evita copiar el camino para nada
+        self._nueva_version()
+        self.raiz = self._eliminar_recursivo(self.raiz, valor)
+    
+    def _eliminar_recursivo(self, nodo, valor):
+        if not nodo:
+            return None  # No estaba
+        
+        if valor < nodo.valor:
+            nodo = self._mutable(nodo)
+            nodo.izquierdo = self._eliminar_recursivo(nodo.izquierdo, valor)
+        elif valor > nodo.valor:
+            nodo = self._mutable(nodo)
+            nodo.derecho = self._eliminar_recursivo(nodo.derecho, valor)
+        else:
+            # Con a lo más un hijo, el hijo sube
+            if not nodo.izquierdo:
+                return nodo.derecho
+            if not nodo.derecho:
+                return nodo.izquierdo
+            # Dos hijos: el sucesor inorden toma su lugar
+            resto, sucesor = self._extraer_minimo(nodo.derecho)
+            sucesor = self._mutable(sucesor)
+            sucesor.izquierdo = nodo.izquierdo
+            sucesor.derecho = resto
+            nodo = sucesor
+        
+        self.actualizar_altura(nodo)
+        return self._rebalancear(nodo)
+    
+    def _extraer_minimo(self, nodo):
+        """Saca el nodo mínimo del subárbol: (nueva raíz, nodo mínimo)."""
+        if not nodo.izquierdo:
+            return nodo.derecho, nodo
+        nodo = self._mutable(nodo)
+        nodo.izquierdo, minimo = self._extraer_minimo(nodo.izquierdo)
+        self.actualizar_altura(nodo)
+        return self._rebalancear(nodo), minimo
+    
+    # Construcción en bloque, join y split
+    @classmethod
+    def _con_raiz(cls, raiz, persistente=False):
+        arbol = cls(persistente)
+        arbol.raiz = raiz
+        return arbol
+    
+    @classmethod
+    def from_sorted(cls, valores, persistente=False):
+        """
+        Construye el árbol en O(n) a partir de valores estrictamente
+        crecientes: la mediana de cada tramo es la raíz de su subárbol,
+        así que queda balanceado sin ninguna rotación.
+        """
+        valores = list(valores)
+        for a, b in zip(valores, valores[1:]):
+            if not a < b:
+                raise ValueError("from_sorted requiere valores estrictamente crecientes")
+        
+        arbol = cls(persistente)
+        
+        def construir(lo, hi):
+            if lo >= hi:
+                return None
+            medio = (lo + hi) // 2
+            nodo = NodoAVL(valores[medio])
+            nodo.izquierdo = construir(lo, medio)
+            nodo.derecho = construir(medio + 1, hi)
+            arbol.actualizar_altura(nodo)
+            return nodo
+        
+        arbol.raiz = construir(0, len(valores))
+        return arbol
+    
+    def _join(self, izq, nodo, der):
+        """
+        Une izq < nodo < der en un AVL. Baja por el lado del árbol más alto
+        hasta encontrar un subárbol de altura parecida al otro, cuelga ahí
+        a nodo y rebalancea de vuelta. O(|diferencia de alturas| + 1).
+        """
+        if self.altura(izq) > self.altura(der) + 1:
+            izq = self._mutable(izq)
+            izq.derecho = self._join(izq.derecho, nodo, der)
+            self.actualizar_altura(izq)
+            return self._rebalancear(izq)
+        if self.altura(der) > self.altura(izq) + 1:
+            der = self._mutable(der)
+            der.izquierdo = self._join(izq, nodo, der.izquierdo)
+            self.actualizar_altura(der)
+            return self._rebalancear(der)
+        nodo = self._mutable(nodo)
+        nodo.izquierdo, nodo.derecho = izq, der
+        self.actualizar_altura(nodo)
+        return nodo
+    
+    def join(self, otro):
+        """
+        Agrega todos los valores de otro, que deben ser mayores que los de
+        este árbol, en O(log n). otro queda vacío.
+        
+        Un árbol normal no puede absorber uno persistente: sus nodos son
+        compartidos con snapshots y este árbol los modificaría en el lugar.
+        Al revés sí se puede (los nodos de otro dejan de tener dueño).
+        """
+        if otro.persistente and not self.persistente:
+            raise ValueError("join de un AVL persistente requiere AVL(persistente=True)")
+        if not otro.raiz:
+            return
+        if not self.raiz:
+            self.raiz, otro.raiz = otro.raiz, None
+            return
+        maximo = self.raiz
+        while maximo.derecho:
+            maximo = maximo.derecho
+        minimo = otro.raiz
+        while minimo.izquierdo:
+            minimo = minimo.izquierdo
+        # Validar antes de tocar nada: si falla, ambos árboles quedan intactos
+        if not maximo.valor < minimo.valor:
+            raise ValueError("join requiere que todos los valores de otro sean mayores")
+        self._nueva_version()
+        resto, medio = self._extraer_minimo(otro.raiz)
+        otro.raiz = None
+        self.raiz = self._join(self.raiz, medio, resto)
+    
+    def _split(self, nodo, valor):
+        if not nodo:
+            return None, None
+        izq, der = nodo.izquierdo, nodo.derecho
+        if valor <= nodo.valor:
+            menores, mayores = self._split(izq, valor)
+            return menores, self._join(mayores, nodo, der)
+        menores, mayores = self._split(der, valor)
+        return self._join(izq, nodo, menores), mayores
+    
+    def split(self, valor):
+        """
+        Parte el árbol en (valores < valor, valores >= valor) en O(log n).
+        Los nodos pasan a los dos árboles nuevos: este queda vacío.
+        """
+        self._nueva_version()
+        menores, mayores = self._split(self.raiz, valor)
+        self.raiz = None
+        return (self._con_raiz(menores, self.persistente),
+                self._con_raiz(mayores, self.persistente))
+    
     def inorden(self):
-        """Recorrido inorden."""
+        """Recorrido inorden: lista de (valor, factor de balance)."""
+        return [(nodo.valor, self.factor_balance(nodo))
+                for nodo in self._nodos_inorden(self.raiz)]
+    
+    # Estadísticos de orden y rangos (usan el tamaño de cada subárbol)
+    def rank(self, valor):
+        """Cuántos valores del árbol son menores que valor. O(log n)."""
+        cuenta = 0
+        nodo = self.raiz
+        while nodo:
+            if valor <= nodo.valor:
+                nodo = nodo.izquierdo
+            else:
+                cuenta += self.tamano(nodo.izquierdo) + 1
+                nodo = nodo.derecho
+        return cuenta
+    
+    def select(self, k):
+        """
+        El k-ésimo menor valor (k desde 0; negativos cuentan desde el final).
+        O(log n). Lanza IndexError si k está fuera de rango.
+        """
+        n = len(self)
+        if k < 0:
+            k += n
+        if not 0 <= k < n:
+            raise IndexError("k fuera de rango")
+        nodo = self.raiz
+        while True:
+            izq = self.tamano(nodo.izquierdo)
+            if k < izq:
+                nodo = nodo.izquierdo
+            elif k == izq:
+                return nodo.valor
+            else:
+                k -= izq + 1
+                nodo = nodo.derecho
+    
+    def count_range(self, lo, hi):
+        """Cuántos valores v cumplen lo <= v < hi. O(log n)."""
+        return max(0, self.rank(hi) - self.rank(lo))
+    
+    def range(self, lo, hi):
+        """
+        Valores v con lo <= v < hi, en orden. O(log n + k) para k
+        resultados: solo se bajan las ramas que pueden tener valores
+        dentro del intervalo.
+        """
         resultado = []
-        self._inorden(self.raiz, resultado)
+        pila = []
+        nodo = self.raiz
+        while pila or nodo:
+            # Bajar a la izquierda solo mientras pueda haber valores >= lo
+            while nodo:
+                if nodo.valor >= lo:
+                    pila.append(nodo)
+                    nodo = nodo.izquierdo
+                else:
+                    nodo = nodo.derecho
+            if not pila:
+                break
+            nodo = pila.pop()
+            if nodo.valor >= hi:
+                break  # Todo lo que queda en la pila es mayor
+            resultado.append(nodo.valor)
+            nodo = nodo.derecho
         return resultado
     
-    def _inorden(self, nodo, resultado):
-        if nodo:
-            self._inorden(nodo.izquierdo, resultado)
-            resultado.append((nodo.valor, self.factor_balance(nodo)))
-            self._inorden(nodo.derecho, resultado)
-    
     def mostrar_estructura(self):
         """Muestra la estructura del árbol con factores de balance."""
         def _mostrar(nodo, nivel=0, prefijo="Raíz: "):
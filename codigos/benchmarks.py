@@ -0,0 +1,115 @@
+"""
+Benchmarks de las estructuras del proyecto.
+
+Uso:
+    python benchmarks.py            # corre todos
+    python benchmarks.py colas      # solo el de colas de prioridad
+    python benchmarks.py arboles    # AVL contra arbol B+
+"""
+import random
+import string
+import sys
+import time
+import tracemalloc
+
+from WeightedGraph import WeightedGraph
+from avl import AVL
+from bplus_tree import BPlusTree
+from huffman import Huffman
+from mst import GraphMST
+from priority_queues import COLAS, make_queue
+
+
+def _cronometrar(funcion):
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+
+def bench_colas(n=20000, grado=8, max_peso=100, semilla=0):
+    """
+    Compara las colas de priority_queues.py en Dijkstra, Prim y Huffman.
+    Reporta tiempo, total de pushes y tamano maximo de la cola. "heapq" es
+    el codigo original (sin contadores).
+    """
+    rnd = random.Random(semilla)
+    g = WeightedGraph(n)
+    mst = GraphMST(n)
+    for u in range(n):
+        for _ in range(grado):
+            v, w = rnd.randrange(n), rnd.randint(1, max_peso)
+            g.add_edge(u, v, w)
+            mst.add_edge(u, v, w)
+    texto = ''.join(rnd.choices(string.printable, k=200000))
+
+    print(f"\nColas de prioridad: n={n}, m={n * grado}, pesos 1..{max_peso}")
+    print(f"{'cola':<10}{'algoritmo':<10}{'tiempo (s)':>12}{'pushes':>10}{'max_size':>10}")
+    for nombre in ["heapq"] + list(COLAS):
+        casos = [
+            ("dijkstra", lambda q: g.dijkstra(0, queue=q)),
+            ("prim", lambda q: mst.prim_mst(0, queue=q)),
+            ("huffman", lambda q: Huffman().construir_arbol(texto, queue=q)),
+        ]
+        for algoritmo, correr in casos:
+            cola = nombre if nombre == "heapq" else make_queue(nombre)
+            t = _cronometrar(lambda: correr(cola))
+            pushes = "-" if nombre == "heapq" else cola.pushes
+            max_size = "-" if nombre == "heapq" else cola.max_size
+            print(f"{nombre:<10}{algoritmo:<10}{t:>12.4f}{pushes:>10}{max_size:>10}")
+
+
+def _construir(crear, claves):
+    arbol = crear()
+    for c in claves:
+        arbol.insertar(c)
+    return arbol
+
+
+def _memoria(crear, claves):
+    """Bytes que quedan asignados al construir la estructura (con tracemalloc)."""
+    tracemalloc.start()
+    arbol = _construir(crear, claves)
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del arbol
+    return memoria
+
+
+def bench_arboles(n=200000, consultas=100000, rangos=1000, ancho=1000, semilla=0):
+    """
+    Compara AVL con BPlusTree (bloques en lista y en array('q')): tiempo de
+    construccion, memoria, busquedas puntuales y rangos [lo, lo + ancho).
+    La memoria se mide en una construccion aparte para no inflar los tiempos.
+    """
+    rnd = random.Random(semilla)
+    claves = rnd.sample(range(n * 10), n)
+    buscadas = [rnd.randrange(n * 10) for _ in range(consultas)]
+    inicios = [rnd.randrange(n * 10) for _ in range(rangos)]
+
+    print(f"\nArboles: n={n}, {consultas} busquedas, {rangos} rangos de ancho {ancho}")
+    print(f"{'estructura':<16}{'insertar (s)':>14}{'MB':>8}{'buscar (s)':>12}{'rangos (s)':>12}")
+    casos = [
+        ("AVL", AVL),
+        ("B+ lista", lambda: BPlusTree(orden=64)),
+        ("B+ array('q')", lambda: BPlusTree(orden=64, typecode='q')),
+    ]
+    for nombre, crear in casos:
+        inicio = time.perf_counter()
+        arbol = _construir(crear, claves)
+        t_insertar = time.perf_counter() - inicio
+        memoria = _memoria(crear, claves)
+        t_buscar = _cronometrar(lambda: [arbol.buscar(v) for v in buscadas])
+        t_rangos = _cronometrar(lambda: [arbol.range(lo, lo + ancho) for lo in inicios])
+        print(f"{nombre:<16}{t_insertar:>14.3f}{memoria / 2**20:>8.1f}{t_buscar:>12.3f}{t_rangos:>12.3f}")
+
+
+BENCHMARKS = {
+    "colas": bench_colas,
+    "arboles": bench_arboles,
+}
+
+
+if __name__ == "__main__":
+    elegidos = sys.argv[1:] or list(BENCHMARKS)
+    for nombre in elegidos:
+        BENCHMARKS[nombre]()
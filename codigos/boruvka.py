@@ -0,0 +1,149 @@
+"""
+MST de Boruvka vectorizado con NumPy.
+
+Cada ronda, cada componente elige su arista saliente mas barata y todas esas
+aristas se agregan a la vez; el numero de componentes al menos se divide a
+la mitad por ronda, asi que son O(log V) rondas. La eleccion se hace sobre
+arreglos de aristas (u, v, w) con np.minimum.at, sin ordenar todas las
+aristas como Kruskal. Los empates se rompen por indice de arista, de modo
+que las elecciones nunca forman ciclo.
+
+Las componentes se unen con el Union-Find de union_find.py y las aristas
+internas se descartan al final de cada ronda, asi que las rondas siguientes
+trabajan sobre arreglos cada vez mas chicos.
+
+Con workers > 1 y suficientes aristas, las aristas se ponen una vez en
+memoria compartida y cada proceso calcula los minimos de un tramo; el
+proceso principal combina los minimos parciales. Tambien ahi las internas
+se descartan: al final de cada ronda el principal compacta las aristas
+vivas al inicio de los arreglos compartidos y vuelve a cortar los tramos.
+"""
+import numpy as np
+
+from shared_arrays import arreglos_trabajador, compartir, crear_pool, liberar
+from union_find import UnionFind
+
+_SIN_ARISTA = np.iinfo(np.int64).max
+
+
+def _minimos(u, v, w, ids, comp, n):
+    """
+    Arista saliente mas barata de cada componente: (peso, id) en arreglos
+    indexados por etiqueta de componente (inf / _SIN_ARISTA si no tiene).
+    Tambien retorna la mascara de aristas que siguen cruzando componentes.
+    """
+    cu, cv = comp[u], comp[v]
+    cruza = cu != cv
+    lados = np.concatenate((cu[cruza], cv[cruza]))
+    pesos = np.concatenate((w[cruza], w[cruza]))
+    aristas = np.concatenate((ids[cruza], ids[cruza]))
+
+    mejor_w = np.full(n, np.inf)
+    np.minimum.at(mejor_w, lados, pesos)
+    empate = pesos == mejor_w[lados]
+    mejor_id = np.full(n, _SIN_ARISTA, dtype=np.int64)
+    np.minimum.at(mejor_id, lados[empate], aristas[empate])
+    return mejor_w, mejor_id, cruza
+
+
+def _combinar(parciales):
+    """Combina minimos (peso, id) de varios tramos; gana el menor (peso, id)."""
+    mejor_w, mejor_id = parciales[0]
+    mejor_w, mejor_id = mejor_w.copy(), mejor_id.copy()
+    for w, i in parciales[1:]:
+        gana = (w < mejor_w) | ((w == mejor_w) & (i < mejor_id))
+        mejor_w[gana] = w[gana]
+        mejor_id[gana] = i[gana]
+    return mejor_w, mejor_id
+
+
+# --- Trabajadores con memoria compartida ---------------------------------
+
+def _minimos_trabajador(inicio, fin):
+    u, v, w, ids, comp = arreglos_trabajador()
+    mejor_w, mejor_id, _ = _minimos(u[inicio:fin], v[inicio:fin], w[inicio:fin],
+                                    ids[inicio:fin], comp, len(comp))
+    return mejor_w, mejor_id
+
+
+def _tramos(vivas, workers):
+    cortes = np.linspace(0, vivas, workers + 1, dtype=np.int64)
+    return [(int(a), int(b)) for a, b in zip(cortes, cortes[1:]) if a < b]
+
+
+# --- Algoritmo -------------------------------------------------------------
+
+def boruvka_mst(graph, workers: int = 1, parallel_threshold: int = 1000000):
+    """
+    MST (o bosque generador minimo si el grafo no es conexo) de un GraphMST.
+    Retorna (mst_edges, mst_cost) con el mismo formato que kruskal_mst;
+    el costo coincide con el de Kruskal.
+
+    workers: procesos para elegir los minimos (1 = todo en linea).
+    parallel_threshold: numero minimo de aristas para usar procesos.
+    """
+    n, edges = graph.V, graph.edges
+    m = len(edges)
+    if m == 0:
+        return [], 0
+
+    U = np.fromiter((e[0] for e in edges), dtype=np.int64, count=m)
+    V = np.fromiter((e[1] for e in edges), dtype=np.int64, count=m)
+    W = np.fromiter((e[2] for e in edges), dtype=np.float64, count=m)
+    if ((U < 0) | (U >= n) | (V < 0) | (V >= n)).any():
+        raise IndexError("Nodo fuera de rango")
+
+    comp = np.arange(n, dtype=np.int64)  # Etiqueta = raiz de su componente
+    uf = UnionFind(n)
+    mst_edges, mst_cost = [], 0
+
+    # Aristas vivas (las que aun cruzan componentes)
+    u, v, w, ids = U, V, W, np.arange(m, dtype=np.int64)
+
+    bloques, pool = [], None
+    if workers > 1 and m >= parallel_threshold:
+        # Las vivas ocupan el prefijo [0, vivas) de los arreglos compartidos
+        (u, v, w, ids, comp), bloques, descriptores = compartir((u, v, w, ids, comp))
+        pool = crear_pool(workers, descriptores)
+        vivas = m
+
+    try:
+        while len(mst_edges) < n - 1:
+            if pool is None:
+                mejor_w, mejor_id, cruza = _minimos(u, v, w, ids, comp, n)
+                u, v, w, ids = u[cruza], v[cruza], w[cruza], ids[cruza]
+            else:
+                inicios, fines = zip(*_tramos(vivas, workers))
+                mejor_w, mejor_id = _combinar(list(pool.map(_minimos_trabajador, inicios, fines)))
+
+            elegidas = np.unique(mejor_id[mejor_id != _SIN_ARISTA])
+            if elegidas.size == 0:
+                break  # Bosque: ya no hay aristas entre componentes
+
+            for e in elegidas.tolist():
+                a, b, peso = edges[e]
+                if uf.union(a, b):  # Dos componentes pueden elegir la misma arista
+                    mst_edges.append((a, b, peso))
+                    mst_cost += peso
+
+            # Reetiquetar: cada raiz vieja apunta a la raiz de su nueva componente
+            raices = np.unique(comp)
+            nueva = np.arange(n, dtype=np.int64)
+            nueva[raices] = uf.find_many(raices.tolist())
+            comp[:] = nueva[comp]
+
+            if pool is not None:
+                # Compactar en el lugar: el indexado con mascara ya copia
+                cruza = comp[u[:vivas]] != comp[v[:vivas]]
+                vivas = int(cruza.sum())
+                for arreglo in (u, v, w, ids):
+                    arreglo[:vivas] = arreglo[:cruza.size][cruza]
+                if vivas == 0:
+                    break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+            U = V = W = comp = u = v = w = ids = None
+        liberar(bloques)
+
+    return mst_edges, mst_cost
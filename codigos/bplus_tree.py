@@ -0,0 +1,247 @@
+"""
+Árbol B+ en memoria, con la misma interfaz que BST (insertar, buscar,
+eliminar, inorden, minimo, maximo) y también sin duplicados.
+
+- Cada nodo guarda hasta `orden` claves contiguas en un bloque (lista, o
+  array del typecode indicado para claves numéricas: 8 bytes por clave en
+  lugar de un objeto nodo de ~100 bytes por clave).
+- Las búsquedas dentro de un bloque son bisect (búsqueda binaria en C), y
+  la altura es log_{orden/2}(n): con orden=64 un millón de claves caben en
+  4 niveles.
+- Todas las claves están en las hojas, que están enlazadas en orden: un
+  recorrido o un rango avanza hoja por hoja sin volver a subir.
+
+Nodos internos: `claves[i]` es la menor clave posible del hijo i + 1. Todo
+es iterativo (una pila con el camino desde la raíz).
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class _Hoja:
+    __slots__ = ("claves", "siguiente")
+
+    def __init__(self, claves):
+        self.claves = claves
+        self.siguiente = None
+
+
+class _Interno:
+    __slots__ = ("claves", "hijos")
+
+    def __init__(self, claves, hijos):
+        self.claves = claves
+        self.hijos = hijos
+
+
+class BPlusTree:
+    """
+    orden: máximo de claves por hoja y de hijos por nodo interno (>= 3).
+    typecode: si se da (p. ej. 'q' o 'd'), los bloques de claves son
+    array(typecode) en lugar de listas.
+    """
+
+    def __init__(self, orden=64, typecode=None):
+        if orden < 3:
+            raise ValueError("orden debe ser al menos 3")
+        self.orden = orden
+        self.typecode = typecode
+        self.raiz = _Hoja(self._bloque())
+        self.tamano = 0
+        self._min_hoja = orden // 2               # Claves mínimas por hoja
+        self._min_interno = (orden + 1) // 2 - 1  # Claves mínimas por interno
+
+    def _bloque(self, valores=()):
+        if self.typecode is None:
+            return list(valores)
+        return array(self.typecode, valores)
+
+    def __len__(self):
+        return self.tamano
+
+    def _camino(self, valor):
+        """Baja hasta la hoja de valor; retorna (hoja, [(interno, índice del hijo)])."""
+        camino = []
+        nodo = self.raiz
+        while isinstance(nodo, _Interno):
+            i = bisect_right(nodo.claves, valor)
+            camino.append((nodo, i))
+            nodo = nodo.hijos[i]
+        return nodo, camino
+
+    def buscar(self, valor):
+        """Retorna True si el valor está en el árbol."""
+        nodo = self.raiz
+        while isinstance(nodo, _Interno):
+            nodo = nodo.hijos[bisect_right(nodo.claves, valor)]
+        claves = nodo.claves
+        i = bisect_left(claves, valor)
+        return i < len(claves) and claves[i] == valor
+
+    def insertar(self, valor):
+        """Inserta un valor; si el bloque se llena se parte en dos."""
+        hoja, camino = self._camino(valor)
+        claves = hoja.claves
+        i = bisect_left(claves, valor)
+        if i < len(claves) and claves[i] == valor:
+            return  # Sin duplicados
+        claves.insert(i, valor)
+        self.tamano += 1
+        if len(claves) <= self.orden:
+            return
+
+        # Partir la hoja: la mitad derecha pasa a una hoja nueva enlazada
+        medio = len(claves) // 2
+        nueva = _Hoja(claves[medio:])
+        del claves[medio:]
+        nueva.siguiente = hoja.siguiente
+        hoja.siguiente = nueva
+        separador, derecho = nueva.claves[0], nueva
+
+        # Subir el separador; los internos llenos también se parten
+        while camino:
+            padre, i = camino.pop()
+            padre.claves.insert(i, separador)
+            padre.hijos.insert(i + 1, derecho)
+            if len(padre.hijos) <= self.orden:
+                return
+            medio = len(padre.claves) // 2
+            separador = padre.claves[medio]
+            derecho = _Interno(padre.claves[medio + 1:], padre.hijos[medio + 1:])
+            del padre.claves[medio:]
+            del padre.hijos[medio + 1:]
+
+        # Se partió la raíz: el árbol crece un nivel
+        self.raiz = _Interno(self._bloque([separador]), [self.raiz, derecho])
+
+    def eliminar(self, valor):
+        """
+        Elimina un valor (si existe). Un bloque que queda bajo el mínimo
+        pide una clave prestada a un hermano o se fusiona con él.
+        """
+        hoja, camino = self._camino(valor)
+        claves = hoja.claves
+        i = bisect_left(claves, valor)
+        if i == len(claves) or claves[i] != valor:
+            return
+        del claves[i]
+        self.tamano -= 1
+
+        nodo = hoja
+        while camino:
+            minimo = self._min_hoja if nodo is hoja else self._min_interno
+            if len(nodo.claves) >= minimo:
+                return
+            padre, i = camino.pop()
+            izq = padre.hijos[i - 1] if i > 0 else None
+            der = padre.hijos[i + 1] if i + 1 < len(padre.hijos) else None
+            if nodo is hoja:
+                self._arreglar_hoja(nodo, padre, i, izq, der)
+            else:
+                self._arreglar_interno(nodo, padre, i, izq, der)
+            nodo = padre
+
+        # Raíz interna sin claves: el árbol baja un nivel
+        if isinstance(self.raiz, _Interno) and not self.raiz.claves:
+            self.raiz = self.raiz.hijos[0]
+
+    def _arreglar_hoja(self, hoja, padre, i, izq, der):
+        if izq is not None and len(izq.claves) > self._min_hoja:
+            hoja.claves.insert(0, izq.claves.pop())
+            padre.claves[i - 1] = hoja.claves[0]
+        elif der is not None and len(der.claves) > self._min_hoja:
+            hoja.claves.append(der.claves.pop(0))
+            padre.claves[i] = der.claves[0]
+        elif izq is not None:
+            izq.claves.extend(hoja.claves)
+            izq.siguiente = hoja.siguiente
+            del padre.claves[i - 1]
+            del padre.hijos[i]
+        else:
+            hoja.claves.extend(der.claves)
+            hoja.siguiente = der.siguiente
+            del padre.claves[i]
+            del padre.hijos[i + 1]
+
+    def _arreglar_interno(self, nodo, padre, i, izq, der):
+        # El separador del padre baja y la clave del hermano sube
+        if izq is not None and len(izq.claves) > self._min_interno:
+            nodo.claves.insert(0, padre.claves[i - 1])
+            nodo.hijos.insert(0, izq.hijos.pop())
+            padre.claves[i - 1] = izq.claves.pop()
+        elif der is not None and len(der.claves) > self._min_interno:
+            nodo.claves.append(padre.claves[i])
+            nodo.hijos.append(der.hijos.pop(0))
+            padre.claves[i] = der.claves.pop(0)
+        elif izq is not None:
+            izq.claves.append(padre.claves[i - 1])
+            izq.claves.extend(nodo.claves)
+            izq.hijos.extend(nodo.hijos)
+            del padre.claves[i - 1]
+            del padre.hijos[i]
+        else:
+            nodo.claves.append(padre.claves[i])
+            nodo.claves.extend(der.claves)
+            nodo.hijos.extend(der.hijos)
+            del padre.claves[i]
+            del padre.hijos[i + 1]
+
+    # Recorridos por las hojas enlazadas
+    def _primera_hoja(self):
+        nodo = self.raiz
+        while isinstance(nodo, _Interno):
+            nodo = nodo.hijos[0]
+        return nodo
+
+    def __iter__(self):
+        hoja = self._primera_hoja()
+        while hoja is not None:
+            yield from hoja.claves
+            hoja = hoja.siguiente
+
+    def iter_from(self, valor):
+        """Itera en orden desde el primer valor >= valor."""
+        hoja, _ = self._camino(valor)
+        i = bisect_left(hoja.claves, valor)
+        while hoja is not None:
+            for j in range(i, len(hoja.claves)):
+                yield hoja.claves[j]
+            hoja, i = hoja.siguiente, 0
+
+    def range(self, lo, hi):
+        """Valores v con lo <= v < hi, en orden."""
+        resultado = []
+        hoja, _ = self._camino(lo)
+        i = bisect_left(hoja.claves, lo)
+        while hoja is not None:
+            claves = hoja.claves
+            j = bisect_left(claves, hi)
+            resultado.extend(claves[i:j])
+            if j < len(claves):
+                break
+            hoja, i = hoja.siguiente, 0
+        return resultado
+
+    def inorden(self):
+        """Recorrido inorden (produce elementos ordenados)."""
+        return list(self)
+
+    def minimo(self):
+        """Encuentra el valor mínimo."""
+        claves = self._primera_hoja().claves
+        return claves[0] if claves else None
+
+    def maximo(self):
+        """Encuentra el valor máximo."""
+        nodo = self.raiz
+        while isinstance(nodo, _Interno):
+            nodo = nodo.hijos[-1]
+        return nodo.claves[-1] if nodo.claves else None
+
+    def altura(self):
+        """Número de niveles (1 si la raíz es una hoja)."""
+        altura, nodo = 1, self.raiz
+        while isinstance(nodo, _Interno):
+            altura += 1
+            nodo = nodo.hijos[0]
+        return altura
@@ -1,10 +1,18 @@
+import math
+
+from tree_iter import RecorridoEnOrden
+
+
 class NodoBST:
+    # __slots__: sin __dict__ por nodo (menos memoria en indices grandes)
+    __slots__ = ("valor", "izquierdo", "derecho")
+
     def __init__(self, valor):
         self.valor = valor
         self.izquierdo = None
         self.derecho = None
 
-class BST:
+class BST(RecorridoEnOrden):
     """
     Árbol Binario de Búsqueda.
     
@@ -12,88 +20,178 @@ class BST:
     Para permitir duplicados, se podría:
     - Agregar un contador en cada nodo
     - Insertar duplicados sistemáticamente a la izquierda o derecha
+    
+    Todas las operaciones son iterativas: un arbol degenerado (claves
+    insertadas en orden) ya no agota el limite de recursion.
+    
+    Con scapegoat=True el arbol se rebalancea solo (scapegoat tree): si una
+    insercion queda a profundidad mayor que log_{1/alpha}(n), se busca hacia
+    arriba el primer ancestro desbalanceado (tamano de un hijo > alpha *
+    tamano del nodo) y se reconstruye su subarbol perfectamente balanceado.
+    Tras eliminar, si n cae bajo alpha * (maximo n desde la ultima
+    reconstruccion) se reconstruye el arbol completo. La profundidad queda
+    en O(log n) y el costo amortizado por operacion en O(log n).
     """
     
-    def __init__(self):
+    def __init__(self, scapegoat=False, alpha=0.7):
+        if not 0.5 < alpha < 1:
+            raise ValueError("alpha debe estar en (0.5, 1)")
         self.raiz = None
+        self.tamano = 0
+        self.scapegoat = scapegoat
+        self.alpha = alpha
+        self._max_tamano = 0  # Para decidir la reconstruccion tras eliminar
+    
+    def __len__(self):
+        return self.tamano
     
     def insertar(self, valor):
         """Inserta un valor en el BST."""
-        if not self.raiz:
+        if self.raiz is None:
             self.raiz = NodoBST(valor)
-        else:
-            self._insertar_recursivo(self.raiz, valor)
-    
-    def _insertar_recursivo(self, nodo, valor):
-        if valor < nodo.valor:
-            if nodo.izquierdo is None:
-                nodo.izquierdo = NodoBST(valor)
+            self.tamano = self._max_tamano = 1
+            return
+        
+        camino = []  # Ancestros del nuevo nodo, de la raiz hacia abajo
+        nodo = self.raiz
+        while True:
+            camino.append(nodo)
+            if valor < nodo.valor:
+                if nodo.izquierdo is None:
+                    nodo.izquierdo = NodoBST(valor)
+                    break
+                nodo = nodo.izquierdo
+            elif valor > nodo.valor:
+                if nodo.derecho is None:
+                    nodo.derecho = NodoBST(valor)
+                    break
+                nodo = nodo.derecho
             else:
-                self._insertar_recursivo(nodo.izquierdo, valor)
-        elif valor > nodo.valor:
-            if nodo.derecho is None:
-                nodo.derecho = NodoBST(valor)
+                return  # Si valor == nodo.valor, no insertamos (sin duplicados)
+        
+        self.tamano += 1
+        self._max_tamano = max(self._max_tamano, self.tamano)
+        if self.scapegoat and len(camino) > self._altura_permitida(self.tamano):
+            nuevo = camino[-1].izquierdo if valor < camino[-1].valor else camino[-1].derecho
+            self._reconstruir_scapegoat(camino, nuevo)
+    
+    def _altura_permitida(self, n):
+        return math.floor(math.log(n) / math.log(1 / self.alpha))
+    
+    def _reconstruir_scapegoat(self, camino, nuevo):
+        """Sube por el camino hasta el primer nodo desbalanceado y lo reconstruye."""
+        hijo, tam_hijo = nuevo, 1
+        for i in range(len(camino) - 1, -1, -1):
+            nodo = camino[i]
+            hermano = nodo.derecho if nodo.izquierdo is hijo else nodo.izquierdo
+            tam = tam_hijo + 1 + self._contar(hermano)
+            if tam_hijo > self.alpha * tam:
+                nuevo_sub = self._balancear(nodo)
+                if i == 0:
+                    self.raiz = nuevo_sub
+                elif camino[i - 1].izquierdo is nodo:
+                    camino[i - 1].izquierdo = nuevo_sub
+                else:
+                    camino[i - 1].derecho = nuevo_sub
+                return
+            hijo, tam_hijo = nodo, tam
+    
+    @staticmethod
+    def _contar(nodo):
+        """Numero de nodos del subarbol (iterativo)."""
+        total = 0
+        pila = [nodo] if nodo is not None else []
+        while pila:
+            actual = pila.pop()
+            total += 1
+            if actual.izquierdo is not None:
+                pila.append(actual.izquierdo)
+            if actual.derecho is not None:
+                pila.append(actual.derecho)
+        return total
+    
+    def _balancear(self, nodo):
+        """
+        Reconstruye el subarbol de nodo perfectamente balanceado, reusando
+        los mismos objetos nodo. Retorna la nueva raiz del subarbol.
+        """
+        nodos = list(self._nodos_inorden(nodo))
+        if not nodos:
+            return None
+        # Cada tarea: (lo, hi, padre, es_izquierdo) sobre nodos[lo:hi]
+        medio = (len(nodos) - 1) // 2
+        raiz = nodos[medio]
+        raiz.izquierdo = raiz.derecho = None
+        pila = [(0, medio, raiz, True), (medio + 1, len(nodos), raiz, False)]
+        while pila:
+            lo, hi, padre, izquierdo = pila.pop()
+            if lo >= hi:
+                continue
+            medio = (lo + hi - 1) // 2
+            actual = nodos[medio]
+            actual.izquierdo = actual.derecho = None
+            if izquierdo:
+                padre.izquierdo = actual
             else:
-                self._insertar_recursivo(nodo.derecho, valor)
-        # Si valor == nodo.valor, no insertamos (sin duplicados)
+                padre.derecho = actual
+            pila.append((lo, medio, actual, True))
+            pila.append((medio + 1, hi, actual, False))
+        return raiz
+    
+    def rebalancear(self):
+        """Reconstruye todo el arbol perfectamente balanceado (O(n))."""
+        self.raiz = self._balancear(self.raiz)
+        self._max_tamano = self.tamano
     
     def buscar(self, valor):
         """Busca un valor en el BST. Retorna True si existe."""
-        return self._buscar_recursivo(self.raiz, valor)
-    
-    def _buscar_recursivo(self, nodo, valor):
-        if nodo is None:
-            return False
-        if valor == nodo.valor:
-            return True
-        elif valor < nodo.valor:
-            return self._buscar_recursivo(nodo.izquierdo, valor)
-        else:
-            return self._buscar_recursivo(nodo.derecho, valor)
+        nodo = self.raiz
+        while nodo is not None:
+            if valor == nodo.valor:
+                return True
+            nodo = nodo.izquierdo if valor < nodo.valor else nodo.derecho
+        return False
     
     def eliminar(self, valor):
         """
         Elimina un valor del BST.
         Maneja los 3 casos: hoja, un hijo, dos hijos.
         """
-        self.raiz = self._eliminar_recursivo(self.raiz, valor)
-    
-    def _eliminar_recursivo(self, nodo, valor):
-        # Caso base: no encontramos el valor
+        # Buscar el nodo a eliminar y su padre
+        padre, nodo = None, self.raiz
+        while nodo is not None and valor != nodo.valor:
+            padre = nodo
+            nodo = nodo.izquierdo if valor < nodo.valor else nodo.derecho
+        
+        # No encontramos el valor
         if nodo is None:
-            return None
+            return
         
-        # Buscar el nodo a eliminar
-        if valor < nodo.valor:
-            nodo.izquierdo = self._eliminar_recursivo(nodo.izquierdo, valor)
-        elif valor > nodo.valor:
-            nodo.derecho = self._eliminar_recursivo(nodo.derecho, valor)
-        else:
-            # ¡Encontramos el nodo a eliminar!
-            
-            # CASO 1: Nodo hoja (sin hijos)
-            if nodo.izquierdo is None and nodo.derecho is None:
-                return None
-            
-            # CASO 2a: Solo tiene hijo derecho
-            if nodo.izquierdo is None:
-                return nodo.derecho
-            
-            # CASO 2b: Solo tiene hijo izquierdo
-            if nodo.derecho is None:
-                return nodo.izquierdo
-            
-            # CASO 3: Tiene dos hijos
+        # CASO 3: Tiene dos hijos
+        if nodo.izquierdo is not None and nodo.derecho is not None:
             # Encontrar el sucesor inorden (mínimo del subárbol derecho)
-            sucesor = self._encontrar_minimo(nodo.derecho)
+            padre_sucesor, sucesor = nodo, nodo.derecho
+            while sucesor.izquierdo is not None:
+                padre_sucesor, sucesor = sucesor, sucesor.izquierdo
             
             # Copiar el valor del sucesor al nodo actual
             nodo.valor = sucesor.valor
             
-            # Eliminar el sucesor del subárbol derecho
-            nodo.derecho = self._eliminar_recursivo(nodo.derecho, sucesor.valor)
+            # Eliminar el sucesor (no tiene hijo izquierdo): pasa a casos 1/2
+            padre, nodo = padre_sucesor, sucesor
+        
+        # CASOS 1 y 2: a lo mas un hijo, que sube a ocupar su lugar
+        hijo = nodo.izquierdo if nodo.izquierdo is not None else nodo.derecho
+        if padre is None:
+            self.raiz = hijo
+        elif padre.izquierdo is nodo:
+            padre.izquierdo = hijo
+        else:
+            padre.derecho = hijo
         
-        return nodo
+        self.tamano -= 1
+        if self.scapegoat and self.tamano < self.alpha * self._max_tamano:
+            self.rebalancear()
     
     def _encontrar_minimo(self, nodo):
         """Encuentra el nodo con valor mínimo (ir siempre a la izquierda)."""
@@ -104,39 +202,56 @@ class BST:
     
     def inorden(self):
         """Recorrido inorden (produce elementos ordenados)."""
-        resultado = []
-        self._inorden_recursivo(self.raiz, resultado)
-        return resultado
+        return list(self)
     
-    def _inorden_recursivo(self, nodo, resultado):
-        if nodo:
-            self._inorden_recursivo(nodo.izquierdo, resultado)
-            resultado.append(nodo.valor)
-            self._inorden_recursivo(nodo.derecho, resultado)
+    def iter_preorden(self):
+        """Recorrido preorden como generador."""
+        pila = [self.raiz] if self.raiz is not None else []
+        while pila:
+            nodo = pila.pop()
+            yield nodo.valor
+            # El derecho se apila primero para visitar antes el izquierdo
+            if nodo.derecho is not None:
+                pila.append(nodo.derecho)
+            if nodo.izquierdo is not None:
+                pila.append(nodo.izquierdo)
     
     def preorden(self):
         """Recorrido preorden."""
-        resultado = []
-        self._preorden_recursivo(self.raiz, resultado)
-        return resultado
+        return list(self.iter_preorden())
     
-    def _preorden_recursivo(self, nodo, resultado):
-        if nodo:
-            resultado.append(nodo.valor)
-            self._preorden_recursivo(nodo.izquierdo, resultado)
-            self._preorden_recursivo(nodo.derecho, resultado)
+    def iter_postorden(self):
+        """
+        Recorrido postorden como generador, con una sola pila de O(altura):
+        un nodo se emite cuando se vuelve a el desde su hijo derecho (o no
+        lo tiene).
+        """
+        pila = []
+        nodo, ultimo = self.raiz, None
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.izquierdo
+            tope = pila[-1]
+            if tope.derecho is not None and tope.derecho is not ultimo:
+                nodo = tope.derecho
+            else:
+                pila.pop()
+                yield tope.valor
+                ultimo = tope
     
     def postorden(self):
         """Recorrido postorden."""
-        resultado = []
-        self._postorden_recursivo(self.raiz, resultado)
-        return resultado
-    
-    def _postorden_recursivo(self, nodo, resultado):
-        if nodo:
-            self._postorden_recursivo(nodo.izquierdo, resultado)
-            self._postorden_recursivo(nodo.derecho, resultado)
-            resultado.append(nodo.valor)
+        return list(self.iter_postorden())
+    
+    def altura(self):
+        """Numero de niveles del arbol (0 si esta vacio)."""
+        altura = 0
+        nivel = [self.raiz] if self.raiz is not None else []
+        while nivel:
+            altura += 1
+            nivel = [h for n in nivel for h in (n.izquierdo, n.derecho) if h is not None]
+        return altura
     
     def minimo(self):
         """Encuentra el valor mínimo."""
@@ -0,0 +1,248 @@
+"""
+Contraction Hierarchies (CH) para consultas rapidas de rutas.
+
+Preproceso (offline): se contraen los nodos uno por uno en orden de
+"importancia". Al contraer v, por cada par u -> v -> x se agrega un atajo
+u -> x con peso w(u,v) + w(v,x), salvo que una busqueda local ("testigo")
+encuentre otro camino igual o mas corto que no pase por v.
+
+Consulta: Dijkstra bidireccional que solo sube de rango (hacia adelante desde
+el origen, hacia atras desde el destino). Explora una fraccion minima del
+grafo y devuelve exactamente las mismas distancias que Dijkstra. Los atajos
+guardan su nodo intermedio para poder desempacar el camino original.
+
+Requiere pesos no negativos.
+"""
+import heapq
+import json
+import math
+from typing import Dict, List, Tuple
+
+
+class ContractionHierarchy:
+    """
+    Jerarquia ya construida.
+    up[u]:   aristas u -> x con rank[x] > rank[u] (busqueda hacia adelante)
+    down[x]: pares (u, w) de aristas u -> x con rank[u] > rank[x]
+             (busqueda hacia atras desde el destino)
+    middle:  (u, x) -> nodo intermedio del atajo u -> x
+    """
+
+    def __init__(self, n: int, rank: List[int], up: List[List[Tuple[int, float]]],
+                 down: List[List[Tuple[int, float]]], middle: Dict[Tuple[int, int], int]):
+        self.n = n
+        self.rank = rank
+        self.up = up
+        self.down = down
+        self.middle = middle
+
+    # ------------------------------------------------------------------
+    # Preproceso
+    # ------------------------------------------------------------------
+    @classmethod
+    def build(cls, graph, max_settled: int = 500) -> "ContractionHierarchy":
+        """
+        Construye la jerarquia a partir de un WeightedGraph.
+        max_settled limita cada busqueda testigo; si se alcanza el limite se
+        agrega el atajo por si acaso (nunca da distancias incorrectas, solo
+        algun atajo de mas).
+        """
+        n = graph.n
+        # Grafo de trabajo: diccionarios para poder borrar/actualizar aristas
+        out_ = [dict() for _ in range(n)]
+        in_ = [dict() for _ in range(n)]
+        for u in range(n):
+            for v, w in graph.adj[u]:
+                if w < 0:
+                    raise ValueError("Contraction Hierarchies requiere pesos no negativos")
+                if u != v and w < out_[u].get(v, math.inf):
+                    out_[u][v] = w
+                    in_[v][u] = w
+
+        contraido = [False] * n
+        vecinos_contraidos = [0] * n
+        rank = [0] * n
+        up = [[] for _ in range(n)]
+        down = [[] for _ in range(n)]
+        middle = {}
+
+        def atajos_necesarios(v):
+            """Lista de atajos (u, x, w) que haria falta agregar al contraer v."""
+            atajos = []
+            for u, w1 in in_[v].items():
+                if not out_[v]:
+                    break
+                limite = w1 + max(out_[v].values())
+                testigo = cls._busqueda_testigo(out_, u, v, limite, max_settled)
+                for x, w2 in out_[v].items():
+                    if x == u:
+                        continue
+                    if testigo.get(x, math.inf) > w1 + w2:
+                        atajos.append((u, x, w1 + w2))
+            return atajos
+
+        def prioridad(v):
+            # Diferencia de aristas + vecinos ya contraidos (reparte la
+            # contraccion de manera uniforme por el grafo)
+            return (len(atajos_necesarios(v)) - len(in_[v]) - len(out_[v])
+                    + vecinos_contraidos[v])
+
+        pq = [(prioridad(v), v) for v in range(n)]
+        heapq.heapify(pq)
+        orden = 0
+
+        while pq:
+            _, v = heapq.heappop(pq)
+            if contraido[v]:
+                continue
+            # Actualizacion perezosa: si la prioridad cambio y ya no es la
+            # menor, se reinserta
+            p = prioridad(v)
+            if pq and p > pq[0][0]:
+                heapq.heappush(pq, (p, v))
+                continue
+
+            atajos = atajos_necesarios(v)
+            contraido[v] = True
+            rank[v] = orden
+            orden += 1
+
+            # Las aristas que le quedan a v van hacia nodos de mayor rango
+            for x, w in out_[v].items():
+                up[v].append((x, w))
+                del in_[x][v]
+                vecinos_contraidos[x] += 1
+            for u, w in in_[v].items():
+                down[v].append((u, w))
+                del out_[u][v]
+                vecinos_contraidos[u] += 1
+
+            for u, x, w in atajos:
+                if w < out_[u].get(x, math.inf):
+                    out_[u][x] = w
+                    in_[x][u] = w
+                    middle[(u, x)] = v
+
+        return cls(n, rank, up, down, middle)
+
+    @staticmethod
+    def _busqueda_testigo(out_, src, excluido, limite, max_settled):
+        """Dijkstra local desde src que no pasa por `excluido`."""
+        dist = {src: 0}
+        pq = [(0, src)]
+        settled = 0
+        while pq and settled < max_settled:
+            d, u = heapq.heappop(pq)
+            if d > dist[u]:
+                continue
+            if d > limite:
+                break
+            settled += 1
+            for v, w in out_[u].items():
+                if v == excluido:
+                    continue
+                nd = d + w
+                if nd < dist.get(v, math.inf):
+                    dist[v] = nd
+                    heapq.heappush(pq, (nd, v))
+        return dist
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+    def query(self, src: int, dst: int) -> Tuple[float, List[int]]:
+        """
+        Retorna (distancia, camino) de src a dst con el camino ya
+        desempacado a aristas del grafo original; (inf, []) si no hay ruta.
+        """
+        if not (0 <= src < self.n and 0 <= dst < self.n):
+            raise IndexError("Nodo fuera de rango")
+
+        adjs = (self.up, self.down)
+        dists = ({src: 0}, {dst: 0})
+        parents = ({src: -1}, {dst: -1})
+        pqs = ([(0, src)], [(0, dst)])
+        mejor, punto = (0, src) if src == dst else (math.inf, -1)
+
+        while pqs[0] or pqs[1]:
+            for lado in (0, 1):
+                pq = pqs[lado]
+                if not pq:
+                    continue
+                d, u = heapq.heappop(pq)
+                if d > dists[lado][u]:
+                    continue
+                # En CH no vale el criterio bidireccional clasico: cada
+                # frente para por su cuenta cuando ya no puede mejorar
+                if d >= mejor:
+                    pq.clear()
+                    continue
+                otro = dists[1 - lado]
+                if u in otro and d + otro[u] < mejor:
+                    mejor, punto = d + otro[u], u
+                for v, w in adjs[lado][u]:
+                    nd = d + w
+                    if nd < dists[lado].get(v, math.inf):
+                        dists[lado][v] = nd
+                        parents[lado][v] = u
+                        heapq.heappush(pq, (nd, v))
+
+        if punto == -1:
+            return math.inf, []
+
+        # Camino en el grafo con atajos: src -> punto -> dst
+        camino = [punto]
+        while parents[0][camino[-1]] != -1:
+            camino.append(parents[0][camino[-1]])
+        camino.reverse()
+        nodo = parents[1][punto]
+        while nodo != -1:
+            camino.append(nodo)
+            nodo = parents[1][nodo]
+
+        return mejor, self._desempacar(camino)
+
+    def distance(self, src: int, dst: int) -> float:
+        """Solo la distancia (sin desempacar el camino)."""
+        return self.query(src, dst)[0]
+
+    def _desempacar(self, camino: List[int]) -> List[int]:
+        """Reemplaza cada atajo por el camino original que representa."""
+        resultado = [camino[0]]
+        for a, b in zip(camino, camino[1:]):
+            pila = [(a, b)]
+            while pila:
+                u, x = pila.pop()
+                m = self.middle.get((u, x))
+                if m is None:
+                    resultado.append(x)
+                else:
+                    # Se apila primero la segunda mitad para procesar u -> m antes
+                    pila.append((m, x))
+                    pila.append((u, m))
+        return resultado
+
+    # ------------------------------------------------------------------
+    # Archivo de jerarquia
+    # ------------------------------------------------------------------
+    def save(self, ruta: str):
+        """Guarda la jerarquia en un archivo JSON."""
+        datos = {
+            "n": self.n,
+            "rank": self.rank,
+            "up": self.up,
+            "down": self.down,
+            "middle": [[u, x, m] for (u, x), m in self.middle.items()],
+        }
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            json.dump(datos, archivo)
+
+    @classmethod
+    def load(cls, ruta: str) -> "ContractionHierarchy":
+        """Carga una jerarquia guardada con save()."""
+        with open(ruta, 'r', encoding='utf-8') as archivo:
+            datos = json.load(archivo)
+        up = [[(v, w) for v, w in aristas] for aristas in datos["up"]]
+        down = [[(u, w) for u, w in aristas] for aristas in datos["down"]]
+        middle = {(u, x): m for u, x, m in datos["middle"]}
+        return cls(datos["n"], datos["rank"], up, down, middle)
@@ -0,0 +1,155 @@
+import heapq
+import math
+from array import array
+from typing import Iterator, List, Tuple
+
+
+class CSRGraph:
+    """
+    Grafo ponderado dirigido congelado en formato CSR (compressed sparse row).
+
+    Las aristas salientes de u ocupan las posiciones offsets[u]..offsets[u+1]-1
+    de `targets` (destinos) y `weights` (pesos). Los tres buffers son `array`
+    de la libreria estandar, asi que cada arista cuesta 12 bytes en lugar de
+    una tupla (v, w) dentro de una lista. Tambien exponen el protocolo buffer,
+    por lo que se pueden ver como arreglos de NumPy sin copiar:
+        np.frombuffer(csr.targets, dtype=np.int32)
+
+    Es de solo lectura: para modificar el grafo hay que hacerlo en
+    WeightedGraph y volver a convertir con WeightedGraph.to_csr().
+    """
+
+    __slots__ = ("n", "m", "offsets", "targets", "weights")
+
+    def __init__(self, n: int, offsets: array, targets: array, weights: array):
+        if len(offsets) != n + 1:
+            raise ValueError("offsets debe tener n + 1 elementos")
+        if len(targets) != len(weights):
+            raise ValueError("targets y weights deben tener el mismo largo")
+        self.n = n
+        self.m = len(targets)
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_edges(cls, n: int, edges) -> "CSRGraph":
+        """
+        Construye el CSR a partir de una secuencia de aristas (u, v, w).
+        Usa counting sort por nodo origen: O(n + m).
+        """
+        edges = list(edges)
+        offsets = array('q', [0]) * (n + 1)
+        for u, _, _ in edges:
+            offsets[u + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        targets = array('i', [0]) * len(edges)
+        weights = array('d', [0.0]) * len(edges)
+        pos = array('q', offsets[:n])
+        for u, v, w in edges:
+            k = pos[u]
+            targets[k] = v
+            weights[k] = w
+            pos[u] = k + 1
+        return cls(n, offsets, targets, weights)
+
+    @classmethod
+    def from_weighted_graph(cls, graph) -> "CSRGraph":
+        """Convierte un WeightedGraph (dict de listas de (v, w)) a CSR."""
+        n = graph.n
+        offsets = array('q', [0]) * (n + 1)
+        targets = array('i')
+        weights = array('d')
+        for u in range(n):
+            for v, w in graph.adj[u]:
+                targets.append(v)
+                weights.append(w)
+            offsets[u + 1] = len(targets)
+        return cls(n, offsets, targets, weights)
+
+    def degree(self, u: int) -> int:
+        """Grado de salida de u."""
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def neighbors(self, u: int) -> Iterator[Tuple[int, float]]:
+        """Itera los pares (v, w) de las aristas salientes de u."""
+        ini, fin = self.offsets[u], self.offsets[u + 1]
+        return zip(self.targets[ini:fin], self.weights[ini:fin])
+
+    def edges(self) -> Iterator[Tuple[int, int, float]]:
+        """Itera todas las aristas (u, v, w) en orden de origen."""
+        for u in range(self.n):
+            for v, w in self.neighbors(u):
+                yield u, v, w
+
+    def reverse(self) -> "CSRGraph":
+        """Grafo transpuesto (todas las aristas invertidas), tambien en CSR."""
+        return CSRGraph.from_edges(self.n, ((v, u, w) for u, v, w in self.edges()))
+
+    def nbytes(self) -> int:
+        """Bytes ocupados por los tres buffers."""
+        return sum(buf.itemsize * len(buf)
+                   for buf in (self.offsets, self.targets, self.weights))
+
+    # Dijkstra
+    def dijkstra(self, src: int) -> Tuple[List[float], List[int]]:
+        """Mismo contrato que WeightedGraph.dijkstra, recorriendo los buffers."""
+        dist = [math.inf] * self.n
+        parent = [-1] * self.n
+        dist[src] = 0
+        pq = [(0, src)]
+        visited = [False] * self.n
+
+        # Referencias locales: evitan buscar atributos en el ciclo interno
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        while pq:
+            d, u = heappop(pq)
+            if visited[u]:
+                continue
+            visited[u] = True
+
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                nd = d + weights[i]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    heappush(pq, (nd, v))
+
+        return dist, parent
+
+    # Floyd-Warshall
+    def floyd_warshall(self) -> List[List[float]]:
+        """Mismo contrato que WeightedGraph.floyd_warshall."""
+        n = self.n
+        inf = math.inf
+        dist = [[inf] * n for _ in range(n)]
+        for i in range(n):
+            dist[i][i] = 0
+
+        # Con aristas paralelas nos quedamos con la mas barata
+        for u, v, w in self.edges():
+            if w < dist[u][v]:
+                dist[u][v] = w
+
+        for k in range(n):
+            row_k = dist[k]
+            for i in range(n):
+                row_i = dist[i]
+                dik = row_i[k]
+                if dik == inf:
+                    continue  # Nada que mejorar pasando por k
+                for j in range(n):
+                    if dik + row_k[j] < row_i[j]:
+                        row_i[j] = dik + row_k[j]
+
+        # Detectar ciclos negativos
+        for i in range(n):
+            if dist[i][i] < 0:
+                raise ValueError("Ciclo negativo detectado")
+
+        return dist
@@ -0,0 +1,67 @@
+"""
+Prim para grafos densos sobre una matriz de adyacencia NumPy.
+
+En un grafo completo prim_mst mete O(V^2) tuplas al heap. Aqui se usa la
+version clasica O(V^2) sin cola: un vector key con la arista mas barata de
+cada nodo hacia el arbol. Cada paso es un argmin y una actualizacion
+vectorizada
+    key = minimum(key, W[v])
+sobre la fila del nodo recien agregado, asi que el trabajo por paso es una
+sola pasada de NumPy sobre V elementos.
+"""
+import numpy as np
+
+
+def adjacency_matrix(graph, dtype=np.float64) -> np.ndarray:
+    """
+    Matriz simetrica V x V de un GraphMST: peso de la arista (la mas barata
+    si hay paralelas) e inf donde no hay arista o en la diagonal.
+    """
+    n = graph.V
+    W = np.full((n, n), np.inf, dtype=dtype)
+    if graph.edges:
+        u, v, w = (np.asarray(col) for col in zip(*graph.edges))
+        u, v = u.astype(np.intp), v.astype(np.intp)
+        w = w.astype(dtype)
+        np.minimum.at(W, (u, v), w)
+        np.minimum.at(W, (v, u), w)
+    np.fill_diagonal(W, np.inf)
+    return W
+
+
+def prim_dense(W, start_node: int = 0):
+    """
+    MST de la componente de start_node a partir de una matriz simetrica W
+    (inf = sin arista). Retorna (mst_edges, mst_cost) como prim_mst.
+    """
+    W = np.asarray(W, dtype=np.float64)
+    n = W.shape[0]
+    if W.ndim != 2 or W.shape[1] != n:
+        raise ValueError("W debe ser una matriz cuadrada")
+    if not 0 <= start_node < n:
+        raise IndexError("Nodo fuera de rango")
+
+    en_arbol = np.zeros(n, dtype=bool)
+    en_arbol[start_node] = True
+    key = W[start_node].copy()
+    key[start_node] = np.inf
+    parent = np.full(n, start_node, dtype=np.int64)
+
+    mst_edges = []
+    mst_cost = 0.0
+    for _ in range(n - 1):
+        v = int(np.argmin(key))
+        peso = key[v]
+        if not np.isfinite(peso):
+            break  # Lo que queda no es alcanzable desde start_node
+        mst_edges.append((int(parent[v]), v, float(peso)))
+        mst_cost += float(peso)
+        en_arbol[v] = True
+        key[v] = np.inf
+
+        fila = W[v]
+        mejora = (fila < key) & ~en_arbol
+        key[mejora] = fila[mejora]
+        parent[mejora] = v
+
+    return mst_edges, mst_cost
@@ -0,0 +1,135 @@
+"""
+Tablas de distancias muchos-a-muchos (origenes x destinos).
+
+Con una ContractionHierarchy se usa el algoritmo de cubetas:
+1. Desde cada destino t se hace una busqueda hacia atras que solo sube de
+   rango, y en cada nodo x alcanzado se deja (t, d(x, t)) en su cubeta.
+2. Desde cada origen s se hace la busqueda hacia adelante que sube de
+   rango; al llegar a x con d(s, x) se revisa su cubeta:
+       tabla[s][t] = min(tabla[s][t], d(s, x) + d(x, t))
+Las busquedas hacia atras se comparten entre todos los origenes, y cada
+busqueda ascendente toca muy pocos nodos.
+
+Con un WeightedGraph normal se corre un Dijkstra por origen que se detiene
+en cuanto asento todos los destinos.
+
+En ambos casos los origenes se pueden repartir por lotes en procesos. El
+resultado es una matriz float32 de NumPy (inf = no hay ruta).
+"""
+import heapq
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from contraction_hierarchies import ContractionHierarchy
+
+
+def _busqueda_ascendente(adj, src):
+    """Dijkstra completo sobre un grafo ascendente (up o down de la CH)."""
+    dist = {src: 0}
+    pq = [(0, src)]
+    asentados = []
+    while pq:
+        d, u = heapq.heappop(pq)
+        if d > dist[u]:
+            continue
+        asentados.append((u, d))
+        for v, w in adj[u]:
+            if d + w < dist.get(v, math.inf):
+                dist[v] = d + w
+                heapq.heappush(pq, (d + w, v))
+    return asentados
+
+
+def _cubetas(ch: ContractionHierarchy, destinations):
+    """cubetas[x] = lista de (indice de destino, d(x, destino))."""
+    cubetas = {}
+    for j, t in enumerate(destinations):
+        for x, d in _busqueda_ascendente(ch.down, t):
+            cubetas.setdefault(x, []).append((j, d))
+    return cubetas
+
+
+def _filas_ch(ch, cubetas, k, origins):
+    tabla = np.full((len(origins), k), np.inf, dtype=np.float32)
+    for i, s in enumerate(origins):
+        fila = [math.inf] * k  # En float64 mientras se acumula
+        for x, d in _busqueda_ascendente(ch.up, s):
+            for j, dt in cubetas.get(x, ()):
+                if d + dt < fila[j]:
+                    fila[j] = d + dt
+        tabla[i] = fila
+    return tabla
+
+
+def _filas_dijkstra(graph, destinations, origins):
+    tabla = np.full((len(origins), len(destinations)), np.inf, dtype=np.float32)
+    columnas = {}
+    for j, t in enumerate(destinations):
+        columnas.setdefault(t, []).append(j)
+    for i, s in enumerate(origins):
+        pendientes = len(columnas)
+        dist = {s: 0}
+        pq = [(0, s)]
+        asentados = set()
+        while pq and pendientes:
+            d, u = heapq.heappop(pq)
+            if u in asentados:
+                continue
+            asentados.add(u)
+            if u in columnas:
+                tabla[i, columnas[u]] = d
+                pendientes -= 1  # Al asentar el ultimo destino se termina
+            for v, w in graph.adj[u]:
+                if d + w < dist.get(v, math.inf):
+                    dist[v] = d + w
+                    heapq.heappush(pq, (d + w, v))
+    return tabla
+
+
+_trabajador = {}  # Estado de cada proceso del pool
+
+
+def _inicializar_trabajador(funcion, argumentos):
+    _trabajador["funcion"] = funcion
+    _trabajador["argumentos"] = argumentos
+
+
+def _lote(origins):
+    return _trabajador["funcion"](*_trabajador["argumentos"], origins)
+
+
+def distance_table(graph, origins, destinations, workers: int = 1,
+                   batch_size: int = 64) -> np.ndarray:
+    """
+    Matriz float32 de len(origins) x len(destinations) con d(origen, destino).
+
+    graph: ContractionHierarchy (algoritmo de cubetas) o WeightedGraph
+           (Dijkstra con parada temprana por origen).
+    workers: procesos para repartir los lotes de origenes (1 = en linea).
+    batch_size: origenes por lote.
+    """
+    origins = list(origins)
+    destinations = list(destinations)
+    for v in origins + destinations:
+        if not 0 <= v < graph.n:
+            raise IndexError("Nodo fuera de rango")
+
+    if isinstance(graph, ContractionHierarchy):
+        funcion = _filas_ch
+        argumentos = (graph, _cubetas(graph, destinations), len(destinations))
+    else:
+        funcion = _filas_dijkstra
+        argumentos = (graph, destinations)
+
+    if workers <= 1 or len(origins) <= batch_size:
+        if not origins:
+            return np.empty((0, len(destinations)), dtype=np.float32)
+        return funcion(*argumentos, origins)
+
+    lotes = [origins[i:i + batch_size] for i in range(0, len(origins), batch_size)]
+    # Grafo y cubetas viajan una sola vez a cada proceso (initargs)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_trabajador,
+                             initargs=(funcion, argumentos)) as pool:
+        return np.vstack(list(pool.map(_lote, lotes)))
@@ -0,0 +1,323 @@
+"""
+MST dinamico: mantiene el bosque generador minimo mientras se agregan y se
+quitan aristas, sin reconstruirlo con Prim o Kruskal en cada cambio.
+
+El bosque vive en un link-cut tree (arboles splay por camino preferido, sin
+recursion). Cada arista del arbol es un nodo extra del link-cut tree con su
+peso, asi "arista mas cara del camino u..v" es una consulta de agregado.
+
+- insert_edge(u, v, w): si u y v estan en arboles distintos se enlazan; si
+  no, se busca la arista mas cara del ciclo que se formaria y, si pesa mas
+  que w, se reemplaza. O(log n) amortizado.
+- delete_edge(u, v): si la arista no era del arbol basta olvidarla. Si lo
+  era, se corta y el arbol queda en dos pedazos; se recorren ambos en
+  paralelo (BFS intercalado sobre las aristas del arbol) hasta agotar el
+  mas chico, y el reemplazo es la arista no-arbol mas barata que sale de
+  ese pedazo. Costo O(pedazo chico + sus aristas no-arbol), sin recorrer
+  todo el grafo.
+
+Nota: el borrado de una arista del arbol no es polilogaritmico en el peor
+caso (la estructura por niveles de Holm, de Lichtenberg y Thorup lo logra
+amortizado a cambio de mucha mas complejidad); con cortes que dejan un
+pedazo chico, lo usual en redes viales, es casi inmediato.
+"""
+from typing import Dict, List, Set, Tuple
+
+
+class LinkCutTree:
+    """
+    Link-cut tree sobre nodos 0..k-1 con un valor por nodo; path_max da el
+    nodo de mayor valor en el camino entre dos nodos.
+    """
+
+    def __init__(self, valores=()):
+        self.left = []
+        self.right = []
+        self.parent = []
+        self.rev = []
+        self.val = []
+        self.mx = []  # Nodo con el mayor valor en el subarbol splay
+        for x in valores:
+            self.add_node(x)
+
+    def add_node(self, valor) -> int:
+        x = len(self.val)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.parent.append(-1)
+        self.rev.append(False)
+        self.val.append(valor)
+        self.mx.append(x)
+        return x
+
+    def _es_raiz(self, x) -> bool:
+        p = self.parent[x]
+        return p == -1 or (self.left[p] != x and self.right[p] != x)
+
+    def _bajar(self, x):
+        """Propaga la inversion pendiente a los hijos."""
+        if self.rev[x]:
+            l, r = self.left[x], self.right[x]
+            self.left[x], self.right[x] = r, l
+            if l != -1:
+                self.rev[l] = not self.rev[l]
+            if r != -1:
+                self.rev[r] = not self.rev[r]
+            self.rev[x] = False
+
+    def _actualizar(self, x):
+        val, mx = self.val, self.mx
+        m = x
+        for c in (self.left[x], self.right[x]):
+            if c != -1 and val[mx[c]] > val[m]:
+                m = mx[c]
+        mx[x] = m
+
+    def _rotar(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        p = parent[x]
+        g = parent[p]
+        p_raiz = self._es_raiz(p)
+        if left[p] == x:
+            b = right[x]
+            left[p] = b
+            right[x] = p
+        else:
+            b = left[x]
+            right[p] = b
+            left[x] = p
+        if b != -1:
+            parent[b] = p
+        if not p_raiz:
+            if left[g] == p:
+                left[g] = x
+            else:
+                right[g] = x
+        parent[x] = g
+        parent[p] = x
+        self._actualizar(p)
+        self._actualizar(x)
+
+    def _splay(self, x):
+        camino = [x]
+        y = x
+        while not self._es_raiz(y):
+            y = self.parent[y]
+            camino.append(y)
+        for y in reversed(camino):
+            self._bajar(y)
+
+        left, parent = self.left, self.parent
+        while not self._es_raiz(x):
+            p = parent[x]
+            if not self._es_raiz(p):
+                g = parent[p]
+                if (left[g] == p) == (left[p] == x):
+                    self._rotar(p)  # zig-zig
+                else:
+                    self._rotar(x)  # zig-zag
+            self._rotar(x)
+
+    def _access(self, x):
+        ultimo = -1
+        y = x
+        while y != -1:
+            self._splay(y)
+            self.right[y] = ultimo
+            self._actualizar(y)
+            ultimo = y
+            y = self.parent[y]
+        self._splay(x)
+
+    def _make_root(self, x):
+        self._access(x)
+        self.rev[x] = not self.rev[x]
+
+    def find_root(self, x) -> int:
+        self._access(x)
+        while True:
+            self._bajar(x)
+            if self.left[x] == -1:
+                break
+            x = self.left[x]
+        self._splay(x)
+        return x
+
+    def connected(self, u, v) -> bool:
+        return u == v or self.find_root(u) == self.find_root(v)
+
+    def link(self, u, v):
+        """Agrega la arista u-v; u y v deben estar en arboles distintos."""
+        self._make_root(u)
+        self.parent[u] = v
+
+    def cut(self, u, v):
+        """Quita la arista u-v, que debe existir."""
+        self._make_root(u)
+        self._access(v)
+        self._bajar(v)
+        # Tras access(v) con u como raiz, u es el unico nodo a la izquierda
+        self.left[v] = -1
+        self.parent[u] = -1
+        self._actualizar(v)
+
+    def path_max(self, u, v) -> int:
+        """Nodo de mayor valor en el camino u..v (u y v conectados)."""
+        self._make_root(u)
+        self._access(v)
+        return self.mx[v]
+
+
+class DynamicMST:
+    """
+    Bosque generador minimo de un grafo no dirigido con n nodos que cambia
+    por inserciones y borrados de aristas. cost es el costo actual.
+    """
+
+    def __init__(self, n: int):
+        self.n = n
+        self.cost = 0
+        self._lct = LinkCutTree([float('-inf')] * n)
+        self._aristas: Dict[int, Tuple[int, int, float]] = {}
+        self._por_par: Dict[Tuple[int, int], List[int]] = {}
+        self._nodo_de: Dict[int, int] = {}    # arista del arbol -> nodo del LCT
+        self._arista_de: Dict[int, int] = {}  # nodo del LCT -> arista del arbol
+        self._libres: List[int] = []          # Nodos de arista reutilizables
+        # Aristas (ids) incidentes a cada nodo, del arbol y fuera de el
+        self._arbol_ady: List[Set[int]] = [set() for _ in range(n)]
+        self._no_arbol_ady: List[Set[int]] = [set() for _ in range(n)]
+        self._siguiente_id = 0
+
+    @classmethod
+    def from_graph(cls, graph) -> "DynamicMST":
+        """Inicializa desde un GraphMST: Kruskal una vez y luego dinamico."""
+        dm = cls(graph.V)
+        for u, v, w in sorted(graph.edges, key=lambda item: item[2]):
+            dm.insert_edge(u, v, w)
+        return dm
+
+    def __len__(self) -> int:
+        return len(self._aristas)
+
+    def mst_edges(self) -> List[Tuple[int, int, float]]:
+        return [self._aristas[e] for e in self._nodo_de]
+
+    def _enlazar(self, e):
+        u, v, w = self._aristas[e]
+        lct = self._lct
+        if self._libres:
+            x = self._libres.pop()
+            lct.val[x] = w
+            lct.mx[x] = x
+        else:
+            x = lct.add_node(w)
+        lct.link(u, x)
+        lct.link(x, v)
+        self._nodo_de[e] = x
+        self._arista_de[x] = e
+        self._arbol_ady[u].add(e)
+        self._arbol_ady[v].add(e)
+        self.cost += w
+
+    def _cortar(self, e):
+        u, v, w = self._aristas[e]
+        x = self._nodo_de.pop(e)
+        del self._arista_de[x]
+        self._lct.cut(u, x)
+        self._lct.cut(x, v)
+        self._libres.append(x)
+        self._arbol_ady[u].discard(e)
+        self._arbol_ady[v].discard(e)
+        self.cost -= w
+
+    def _a_no_arbol(self, e):
+        u, v, _ = self._aristas[e]
+        self._no_arbol_ady[u].add(e)
+        self._no_arbol_ady[v].add(e)
+
+    def insert_edge(self, u: int, v: int, w: float) -> float:
+        """Agrega la arista u-v con peso w; retorna el nuevo costo."""
+        if not (0 <= u < self.n and 0 <= v < self.n):
+            raise IndexError("Nodo fuera de rango")
+        e = self._siguiente_id
+        self._siguiente_id += 1
+        self._aristas[e] = (u, v, w)
+        self._por_par.setdefault((min(u, v), max(u, v)), []).append(e)
+
+        lct = self._lct
+        if u != v and not lct.connected(u, v):
+            self._enlazar(e)
+            return self.cost
+        if u != v:
+            x = lct.path_max(u, v)
+            if lct.val[x] > w:
+                # La mas cara del ciclo sale del arbol y entra la nueva
+                viejo = self._arista_de[x]
+                self._cortar(viejo)
+                self._a_no_arbol(viejo)
+                self._enlazar(e)
+                return self.cost
+        self._a_no_arbol(e)
+        return self.cost
+
+    def _pedazo_chico(self, u: int, v: int) -> Set[int]:
+        """
+        Tras cortar u-v: nodos del pedazo mas chico, con BFS intercalados
+        desde u y desde v (se para apenas uno de los dos se agota).
+        """
+        arbol_ady, aristas = self._arbol_ady, self._aristas
+        vistos = ({u}, {v})
+        colas = ([u], [v])
+        while True:
+            for lado in (0, 1):
+                cola = colas[lado]
+                if not cola:
+                    return vistos[lado]
+                x = cola.pop()
+                for e in arbol_ady[x]:
+                    a, b, _ = aristas[e]
+                    y = b if a == x else a
+                    if y not in vistos[lado]:
+                        vistos[lado].add(y)
+                        cola.append(y)
+
+    def delete_edge(self, u: int, v: int, w: float = None) -> float:
+        """
+        Quita una arista u-v (la de peso w si se indica; si hay paralelas,
+        la mas cara). Retorna el nuevo costo. ValueError si no existe.
+        """
+        par = (min(u, v), max(u, v))
+        candidatas = [e for e in self._por_par.get(par, ())
+                      if w is None or self._aristas[e][2] == w]
+        if not candidatas:
+            raise ValueError(f"No existe la arista {u}-{v}")
+        e = max(candidatas, key=lambda i: self._aristas[i][2])
+
+        self._por_par[par].remove(e)
+        if not self._por_par[par]:
+            del self._por_par[par]
+
+        if e not in self._nodo_de:
+            self._no_arbol_ady[u].discard(e)
+            self._no_arbol_ady[v].discard(e)
+            del self._aristas[e]
+            return self.cost
+
+        self._cortar(e)
+        del self._aristas[e]
+
+        # Reemplazo: la no-arbol mas barata que sale del pedazo chico
+        pedazo = self._pedazo_chico(u, v)
+        mejor = None
+        for x in pedazo:
+            for r in self._no_arbol_ady[x]:
+                a, b, peso = self._aristas[r]
+                otro = b if a == x else a
+                if otro not in pedazo and (mejor is None or peso < self._aristas[mejor][2]):
+                    mejor = r
+        if mejor is not None:
+            a, b, _ = self._aristas[mejor]
+            self._no_arbol_ady[a].discard(mejor)
+            self._no_arbol_ady[b].discard(mejor)
+            self._enlazar(mejor)
+        return self.cost
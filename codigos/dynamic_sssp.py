@@ -0,0 +1,172 @@
+"""
+Caminos minimos desde un origen con reparacion incremental
+(SSSP dinamico, en la linea de Ramalingam-Reps).
+
+En lugar de correr Dijkstra completo despues de cada cambio, se repara el
+arbol de caminos minimos existente:
+- Si una arista baja de peso (o se agrega), solo se propaga la mejora desde
+  su destino con un Dijkstra que arranca ahi.
+- Si una arista del arbol sube de peso (o se quita), solo el subarbol que
+  colgaba de ella puede empeorar: se invalida ese subarbol, cada nodo toma
+  su mejor arista entrante desde fuera del subarbol, y un Dijkstra acotado
+  al subarbol termina de repararlo.
+- Si la arista no es del arbol y sube o se quita, no cambia nada.
+
+Requiere pesos no negativos. Para evaluar cierres hipoteticos basta con
+remove_edge(u, v) y luego add_edge(u, v, w) para reabrir la calle.
+
+Los cambios deben pasar por esta clase. Si el grafo se modifica por fuera
+(graph.version no coincide con la ultima vista), la siguiente consulta o
+cambio recalcula todo con un Dijkstra nuevo en lugar de reparar un arbol
+que ya no corresponde al grafo.
+"""
+import heapq
+import math
+from typing import List, Set
+
+
+class DynamicSSSP:
+    def __init__(self, graph, src: int):
+        self.graph = graph
+        self.src = src
+        self.recomputes = 0
+        self._recalcular()
+        graph.reverse_adj()  # Se necesita para buscar aristas entrantes
+
+    def _recalcular(self):
+        """Dijkstra desde cero y arbol de caminos minimos nuevo."""
+        self._dist, self._parent = self.graph.dijkstra(self.src)
+        # Hijos en el arbol de caminos minimos, para ubicar subarboles rapido
+        self._children: List[Set[int]] = [set() for _ in range(self.graph.n)]
+        for v, p in enumerate(self._parent):
+            if p != -1:
+                self._children[p].add(v)
+        self._version = self.graph.version
+
+    def _vigente(self):
+        if self.graph.version != self._version:
+            self._recalcular()
+            self.recomputes += 1
+
+    @property
+    def dist(self) -> List[float]:
+        self._vigente()
+        return self._dist
+
+    @property
+    def parent(self) -> List[int]:
+        self._vigente()
+        return self._parent
+
+    @property
+    def children(self) -> List[Set[int]]:
+        self._vigente()
+        return self._children
+
+    # ------------------------------------------------------------------
+    # Cambios en el grafo
+    # ------------------------------------------------------------------
+    def add_edge(self, u: int, v: int, w: float) -> int:
+        """Agrega u -> v y repara. Retorna cuantos nodos cambiaron de distancia."""
+        self._vigente()
+        self.graph.add_edge(u, v, w)
+        self._version = self.graph.version
+        return self._mejorar(u, v, w)
+
+    def remove_edge(self, u: int, v: int) -> int:
+        """Quita u -> v (cierre de calle) y repara."""
+        self._vigente()
+        self.graph.remove_edge(u, v)
+        self._version = self.graph.version
+        return self._empeorar(u, v)
+
+    def update_weight(self, u: int, v: int, w: float) -> int:
+        """Cambia el peso de u -> v (sube o baja) y repara."""
+        self._vigente()
+        anterior = min(peso for x, peso in self.graph.adj[u] if x == v)
+        self.graph.update_weight(u, v, w)
+        self._version = self.graph.version
+        if w < anterior:
+            return self._mejorar(u, v, w)
+        if w > anterior:
+            return self._empeorar(u, v)
+        return 0
+
+    # ------------------------------------------------------------------
+    # Reparacion
+    # ------------------------------------------------------------------
+    def _cambiar_padre(self, v: int, p: int):
+        if self._parent[v] != -1:
+            self._children[self._parent[v]].discard(v)
+        self._parent[v] = p
+        if p != -1:
+            self._children[p].add(v)
+
+    def _propagar(self, pq, afectados: Set[int]) -> int:
+        """Dijkstra que arranca con las entradas de pq; cuenta nodos cambiados."""
+        dist, adj = self._dist, self.graph.adj
+        while pq:
+            d, u = heapq.heappop(pq)
+            if d > dist[u]:
+                continue
+            for v, w in adj[u]:
+                if d + w < dist[v]:
+                    dist[v] = d + w
+                    self._cambiar_padre(v, u)
+                    afectados.add(v)
+                    heapq.heappush(pq, (dist[v], v))
+        return len(afectados)
+
+    def _mejorar(self, u: int, v: int, w: float) -> int:
+        if self._dist[u] + w >= self._dist[v]:
+            return 0
+        self._dist[v] = self._dist[u] + w
+        self._cambiar_padre(v, u)
+        return self._propagar([(self._dist[v], v)], {v})
+
+    def _empeorar(self, u: int, v: int) -> int:
+        if self._parent[v] != u:
+            return 0  # No era arista del arbol: nadie dependia de ella
+
+        # Subarbol que colgaba de v (incluido v)
+        subarbol = {v}
+        pila = [v]
+        while pila:
+            x = pila.pop()
+            for hijo in self._children[x]:
+                subarbol.add(hijo)
+                pila.append(hijo)
+
+        anteriores = {x: self._dist[x] for x in subarbol}
+        for x in subarbol:
+            self._dist[x] = math.inf
+            self._cambiar_padre(x, -1)
+
+        # Mejor arista entrante desde fuera del subarbol
+        dist, radj = self._dist, self.graph.reverse_adj()
+        pq = []
+        for x in subarbol:
+            for p, w in radj[x]:
+                if p not in subarbol and dist[p] + w < dist[x]:
+                    dist[x] = dist[p] + w
+                    self._cambiar_padre(x, p)
+            if dist[x] < math.inf:
+                pq.append((dist[x], x))
+        heapq.heapify(pq)
+
+        self._propagar(pq, set())
+        return sum(1 for x in subarbol if dist[x] != anteriores[x])
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+    def path(self, dst: int) -> List[int]:
+        """Camino actual de src a dst ([] si no es alcanzable)."""
+        dist, parent = self.dist, self.parent
+        if math.isinf(dist[dst]):
+            return []
+        camino = [dst]
+        while parent[camino[-1]] != -1:
+            camino.append(parent[camino[-1]])
+        camino.reverse()
+        return camino
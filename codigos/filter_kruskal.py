@@ -0,0 +1,126 @@
+"""
+Filter-Kruskal y MST en flujo (streaming) sobre archivos de aristas.
+
+Filter-Kruskal (Osipov, Sanders y Singler) evita ordenar todas las aristas:
+parte las aristas como quicksort alrededor de un peso pivote, resuelve
+primero las livianas y, antes de bajar a las pesadas, descarta las que ya
+quedaron dentro de una misma componente. En grafos densos la mayoria de las
+aristas pesadas se descartan sin ordenarse nunca. Los tramos chicos se
+resuelven con Kruskal normal. Se implementa con una pila explicita, sin
+recursion.
+
+streaming_mst lee las aristas por bloques (de un archivo de texto o de
+cualquier iterable) y solo guarda el bosque minimo actual (a lo mas n - 1
+aristas) mas el bloque en curso: tras cada bloque se recalcula el bosque
+sobre bosque + bloque. Por la propiedad del ciclo, una arista descartada
+nunca vuelve a hacer falta, asi que la memoria es O(n + chunk_size) aunque
+el archivo no quepa en RAM.
+
+Formato del archivo: una arista por linea "u v w" separada por espacios;
+las lineas vacias y las que empiezan con '#' se ignoran.
+"""
+import os
+import random
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple
+
+from union_find import UnionFind
+
+Arista = Tuple[int, int, float]
+
+
+def _kruskal(aristas, uf, mst_edges):
+    for u, v, w in sorted(aristas, key=lambda item: item[2]):
+        if uf.union(u, v):
+            mst_edges.append((u, v, w))
+
+
+def filter_kruskal(n: int, edges: List[Arista], threshold: int = 1024,
+                   uf: UnionFind = None) -> Tuple[List[Arista], float]:
+    """
+    MST (o bosque minimo) de las aristas (u, v, w) sobre n nodos.
+    Retorna (mst_edges, mst_cost) como GraphMST.kruskal_mst.
+
+    threshold: tamano de tramo a partir del cual se ordena directamente.
+    uf: Union-Find inicial opcional (para continuar un bosque ya armado).
+    """
+    uf = UnionFind(n) if uf is None else uf
+    rnd = random.Random(0)  # Pivotes reproducibles
+    mst_edges = []
+
+    # Cada elemento: (aristas, filtrar antes de procesar)
+    pila = [(list(edges), False)]
+    while pila:
+        aristas, filtrar = pila.pop()
+        if filtrar:
+            find = uf.find
+            aristas = [e for e in aristas if find(e[0]) != find(e[1])]
+        if len(aristas) <= threshold:
+            _kruskal(aristas, uf, mst_edges)
+            continue
+
+        pivote = rnd.choice(aristas)[2]
+        livianas = [e for e in aristas if e[2] <= pivote]
+        if len(livianas) == len(aristas):
+            _kruskal(aristas, uf, mst_edges)  # Pivote maximo: no se puede partir
+            continue
+        pesadas = [e for e in aristas if e[2] > pivote]
+        # Pila: las livianas salen primero y las pesadas se filtran despues
+        pila.append((pesadas, True))
+        pila.append((livianas, False))
+
+    return mst_edges, sum(w for _, _, w in mst_edges)
+
+
+# --- Streaming ---------------------------------------------------------------
+
+def _numero(texto: str):
+    try:
+        return int(texto)
+    except ValueError:
+        return float(texto)
+
+
+def read_edges(path: str) -> Iterator[Arista]:
+    """Itera las aristas de un archivo "u v w" sin cargarlo entero."""
+    with open(path) as f:
+        for linea in f:
+            partes = linea.split()
+            if not partes or partes[0].startswith('#'):
+                continue
+            if len(partes) != 3:
+                raise ValueError(f"Linea invalida: {linea!r}")
+            yield int(partes[0]), int(partes[1]), _numero(partes[2])
+
+
+def write_edges(path: str, edges: Iterable[Arista]):
+    """Escribe aristas en el formato que lee read_edges."""
+    with open(path, "w") as f:
+        for u, v, w in edges:
+            f.write(f"{u} {v} {w}\n")
+
+
+def streaming_mst(source, n: int, chunk_size: int = 100000,
+                  threshold: int = 1024) -> Tuple[List[Arista], float]:
+    """
+    MST semi-streaming: source es una ruta a un archivo de aristas o un
+    iterable de (u, v, w). En memoria solo queda el bosque actual y un
+    bloque de chunk_size aristas.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size debe ser positivo")
+    if isinstance(source, (str, os.PathLike)):
+        source = read_edges(source)
+    aristas = iter(source)
+
+    bosque = []
+    while True:
+        bloque = list(islice(aristas, chunk_size))
+        if not bloque:
+            break
+        for u, v, _ in bloque:
+            if not (0 <= u < n and 0 <= v < n):
+                raise IndexError("Nodo fuera de rango")
+        bosque, _ = filter_kruskal(n, bosque + bloque, threshold)
+
+    return bosque, sum(w for _, _, w in bosque)
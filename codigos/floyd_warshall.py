@@ -0,0 +1,175 @@
+"""
+Floyd-Warshall vectorizado con NumPy.
+
+En lugar del triple ciclo de Python, cada paso k se hace como una sola
+actualizacion de matriz completa:
+    D = minimum(D, D[:, k] + D[k, :])
+Opcionalmente se procesa por bloques (tiles) de block_size x block_size para
+reutilizar cache, y con dtype=float32 para usar la mitad de memoria.
+
+Con next_hop=True se arma en la misma pasada la matriz de sucesores
+(nxt[i][j] = siguiente nodo despues de i rumbo a j). save_tables() guarda
+ambas tablas en disco (float32/int32) y RouteTable las abre con memory-map
+para responder rutas sin recalcular nada.
+
+NumPy es una dependencia opcional del proyecto: solo se importa aqui.
+"""
+import os
+
+import numpy as np
+
+
+def matriz_adyacencia(graph, dtype=np.float64) -> np.ndarray:
+    """
+    Matriz n x n inicial: 0 en la diagonal, peso de la arista (la mas barata
+    si hay paralelas) y inf donde no hay arista. Acepta WeightedGraph o
+    CSRGraph.
+    """
+    n = graph.n
+    D = np.full((n, n), np.inf, dtype=dtype)
+    np.fill_diagonal(D, 0)
+
+    if hasattr(graph, "offsets"):
+        # CSRGraph: los buffers se ven como arreglos sin copiar
+        offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+        src = np.repeat(np.arange(n), np.diff(offsets))
+        dst = np.frombuffer(graph.targets, dtype=np.int32)
+        w = np.frombuffer(graph.weights, dtype=np.float64).astype(dtype)
+    else:
+        src, dst, w = [], [], []
+        for u in range(n):
+            for v, peso in graph.adj[u]:
+                src.append(u)
+                dst.append(v)
+                w.append(peso)
+        w = np.asarray(w, dtype=dtype)
+
+    np.minimum.at(D, (np.asarray(src, dtype=np.intp), np.asarray(dst, dtype=np.intp)), w)
+    return D
+
+
+def _relajar(C, A, B, NC=None, NA=None):
+    """
+    C = min(C, A (min,+) B), en el lugar y avanzando k de uno en uno.
+    C puede compartir memoria con A o con B (fases 1 y 2 del algoritmo por
+    bloques): el orden secuencial en k es justo el de Floyd-Warshall.
+    Si se pasan NC y NA (sucesores de C y de A), donde mejora C[i, j] via k
+    el sucesor pasa a ser el de (i, k).
+    """
+    if NC is None:
+        for k in range(A.shape[1]):
+            np.minimum(C, A[:, k, None] + B[None, k, :], out=C)
+        return
+    for k in range(A.shape[1]):
+        candidato = A[:, k, None] + B[None, k, :]
+        mejora = candidato < C
+        np.copyto(C, candidato, where=mejora)
+        np.copyto(NC, NA[:, k, None], where=mejora)
+
+
+def matriz_sucesores(D) -> np.ndarray:
+    """Sucesores iniciales: j si hay arista i -> j, i en la diagonal, -1 si no."""
+    n = D.shape[0]
+    N = np.where(np.isfinite(D), np.arange(n, dtype=np.int32)[None, :], -1).astype(np.int32)
+    np.fill_diagonal(N, np.arange(n, dtype=np.int32))
+    return N
+
+
+def floyd_warshall_numpy(graph, dtype=np.float64, block_size=None, next_hop=False):
+    """
+    Distancias minimas entre todos los pares como ndarray n x n.
+
+    block_size=None hace un paso de matriz completa por cada k.
+    Con block_size=b usa el esquema clasico de tres fases por bloque k:
+      1. cerrar el bloque diagonal (k, k),
+      2. actualizar la fila y la columna de bloques k,
+      3. actualizar el resto de tiles con la fila/columna ya cerradas.
+
+    next_hop=True retorna (D, N) con N la matriz int32 de sucesores.
+    Lanza ValueError si hay ciclo negativo, igual que
+    WeightedGraph.floyd_warshall.
+    """
+    D = matriz_adyacencia(graph, dtype)
+    N = matriz_sucesores(D) if next_hop else None
+    n = graph.n
+
+    def bloque(M, filas, cols):
+        return None if M is None else M[filas[0]:filas[1], cols[0]:cols[1]]
+
+    if block_size is None or block_size >= n:
+        _relajar(D, D, D, N, N)
+    else:
+        if block_size <= 0:
+            raise ValueError("block_size debe ser positivo")
+        bloques = [(i, min(i + block_size, n)) for i in range(0, n, block_size)]
+        for kb in bloques:
+            diag = bloque(D, kb, kb)
+            # Fase 1: bloque diagonal
+            _relajar(diag, diag, diag, bloque(N, kb, kb), bloque(N, kb, kb))
+            # Fase 2: fila y columna de bloques k
+            for jb in bloques:
+                if jb == kb:
+                    continue
+                fila = bloque(D, kb, jb)
+                _relajar(fila, diag, fila, bloque(N, kb, jb), bloque(N, kb, kb))
+                col = bloque(D, jb, kb)
+                _relajar(col, col, diag, bloque(N, jb, kb), bloque(N, jb, kb))
+            # Fase 3: el resto de tiles depende solo de la fila/columna k
+            for ib in bloques:
+                if ib == kb:
+                    continue
+                col = bloque(D, ib, kb)
+                for jb in bloques:
+                    if jb == kb:
+                        continue
+                    _relajar(bloque(D, ib, jb), col, bloque(D, kb, jb),
+                             bloque(N, ib, jb), bloque(N, ib, kb))
+
+    # Detectar ciclos negativos
+    if n and (np.diagonal(D) < 0).any():
+        raise ValueError("Ciclo negativo detectado")
+
+    return (D, N) if next_hop else D
+
+
+# --- Tablas en disco ------------------------------------------------------
+
+def save_tables(ruta: str, D, N):
+    """
+    Guarda distancias (float32) y sucesores (int32) en el directorio `ruta`
+    como dist.npy y next.npy, listos para abrirse con memory-map.
+    """
+    os.makedirs(ruta, exist_ok=True)
+    np.save(os.path.join(ruta, "dist.npy"), np.asarray(D, dtype=np.float32))
+    np.save(os.path.join(ruta, "next.npy"), np.asarray(N, dtype=np.int32))
+
+
+class RouteTable:
+    """
+    Tablas de Floyd-Warshall precalculadas, abiertas con memory-map: solo
+    se leen de disco las filas que se consultan.
+    """
+
+    def __init__(self, D, N):
+        self.dist = D
+        self.next = N
+        self.n = D.shape[0]
+
+    @classmethod
+    def load(cls, ruta: str) -> "RouteTable":
+        D = np.load(os.path.join(ruta, "dist.npy"), mmap_mode='r')
+        N = np.load(os.path.join(ruta, "next.npy"), mmap_mode='r')
+        return cls(D, N)
+
+    @classmethod
+    def from_graph(cls, graph, **opciones) -> "RouteTable":
+        """Calcula las tablas en memoria (sin pasar por disco)."""
+        return cls(*floyd_warshall_numpy(graph, next_hop=True, **opciones))
+
+    def distance(self, i: int, j: int) -> float:
+        return float(self.dist[i, j])
+
+    def route(self, i: int, j: int):
+        """Ruta de i a j en O(largo de la ruta); [] si no hay ruta."""
+        from WeightedGraph import WeightedGraph
+        return WeightedGraph.route(self.next, i, j)
@@ -31,8 +31,12 @@ class Huffman:
         self.codigos = {}
         self.codigos_inversos = {}
     
-    def construir_arbol(self, texto):
-        """Construye el árbol de Huffman a partir de un texto."""
+    def construir_arbol(self, texto, queue="heapq"):
+        """
+        Construye el árbol de Huffman a partir de un texto.
+        queue: "heapq" o una cola de priority_queues.py ("binary",
+        "pairing", "bucket"; las frecuencias son enteras).
+        """
         # 1. Calcular frecuencias
         frecuencias = Counter(texto)
         
@@ -47,6 +51,10 @@ class Huffman:
             self.codigos_inversos['0'] = char
             return
         
+        if queue != "heapq":
+            self._construir_con_cola(frecuencias, queue)
+            return
+        
         # 2. Crear cola de prioridad con nodos hoja
         heap = []
         for caracter, freq in frecuencias.items():
@@ -73,6 +81,25 @@ class Huffman:
         # 5. Generar códigos
         self._generar_codigos(self.raiz, "")
     
+    def _construir_con_cola(self, frecuencias, queue):
+        """Mismos pasos 2-5 que construir_arbol, con una cola de priority_queues.py."""
+        from priority_queues import make_queue
+        
+        cola = make_queue(queue)
+        for caracter, freq in frecuencias.items():
+            cola.push(NodoHuffman(caracter, freq), freq)
+        
+        while len(cola) > 1:
+            izq, _ = cola.pop()
+            der, _ = cola.pop()
+            padre = NodoHuffman(None, izq.frecuencia + der.frecuencia)
+            padre.izquierdo = izq
+            padre.derecho = der
+            cola.push(padre, padre.frecuencia)
+        
+        self.raiz, _ = cola.pop()
+        self._generar_codigos(self.raiz, "")
+    
     def _generar_codigos(self, nodo, codigo_actual):
         """Genera códigos binarios recorriendo el árbol."""
         if nodo is None:
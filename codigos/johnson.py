@@ -0,0 +1,155 @@
+"""
+Caminos minimos entre todos los pares con el algoritmo de Johnson.
+
+1. Bellman-Ford desde un nodo virtual (aristas de peso 0 a todos) da
+   potenciales h tales que w'(u, v) = w(u, v) + h[u] - h[v] >= 0.
+   Asi se admiten pesos negativos (si no hay ciclos negativos).
+2. Un Dijkstra por origen sobre los pesos w', y se deshace el cambio:
+   d(u, v) = d'(u, v) - h[u] + h[v].
+
+Para grafos dispersos son n Dijkstra de O(m log n) en lugar del O(n^3) de
+Floyd-Warshall. Los Dijkstra se reparten en un ProcessPoolExecutor; el grafo
+(en formato CSR) se pone una sola vez en memoria compartida y cada proceso lo
+lee sin copiarlo. Las filas se entregan una por una con un generador, asi que
+nunca hace falta tener la matriz n x n completa en memoria.
+"""
+import math
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Iterator, List, Tuple
+
+from csr_graph import CSRGraph
+
+
+def bellman_ford_potentials(csr: CSRGraph) -> List[float]:
+    """
+    Potenciales de Johnson: distancias desde un nodo virtual conectado con
+    peso 0 a todos los nodos. Lanza ValueError si hay ciclo negativo.
+    """
+    n = csr.n
+    h = [0.0] * n  # El nodo virtual ya dejo todo en 0
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+
+    for _ in range(n + 1):
+        cambio = False
+        for u in range(n):
+            hu = h[u]
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if hu + weights[i] < h[v]:
+                    h[v] = hu + weights[i]
+                    cambio = True
+        if not cambio:
+            return h
+
+    # Si tras n + 1 rondas sigue mejorando, hay un ciclo negativo
+    raise ValueError("Ciclo negativo detectado")
+
+
+def _reponderar(csr: CSRGraph, h: List[float]) -> CSRGraph:
+    pesos = array('d', csr.weights)
+    for u in range(csr.n):
+        for i in range(csr.offsets[u], csr.offsets[u + 1]):
+            # max(0, ...) absorbe errores de redondeo del tipo -1e-16
+            pesos[i] = max(0.0, pesos[i] + h[u] - h[csr.targets[i]])
+    return CSRGraph(csr.n, csr.offsets, csr.targets, pesos)
+
+
+def _fila(csr: CSRGraph, h, src: int) -> array:
+    """Dijkstra sobre los pesos reponderados y regreso a las distancias reales."""
+    dist, _ = csr.dijkstra(src)
+    hs = h[src]
+    return array('d', (d - hs + h[v] if d != math.inf else math.inf
+                       for v, d in enumerate(dist)))
+
+
+# --- Memoria compartida -------------------------------------------------
+
+def _compartir(buf: array) -> Tuple[shared_memory.SharedMemory, tuple]:
+    """Copia un array a un bloque de memoria compartida nuevo."""
+    datos = memoryview(buf).cast('B')
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(datos)))
+    shm.buf[:len(datos)] = datos
+    return shm, (shm.name, buf.typecode, len(buf))
+
+
+def _adjuntar(desc, bloques):
+    nombre, typecode, largo = desc
+    shm = shared_memory.SharedMemory(name=nombre)
+    bloques.append(shm)
+    itemsize = array(typecode).itemsize
+    return shm.buf[:largo * itemsize].cast(typecode)
+
+
+_trabajador = {}  # Estado de cada proceso del pool
+
+
+def _inicializar_trabajador(n, descriptores):
+    bloques = []
+    offsets, targets, weights, h = (_adjuntar(d, bloques) for d in descriptores)
+    _trabajador["csr"] = CSRGraph(n, offsets, targets, weights)
+    _trabajador["h"] = h
+    _trabajador["bloques"] = bloques  # Mantenerlos vivos mientras dure el pool
+
+
+def _fila_trabajador(src: int) -> Tuple[int, array]:
+    return src, _fila(_trabajador["csr"], _trabajador["h"], src)
+
+
+# --- API ------------------------------------------------------------------
+
+def johnson_rows(graph, workers: int = None, sources=None) -> Iterator[Tuple[int, array]]:
+    """
+    Genera (src, fila) en orden de src, con fila[v] = d(src, v) como
+    array('d'). Acepta WeightedGraph o CSRGraph.
+
+    workers: procesos del pool (None = os.cpu_count()); con 0 o 1 se calcula
+             en el mismo proceso.
+    sources: origenes a calcular (por defecto todos).
+    """
+    csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+    h = bellman_ford_potentials(csr)
+    csr = _reponderar(csr, h)
+    fuentes = range(csr.n) if sources is None else sources
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for src in fuentes:
+            yield src, _fila(csr, h, src)
+        return
+
+    bloques, descriptores = [], []
+    try:
+        for buf in (csr.offsets, csr.targets, csr.weights, array('d', h)):
+            shm, desc = _compartir(buf)
+            bloques.append(shm)
+            descriptores.append(desc)
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_trabajador,
+                                 initargs=(csr.n, descriptores)) as pool:
+            # Ventana acotada de tareas pendientes: si el consumidor es lento
+            # no se acumulan filas terminadas en memoria
+            pendientes = deque()
+            fuentes = iter(fuentes)
+            for src in fuentes:
+                pendientes.append(pool.submit(_fila_trabajador, src))
+                if len(pendientes) >= 2 * workers:
+                    break
+            while pendientes:
+                yield pendientes.popleft().result()
+                src = next(fuentes, None)
+                if src is not None:
+                    pendientes.append(pool.submit(_fila_trabajador, src))
+    finally:
+        for shm in bloques:
+            shm.close()
+            shm.unlink()
+
+
+def johnson(graph, workers: int = None) -> List[array]:
+    """Matriz completa (lista de filas). Solo para grafos que caben en memoria."""
+    return [fila for _, fila in johnson_rows(graph, workers)]
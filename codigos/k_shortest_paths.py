@@ -0,0 +1,115 @@
+"""
+Las k rutas mas cortas sin ciclos entre dos nodos (algoritmo de Yen).
+
+Se obtiene la ruta mas corta y, para cada ruta aceptada, se generan
+candidatas desviandose en cada nodo ("spur"): se conserva el prefijo
+(raiz) y se busca el resto con Dijkstra prohibiendo los nodos de la raiz
+y las aristas que ya usaron las rutas aceptadas con esa misma raiz.
+
+Mejoras sobre la version basica:
+- Prefijos compartidos (modificacion de Lawler): una ruta que salio de
+  desviarse en la posicion i comparte con su madre los primeros i nodos, y
+  las desviaciones en esas posiciones ya se exploraron. Solo se generan
+  spurs desde su punto de desviacion en adelante.
+- Cota por la k-esima: si se pidio un k y ya hay suficientes candidatas,
+  cada Dijkstra de spur se corta en cuanto supera el costo de la peor
+  candidata que todavia podria entrar.
+- Generador: las rutas salen una por una y se puede dejar de pedir.
+"""
+import heapq
+import math
+from typing import Iterator, List, Tuple
+
+
+def _pesos_minimos(graph):
+    """(u, v) -> peso de la arista mas barata u -> v."""
+    pesos = {}
+    for u in range(graph.n):
+        for v, w in graph.adj[u]:
+            if w < pesos.get((u, v), math.inf):
+                pesos[(u, v)] = w
+    return pesos
+
+
+def _spur_dijkstra(graph, src, dst, nodos_prohibidos, aristas_prohibidas, limite):
+    """Dijkstra de src a dst evitando nodos/aristas; se rinde si pasa de limite."""
+    dist = {src: 0}
+    parent = {src: -1}
+    pq = [(0, src)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        if d > dist[u]:
+            continue
+        if d > limite:
+            return math.inf, []
+        if u == dst:
+            camino = [dst]
+            while parent[camino[-1]] != -1:
+                camino.append(parent[camino[-1]])
+            camino.reverse()
+            return d, camino
+        for v, w in graph.adj[u]:
+            if v in nodos_prohibidos or (u, v) in aristas_prohibidas:
+                continue
+            if d + w < dist.get(v, math.inf):
+                dist[v] = d + w
+                parent[v] = u
+                heapq.heappush(pq, (d + w, v))
+    return math.inf, []
+
+
+def yen_k_shortest_paths(graph, src: int, dst: int, k: int = None) -> Iterator[Tuple[float, List[int]]]:
+    """
+    Genera (costo, camino) en orden de costo creciente, sin ciclos.
+    k: maximo de rutas (None = hasta agotarlas). Con k se activa la cota.
+    """
+    if not (0 <= src < graph.n and 0 <= dst < graph.n):
+        raise IndexError("Nodo fuera de rango")
+    if k is not None and k <= 0:
+        return
+
+    costo, camino = graph.shortest_path(src, dst)
+    if not camino:
+        return
+
+    pesos = _pesos_minimos(graph)
+    aceptadas = []                     # Rutas ya entregadas
+    candidatas = [(costo, camino, 0)]  # (costo, camino, indice de desviacion)
+    vistas = {tuple(camino)}
+
+    while candidatas:
+        costo, camino, desviacion = heapq.heappop(candidatas)
+        aceptadas.append(camino)
+        yield costo, camino
+        if k is not None and len(aceptadas) >= k:
+            return
+
+        # Costos acumulados del prefijo, para no recalcularlos por spur
+        acumulado = [0]
+        for u, v in zip(camino, camino[1:]):
+            acumulado.append(acumulado[-1] + pesos[(u, v)])
+
+        for i in range(desviacion, len(camino) - 1):
+            spur = camino[i]
+            raiz = camino[:i + 1]
+
+            # Aristas que salen del spur en rutas aceptadas con la misma raiz
+            aristas_prohibidas = {(p[i], p[i + 1]) for p in aceptadas
+                                  if len(p) > i + 1 and p[:i + 1] == raiz}
+            nodos_prohibidos = set(raiz[:-1])
+
+            limite = math.inf
+            faltan = None if k is None else k - len(aceptadas)
+            if faltan is not None and len(candidatas) >= faltan:
+                # Una candidata nueva mas cara que la faltan-esima no entraria
+                limite = heapq.nsmallest(faltan, candidatas)[-1][0] - acumulado[i]
+
+            d, resto = _spur_dijkstra(graph, spur, dst, nodos_prohibidos,
+                                      aristas_prohibidas, limite)
+            if not resto:
+                continue
+            nuevo = raiz[:-1] + resto
+            if tuple(nuevo) in vistas:
+                continue
+            vistas.add(tuple(nuevo))
+            heapq.heappush(candidatas, (acumulado[i] + d, nuevo, i))
@@ -0,0 +1,126 @@
+"""
+Oraculo de distancias con landmarks (ALT: A*, Landmarks, Triangle inequality).
+
+Se eligen unos pocos nodos "landmark" L y se precalculan con Dijkstra las
+distancias d(L, v) y d(v, L) para todo v. Por la desigualdad del triangulo:
+    d(u, t) >= d(L, t) - d(L, u)
+    d(u, t) >= d(u, L) - d(t, L)
+    d(u, t) <= d(u, L) + d(L, t)
+Las cotas inferiores sirven de heuristica admisible (y consistente) para A*,
+y junto con la superior dan una estimacion en O(#landmarks).
+
+Las tablas dependen del grafo: si cambia (graph.version sube), la siguiente
+consulta las recalcula para los mismos landmarks, igual que ShortestPathCache
+descarta sus entradas. Asi nunca se usan cotas viejas, que tras agregar una
+arista o bajar un peso podrian dejar de ser admisibles.
+"""
+import math
+from array import array
+from typing import List, Tuple
+
+
+class LandmarkOracle:
+    def __init__(self, graph, k: int = 4, strategy: str = "farthest"):
+        """
+        graph: WeightedGraph con pesos no negativos.
+        k: numero de landmarks.
+        strategy: "farthest" (cada nuevo landmark es el nodo mas lejano a
+                  los ya elegidos) o "degree" (los k nodos de mayor grado).
+        """
+        self.graph = graph
+        self.n = graph.n
+        self._version = graph.version
+        self.rebuilds = 0
+        # Grafo invertido congelado: Dijkstra sobre el da las distancias d(v, L)
+        self._reverso = graph.to_csr().reverse()
+        self.landmarks: List[int] = []
+        self.dist_from: List[array] = []  # dist_from[i][v] = d(L_i, v)
+        self.dist_to: List[array] = []    # dist_to[i][v] = d(v, L_i)
+
+        if strategy == "farthest":
+            self._elegir_lejanos(k)
+        elif strategy == "degree":
+            self._elegir_por_grado(k)
+        else:
+            raise ValueError(f"Estrategia desconocida: {strategy}")
+
+    def refresh(self):
+        """Recalcula las tablas de los landmarks actuales sobre el grafo actual."""
+        landmarks = self.landmarks
+        self.landmarks, self.dist_from, self.dist_to = [], [], []
+        self._reverso = self.graph.to_csr().reverse()
+        for landmark in landmarks:
+            self._agregar(landmark)
+        self._version = self.graph.version
+        self.rebuilds += 1
+
+    def _vigente(self):
+        if self.graph.version != self._version:
+            self.refresh()
+
+    def _agregar(self, landmark: int):
+        """Precalcula y guarda (como array('d') compactos) las tablas de un landmark."""
+        desde, _ = self.graph.dijkstra(landmark)
+        hacia, _ = self._reverso.dijkstra(landmark)
+        self.landmarks.append(landmark)
+        self.dist_from.append(array('d', desde))
+        self.dist_to.append(array('d', hacia))
+
+    def _elegir_lejanos(self, k: int):
+        if self.n == 0:
+            return
+        # Arrancamos con el nodo de mayor grado de salida
+        self._agregar(max(range(self.n), key=lambda v: len(self.graph.adj[v])))
+        # cercania[v] = min sobre landmarks de d(L, v) + d(v, L)
+        cercania = [a + b for a, b in zip(self.dist_from[0], self.dist_to[0])]
+        while len(self.landmarks) < min(k, self.n):
+            elegidos = set(self.landmarks)
+            candidatos = [v for v in range(self.n)
+                          if v not in elegidos and not math.isinf(cercania[v])]
+            if not candidatos:
+                # Lo que queda no se conecta con ningun landmark: tomar cualquiera
+                candidatos = [v for v in range(self.n) if v not in elegidos]
+            nuevo = max(candidatos, key=lambda v: cercania[v])
+            self._agregar(nuevo)
+            for v in range(self.n):
+                cercania[v] = min(cercania[v], self.dist_from[-1][v] + self.dist_to[-1][v])
+
+    def _elegir_por_grado(self, k: int):
+        radj = self.graph.reverse_adj()
+        grado = lambda v: len(self.graph.adj[v]) + len(radj[v])
+        for v in sorted(range(self.n), key=grado, reverse=True)[:k]:
+            self._agregar(v)
+
+    def lower_bound(self, u: int, t: int) -> float:
+        """Cota inferior de d(u, t). Se puede usar como heuristica de A*."""
+        self._vigente()
+        mejor = 0
+        for desde, hacia in zip(self.dist_from, self.dist_to):
+            # inf - inf no da informacion; inf - finito si (t inalcanzable)
+            a, b = desde[t], desde[u]
+            if not (math.isinf(a) and math.isinf(b)) and a - b > mejor:
+                mejor = a - b
+            a, b = hacia[u], hacia[t]
+            if not (math.isinf(a) and math.isinf(b)) and a - b > mejor:
+                mejor = a - b
+        return mejor
+
+    def upper_bound(self, u: int, t: int) -> float:
+        """Cota superior de d(u, t): el mejor desvio pasando por un landmark."""
+        self._vigente()
+        return min((hacia[u] + desde[t] for desde, hacia in zip(self.dist_from, self.dist_to)),
+                   default=math.inf)
+
+    def estimate(self, u: int, t: int) -> Tuple[float, float]:
+        """Intervalo (inferior, superior) para d(u, t) en O(#landmarks)."""
+        return self.lower_bound(u, t), self.upper_bound(u, t)
+
+    def shortest_path(self, src: int, dst: int) -> Tuple[float, List[int]]:
+        """Ruta exacta con A* guiado por las cotas de los landmarks."""
+        if math.isinf(self.lower_bound(src, dst)):
+            return math.inf, []
+        return self.graph.shortest_path(src, dst, "astar", self.lower_bound)
+
+    def nbytes(self) -> int:
+        """Bytes de las tablas precalculadas."""
+        return sum(t.itemsize * len(t) for t in self.dist_from + self.dist_to)
@@ -1,5 +1,7 @@
 import heapq
 
+from union_find import UnionFind
+
 class GraphMST:
     """
     Clase para calcular arboles generadores minimos (MST).
@@ -22,11 +24,16 @@ class GraphMST:
         self.adj[u].append((v, w))
         self.adj[v].append((u, w))
     
-    def prim_mst(self, start_node=0):
+    def prim_mst(self, start_node=0, queue="heapq"):
         """
         Algoritmo de Prim para MST.
         Empieza desde start_node y va agregando aristas baratas.
+        queue: "heapq" o una cola con decrease-key de priority_queues.py
+        ("binary", "pairing", "bucket").
         """
+        if queue != "heapq":
+            return self._prim_indexado(start_node, queue)
+        
         visited = [False] * self.V
         pq = []
         
@@ -53,38 +60,49 @@ class GraphMST:
         
         return mst_edges, mst_cost
     
-    # En esta parte tome ayuda de la IA para implementar Union-Find correctamente
-    class DSU:
+    def _prim_indexado(self, start_node, queue):
         """
-        Estructura Union-Find (Disjoint Set Union).
-        Sirve para detectar si agregar una arista crea un ciclo.
+        Prim con decrease-key: cada nodo esta una sola vez en la cola con la
+        arista mas barata que lo conecta al arbol (best[v]).
         """
+        from priority_queues import make_queue
         
-        def __init__(self, n):
-            self.parent = list(range(n))
-            self.rank = [0] * n
+        visited = [False] * self.V
+        best = {}  # v -> (peso, u)
+        pq = make_queue(queue)
+        pq.push(start_node, 0)
         
-        def find(self, i):
-            """Encuentra la raiz del conjunto que contiene a i"""
-            if self.parent[i] != i:
-                self.parent[i] = self.find(self.parent[i])
-            return self.parent[i]
+        mst_edges = []
+        mst_cost = 0
         
-        def union(self, i, j):
-            """Une los conjuntos que contienen a i y j"""
-            root_i = self.find(i)
-            root_j = self.find(j)
+        while pq:
+            v, weight = pq.pop()
+            visited[v] = True
+            if v != start_node:
+                mst_edges.append((best[v][1], v, weight))
+                mst_cost += weight
             
-            if root_i != root_j:
-                if self.rank[root_i] < self.rank[root_j]:
-                    self.parent[root_i] = root_j
-                elif self.rank[root_i] > self.rank[root_j]:
-                    self.parent[root_j] = root_i
-                else:
-                    self.parent[root_j] = root_i
-                    self.rank[root_i] += 1
-                return True
-            return False
+            for next_node, next_weight in self.adj[v]:
+                if visited[next_node]:
+                    continue
+                if next_node not in best or next_weight < best[next_node][0]:
+                    best[next_node] = (next_weight, v)
+                    pq.push(next_node, next_weight)
+        
+        return mst_edges, mst_cost
+
+    def prim_dense(self, start_node=0):
+        """
+        Prim O(V^2) sobre la matriz de adyacencia con NumPy (ver
+        dense_prim.py). Conviene en grafos completos o casi completos.
+        """
+        from dense_prim import adjacency_matrix, prim_dense
+        return prim_dense(adjacency_matrix(self), start_node)
+
+    # En esta parte tome ayuda de la IA para implementar Union-Find correctamente
+    # Union-Find iterativo sobre array('i') (ver union_find.py). Se deja el
+    # nombre DSU para no romper codigo que use GraphMST.DSU(n).
+    DSU = UnionFind
     
     def kruskal_mst(self):
         """
@@ -104,6 +122,23 @@ class GraphMST:
         
         return mst_edges, mst_cost
 
+    def filter_kruskal_mst(self, threshold=1024):
+        """
+        Kruskal con filtrado (ver filter_kruskal.py): parte las aristas por
+        un pivote y descarta las internas antes de ordenar las pesadas.
+        """
+        from filter_kruskal import filter_kruskal
+        return filter_kruskal(self.V, self.edges, threshold)
+
+    def boruvka_mst(self, workers=1):
+        """
+        Algoritmo de Boruvka vectorizado con NumPy (ver boruvka.py).
+        Mismo costo que Kruskal, sin ordenar todas las aristas.
+        workers > 1 reparte la eleccion de minimos entre procesos.
+        """
+        from boruvka import boruvka_mst
+        return boruvka_mst(self, workers)
+
 
 if __name__ == "__main__":
     print("=== PRUEBA DE PRIM Y KRUSKAL ===\n")
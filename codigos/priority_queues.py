@@ -0,0 +1,332 @@
+"""
+Colas de prioridad con decrease-key para Dijkstra, Prim y Huffman.
+
+heapq con borrado perezoso mete una entrada nueva cada vez que mejora una
+distancia y deja las viejas dentro del heap (hasta O(m) entradas). Estas
+colas guardan cada elemento una sola vez y actualizan su prioridad en el
+lugar, asi el tamano nunca pasa de n.
+
+Todas tienen la misma interfaz:
+    push(item, prioridad)  inserta, o baja la prioridad si el item ya esta
+                           (si la nueva no es menor, no hace nada)
+    pop()                  saca y retorna (item, prioridad) con prioridad minima
+    len(q), item in q, q.priority(item)
+y cuentan `pushes` (inserciones + decrementos efectivos) y `max_size`.
+
+- LazyHeap: heapq con borrado perezoso, igual que el codigo original; sirve
+  de referencia para comparar (pushes y max_size incluyen entradas viejas).
+- IndexedBinaryHeap: heap binario con indice item -> posicion.
+- PairingHeap: decrease-key O(1) amortizado, pop O(log n) amortizado.
+- BucketQueue: cola de Dial sobre un anillo de cubetas (una por prioridad
+  entera dentro de la ventana viva, O(C) cubetas con pesos <= C); O(1) por
+  operacion mas el recorrido de cubetas vacias. Solo prioridades enteras
+  no negativas.
+"""
+import heapq
+from itertools import count
+from typing import Union
+
+
+class LazyHeap:
+    def __init__(self):
+        self._heap = []                # (prioridad, desempate, item)
+        self._prio = {}                # item -> prioridad vigente
+        self._desempate = count()      # Evita comparar items con la misma prioridad
+        self.pushes = 0
+        self.max_size = 0
+
+    def __len__(self):
+        return len(self._prio)
+
+    def __contains__(self, item):
+        return item in self._prio
+
+    def priority(self, item):
+        return self._prio[item]
+
+    def push(self, item, prioridad):
+        if item in self._prio and prioridad >= self._prio[item]:
+            return
+        # La entrada anterior del item queda en el heap como basura
+        self._prio[item] = prioridad
+        heapq.heappush(self._heap, (prioridad, next(self._desempate), item))
+        self.max_size = max(self.max_size, len(self._heap))
+        self.pushes += 1
+
+    def pop(self):
+        while self._heap:
+            prioridad, _, item = heapq.heappop(self._heap)
+            if self._prio.get(item) == prioridad:
+                del self._prio[item]
+                return item, prioridad
+        raise IndexError("pop de una cola vacia")
+
+
+class IndexedBinaryHeap:
+    def __init__(self):
+        self._heap = []    # items
+        self._prio = {}    # item -> prioridad
+        self._pos = {}     # item -> indice en _heap
+        self.pushes = 0
+        self.max_size = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __contains__(self, item):
+        return item in self._pos
+
+    def priority(self, item):
+        return self._prio[item]
+
+    def push(self, item, prioridad):
+        if item in self._pos:
+            if prioridad >= self._prio[item]:
+                return
+            self._prio[item] = prioridad
+            self._subir(self._pos[item])
+        else:
+            self._prio[item] = prioridad
+            self._pos[item] = len(self._heap)
+            self._heap.append(item)
+            self._subir(len(self._heap) - 1)
+            self.max_size = max(self.max_size, len(self._heap))
+        self.pushes += 1
+
+    def pop(self):
+        if not self._heap:
+            raise IndexError("pop de una cola vacia")
+        heap = self._heap
+        tope = heap[0]
+        ultimo = heap.pop()
+        if heap:
+            heap[0] = ultimo
+            self._pos[ultimo] = 0
+            self._bajar(0)
+        del self._pos[tope]
+        return tope, self._prio.pop(tope)
+
+    def _subir(self, i):
+        heap, prio, pos = self._heap, self._prio, self._pos
+        item = heap[i]
+        p = prio[item]
+        while i > 0:
+            padre = (i - 1) >> 1
+            if prio[heap[padre]] <= p:
+                break
+            heap[i] = heap[padre]
+            pos[heap[i]] = i
+            i = padre
+        heap[i] = item
+        pos[item] = i
+
+    def _bajar(self, i):
+        heap, prio, pos = self._heap, self._prio, self._pos
+        n = len(heap)
+        item = heap[i]
+        p = prio[item]
+        while True:
+            hijo = 2 * i + 1
+            if hijo >= n:
+                break
+            if hijo + 1 < n and prio[heap[hijo + 1]] < prio[heap[hijo]]:
+                hijo += 1
+            if prio[heap[hijo]] >= p:
+                break
+            heap[i] = heap[hijo]
+            pos[heap[i]] = i
+            i = hijo
+        heap[i] = item
+        pos[item] = i
+
+
+class _NodoPairing:
+    __slots__ = ("item", "prioridad", "hijo", "hermano", "previo")
+
+    def __init__(self, item, prioridad):
+        self.item = item
+        self.prioridad = prioridad
+        self.hijo = None
+        self.hermano = None
+        self.previo = None  # Padre si es el primer hijo, si no el hermano anterior
+
+
+class PairingHeap:
+    def __init__(self):
+        self._raiz = None
+        self._nodos = {}  # item -> _NodoPairing
+        self.pushes = 0
+        self.max_size = 0
+
+    def __len__(self):
+        return len(self._nodos)
+
+    def __contains__(self, item):
+        return item in self._nodos
+
+    def priority(self, item):
+        return self._nodos[item].prioridad
+
+    @staticmethod
+    def _unir(a, b):
+        """Une dos raices; la de mayor prioridad queda como primer hijo de la otra."""
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if b.prioridad < a.prioridad:
+            a, b = b, a
+        b.previo = a
+        b.hermano = a.hijo
+        if a.hijo is not None:
+            a.hijo.previo = b
+        a.hijo = b
+        a.hermano = None
+        a.previo = None
+        return a
+
+    def push(self, item, prioridad):
+        nodo = self._nodos.get(item)
+        if nodo is None:
+            nodo = _NodoPairing(item, prioridad)
+            self._nodos[item] = nodo
+            self._raiz = self._unir(self._raiz, nodo)
+            self.max_size = max(self.max_size, len(self._nodos))
+        else:
+            if prioridad >= nodo.prioridad:
+                return
+            nodo.prioridad = prioridad
+            if nodo is not self._raiz:
+                # Cortar el subarbol de nodo y volver a unirlo con la raiz
+                if nodo.previo.hijo is nodo:
+                    nodo.previo.hijo = nodo.hermano
+                else:
+                    nodo.previo.hermano = nodo.hermano
+                if nodo.hermano is not None:
+                    nodo.hermano.previo = nodo.previo
+                nodo.hermano = None
+                nodo.previo = None
+                self._raiz = self._unir(self._raiz, nodo)
+        self.pushes += 1
+
+    def pop(self):
+        raiz = self._raiz
+        if raiz is None:
+            raise IndexError("pop de una cola vacia")
+        del self._nodos[raiz.item]
+
+        # Dos pasadas, iterativo: primero se unen los hijos por pares de
+        # izquierda a derecha y luego se acumulan de derecha a izquierda
+        pares = []
+        hijo = raiz.hijo
+        while hijo is not None:
+            a = hijo
+            b = a.hermano
+            hijo = b.hermano if b is not None else None
+            a.hermano = a.previo = None
+            if b is not None:
+                b.hermano = b.previo = None
+            pares.append(self._unir(a, b))
+        nueva = None
+        for arbol in reversed(pares):
+            nueva = self._unir(arbol, nueva)
+        self._raiz = nueva
+        return raiz.item, raiz.prioridad
+
+
+class BucketQueue:
+    """
+    Cola de Dial circular: las prioridades vivas siempre caben en una
+    ventana [cursor, cursor + k), asi que basta un anillo de k cubetas
+    indexado por prioridad % k. En Dijkstra y Prim con pesos <= C la
+    ventana nunca pasa de C + 1, de modo que la memoria es O(C) y no crece
+    con la distancia maxima. No hace falta conocer C: si una prioridad cae
+    fuera de la ventana, el anillo se duplica y se redistribuye.
+    """
+
+    def __init__(self, cubetas=64):
+        self._cubetas = [{} for _ in range(cubetas)]  # dict = conjunto ordenado
+        self._prio = {}      # item -> prioridad
+        self._cursor = 0     # Ningun item tiene prioridad menor que el cursor
+        self._tope = 0       # Cota superior de las prioridades vivas
+        self.pushes = 0
+        self.max_size = 0
+
+    def __len__(self):
+        return len(self._prio)
+
+    def __contains__(self, item):
+        return item in self._prio
+
+    def priority(self, item):
+        return self._prio[item]
+
+    def _redimensionar(self, k):
+        cubetas = [{} for _ in range(k)]
+        for item, prioridad in self._prio.items():
+            cubetas[prioridad % k][item] = None
+        self._cubetas = cubetas
+
+    def push(self, item, prioridad):
+        if prioridad < 0 or prioridad != int(prioridad):
+            raise ValueError("BucketQueue solo admite prioridades enteras no negativas")
+        prioridad = int(prioridad)
+        anterior = self._prio.get(item)
+        if anterior is not None:
+            if prioridad >= anterior:
+                return
+            del self._cubetas[anterior % len(self._cubetas)][item]
+            del self._prio[item]
+
+        if self._prio:
+            # En Dijkstra las prioridades nunca bajan del minimo actual; en
+            # Prim si pueden, y entonces el cursor retrocede
+            self._cursor = min(self._cursor, prioridad)
+            self._tope = max(self._tope, prioridad)
+        else:
+            self._cursor = self._tope = prioridad
+        if self._tope - self._cursor >= len(self._cubetas):
+            self._redimensionar(max(2 * len(self._cubetas), self._tope - self._cursor + 1))
+
+        self._cubetas[prioridad % len(self._cubetas)][item] = None
+        self._prio[item] = prioridad
+        self.max_size = max(self.max_size, len(self._prio))
+        self.pushes += 1
+
+    def pop(self):
+        if not self._prio:
+            raise IndexError("pop de una cola vacia")
+        cubetas, k = self._cubetas, len(self._cubetas)
+        # Dentro de la ventana cada cubeta tiene una sola prioridad posible
+        while not cubetas[self._cursor % k]:
+            self._cursor += 1
+        cubeta = cubetas[self._cursor % k]
+        item = next(iter(cubeta))
+        del cubeta[item]
+        del self._prio[item]
+        return item, self._cursor
+
+
+COLAS = {
+    "lazy": LazyHeap,
+    "binary": IndexedBinaryHeap,
+    "pairing": PairingHeap,
+    "bucket": BucketQueue,
+}
+
+# Lo que aceptan los parametros queue: un nombre de COLAS o una cola ya creada
+Cola = Union[str, LazyHeap, IndexedBinaryHeap, PairingHeap, BucketQueue]
+
+
+def make_queue(queue):
+    """
+    Crea una cola por nombre ("lazy", "binary", "pairing" o "bucket").
+    Si se pasa una cola ya creada (vacia) se usa tal cual; asi quien llama
+    puede leer sus contadores al terminar.
+    """
+    if not isinstance(queue, str):
+        return queue
+    try:
+        return COLAS[queue]()
+    except KeyError:
+        raise ValueError(f"Cola de prioridad desconocida: {queue}") from None
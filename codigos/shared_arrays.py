@@ -0,0 +1,60 @@
+"""
+Arreglos NumPy en memoria compartida para repartir trabajo entre procesos
+(lo usan delta_stepping.py y boruvka.py).
+
+El proceso principal copia los arreglos una sola vez con compartir() y abre
+el pool con crear_pool(); cada trabajador se adjunta al iniciar y los lee
+con arreglos_trabajador() sin copiarlos. Al terminar, el principal suelta
+sus vistas y llama a liberar().
+"""
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+_trabajador = {}
+
+
+def _inicializar_trabajador(descriptores):
+    bloques, arreglos = [], []
+    for nombre, dtype, largo in descriptores:
+        shm = shared_memory.SharedMemory(name=nombre)
+        bloques.append(shm)
+        arreglos.append(np.ndarray((largo,), dtype=dtype, buffer=shm.buf))
+    _trabajador["arreglos"] = arreglos
+    _trabajador["bloques"] = bloques
+
+
+def arreglos_trabajador():
+    """Vistas compartidas, en el orden en que se pasaron a compartir()."""
+    return _trabajador["arreglos"]
+
+
+def compartir(arreglos):
+    """
+    Copia ndarrays 1D a memoria compartida. Retorna (vistas, bloques,
+    descriptores): las vistas reemplazan a los originales en el proceso
+    principal y los descriptores se pasan a crear_pool().
+    """
+    vistas, bloques, descriptores = [], [], []
+    for arreglo in arreglos:
+        shm = shared_memory.SharedMemory(create=True, size=max(1, arreglo.nbytes))
+        vista = np.ndarray(arreglo.shape, dtype=arreglo.dtype, buffer=shm.buf)
+        vista[:] = arreglo
+        vistas.append(vista)
+        bloques.append(shm)
+        descriptores.append((shm.name, arreglo.dtype.str, len(arreglo)))
+    return vistas, bloques, descriptores
+
+
+def crear_pool(workers, descriptores):
+    """Pool de procesos cuyos trabajadores se adjuntan a los descriptores."""
+    return ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_trabajador,
+                               initargs=(descriptores,))
+
+
+def liberar(bloques):
+    """Cierra y borra los bloques. Antes hay que soltar todas las vistas."""
+    for shm in bloques:
+        shm.close()
+        shm.unlink()
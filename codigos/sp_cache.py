@@ -0,0 +1,88 @@
+"""
+Cache de arboles de caminos minimos por origen.
+
+Guarda el resultado (dist, parent) de WeightedGraph.dijkstra para los
+origenes mas consultados (depositos, estaciones) con expulsion LRU. Cada
+entrada queda ligada a graph.version: cualquier cambio en las aristas
+(add_edge, etc.) sube la version y vacia el cache en la siguiente consulta.
+"""
+import sys
+from collections import OrderedDict
+from typing import List, Tuple
+
+
+class ShortestPathCache:
+    def __init__(self, graph, max_entries: int = 128, max_bytes: int = None):
+        """
+        max_entries: maximo de origenes guardados.
+        max_bytes: presupuesto aproximado de memoria (None = sin limite).
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries debe ser positivo")
+        self.graph = graph
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entradas = OrderedDict()  # src -> (dist, parent, bytes)
+        self._version = graph.version
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, src: int) -> Tuple[List[float], List[int]]:
+        """
+        (dist, parent) desde src, igual que graph.dijkstra(src).
+        Las listas devueltas son las del cache: no deben modificarse.
+        """
+        if self.graph.version != self._version:
+            self.invalidate()
+
+        entrada = self._entradas.get(src)
+        if entrada is not None:
+            self.hits += 1
+            self._entradas.move_to_end(src)
+            return entrada[0], entrada[1]
+
+        self.misses += 1
+        dist, parent = self.graph.dijkstra(src)
+        tam = sys.getsizeof(dist) + sys.getsizeof(parent)
+        self._entradas[src] = (dist, parent, tam)
+        self.bytes += tam
+        self._expulsar()
+        return dist, parent
+
+    def _expulsar(self):
+        """Saca los menos usados hasta respetar los limites (siempre queda el ultimo)."""
+        while len(self._entradas) > 1 and (
+                len(self._entradas) > self.max_entries
+                or (self.max_bytes is not None and self.bytes > self.max_bytes)):
+            _, (_, _, tam) = self._entradas.popitem(last=False)
+            self.bytes -= tam
+            self.evictions += 1
+
+    def invalidate(self):
+        """Vacia el cache y lo alinea con la version actual del grafo."""
+        if self._entradas:
+            self.invalidations += 1
+        self._entradas.clear()
+        self.bytes = 0
+        self._version = self.graph.version
+
+    def __contains__(self, src: int) -> bool:
+        return self.graph.version == self._version and src in self._entradas
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self._entradas),
+            "bytes": self.bytes,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
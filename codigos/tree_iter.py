@@ -0,0 +1,56 @@
+"""
+Recorridos en orden compartidos por los arboles binarios de busqueda (BST y
+AVL). Solo asumen nodos con valor, izquierdo y derecho, y un atributo raiz
+en el arbol.
+"""
+
+_SIN_LIMITE = object()  # Marca de "sin valor inicial" en los iteradores
+
+
+class RecorridoEnOrden:
+    """Mixin con __iter__, __reversed__ e iter_from para arboles con raiz."""
+
+    @staticmethod
+    def _nodos_inorden(nodo, desde=_SIN_LIMITE, reverso=False):
+        """
+        Genera los nodos del subarbol en orden (o en orden inverso), con una
+        pila explicita de O(altura). Con desde, empieza en el primer valor
+        >= desde (o <= desde si reverso) sin visitar los anteriores.
+        """
+        pila = []
+        # Bajar hasta el primer valor en rango; quedan apilados los pendientes
+        while nodo is not None:
+            if desde is _SIN_LIMITE or (nodo.valor <= desde if reverso else nodo.valor >= desde):
+                pila.append(nodo)
+                nodo = nodo.derecho if reverso else nodo.izquierdo
+            else:
+                nodo = nodo.izquierdo if reverso else nodo.derecho
+        while pila:
+            nodo = pila.pop()
+            yield nodo
+            nodo = nodo.izquierdo if reverso else nodo.derecho
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.derecho if reverso else nodo.izquierdo
+
+    def __iter__(self):
+        """Itera los valores en orden, sin armar una lista."""
+        for nodo in self._nodos_inorden(self.raiz):
+            yield nodo.valor
+
+    def __reversed__(self):
+        """Itera los valores de mayor a menor."""
+        for nodo in self._nodos_inorden(self.raiz, reverso=True):
+            yield nodo.valor
+
+    def iter_from(self, valor, reverso=False):
+        """
+        Itera en orden desde el primer valor >= valor (o, con reverso, de
+        mayor a menor desde el primer valor <= valor). Cuesta O(altura) para
+        empezar y O(1) amortizado por elemento; se puede cortar en cualquier
+        momento (p. ej. con itertools.islice).
+
+        No se debe modificar el arbol mientras se itera.
+        """
+        for nodo in self._nodos_inorden(self.raiz, valor, reverso):
+            yield nodo.valor
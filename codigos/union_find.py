@@ -0,0 +1,158 @@
+"""
+Union-Find (Disjoint Set Union) sobre arreglos.
+
+- parent y size son array('i'): 4 bytes por elemento en lugar de listas de
+  objetos int.
+- find es iterativo con path halving (cada nodo del camino pasa a apuntar a
+  su abuelo), asi que no hay recursion ni RecursionError en cadenas largas.
+- union por tamano: el arbol chico cuelga del grande, altura O(log n).
+
+Modo rollback: se guarda un registro (undo log) de cada union para poder
+deshacerlas en orden inverso con rollback(). En este modo find no comprime
+caminos (la compresion no se podria deshacer), pero la union por tamano
+mantiene la altura en O(log n). Es la base de la conectividad dinamica
+fuera de linea (ver components_after_closures).
+
+Reemplaza a la clase DSU que estaba en mst.py; en esa parte tome ayuda de la
+IA para implementar Union-Find correctamente (ver "Uso de IA" en README.txt).
+"""
+from array import array
+from typing import Iterable, List, Tuple
+
+
+class UnionFind:
+    def __init__(self, n: int, rollback: bool = False):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self.count = n  # Numero de componentes
+        self.rollback_mode = rollback
+        self._log = []  # Raices que se colgaron (solo en modo rollback)
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def find(self, i: int) -> int:
+        """Raiz del conjunto que contiene a i."""
+        parent = self.parent
+        if self.rollback_mode:
+            while parent[i] != i:
+                i = parent[i]
+            return i
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # Path halving
+            i = parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> bool:
+        """Une los conjuntos de i y j. Retorna False si ya estaban unidos."""
+        ri, rj = self.find(i), self.find(j)
+        if ri == rj:
+            return False
+        if self.size[ri] < self.size[rj]:
+            ri, rj = rj, ri
+        self.parent[rj] = ri
+        self.size[ri] += self.size[rj]
+        self.count -= 1
+        if self.rollback_mode:
+            self._log.append(rj)
+        return True
+
+    def connected(self, i: int, j: int) -> bool:
+        return self.find(i) == self.find(j)
+
+    def component_size(self, i: int) -> int:
+        return self.size[self.find(i)]
+
+    def union_many(self, pares: Iterable[Tuple[int, int]]) -> int:
+        """Aplica union a cada par; retorna cuantas uniones fueron efectivas."""
+        union = self.union
+        return sum(1 for i, j in pares if union(i, j))
+
+    def find_many(self, elementos: Iterable[int]) -> List[int]:
+        """Raices de varios elementos de una vez."""
+        find = self.find
+        return [find(i) for i in elementos]
+
+    # --- Rollback ---------------------------------------------------------
+    def snapshot(self) -> int:
+        """Marca el estado actual; se vuelve a el con rollback(marca)."""
+        if not self.rollback_mode:
+            raise ValueError("snapshot requiere UnionFind(n, rollback=True)")
+        return len(self._log)
+
+    def rollback(self, marca: int = 0):
+        """Deshace, en orden inverso, las uniones hechas despues de la marca."""
+        if not self.rollback_mode:
+            raise ValueError("rollback requiere UnionFind(n, rollback=True)")
+        parent, size, log = self.parent, self.size, self._log
+        while len(log) > marca:
+            rj = log.pop()
+            ri = parent[rj]  # Sin compresion, sigue apuntando a la raiz de entonces
+            size[ri] -= size[rj]
+            parent[rj] = rj
+            self.count += 1
+
+
+def components_after_closures(n: int, edges: List[Tuple[int, int]],
+                              closures: List[Iterable[int]]) -> List[int]:
+    """
+    Conectividad dinamica fuera de linea: para cada escenario de cierre
+    (lista de indices de aristas cerradas) retorna cuantas componentes
+    quedan en el grafo no dirigido. Un resultado > 1 significa que ese
+    cierre desconecta la ciudad.
+
+    Cada arista esta presente en los escenarios donde no se cierra; esos
+    intervalos de escenarios se cuelgan de un arbol de segmentos y un
+    recorrido en profundidad une al entrar a cada nodo y hace rollback al
+    salir. Costo O((m + total de cierres) log q log n) para q escenarios,
+    en lugar de reconstruir el Union-Find por escenario.
+    """
+    q = len(closures)
+    if q == 0:
+        return []
+
+    cerrada_en = [[] for _ in edges]
+    for escenario, cerradas in enumerate(closures):
+        for e in cerradas:
+            cerrada_en[e].append(escenario)
+
+    arbol = [[] for _ in range(4 * q)]
+
+    def colgar(nodo, lo, hi, a, b, e):
+        """Agrega la arista e a los nodos que cubren [a, b) dentro de [lo, hi)."""
+        if b <= lo or hi <= a:
+            return
+        if a <= lo and hi <= b:
+            arbol[nodo].append(e)
+            return
+        mid = (lo + hi) // 2
+        colgar(2 * nodo, lo, mid, a, b, e)
+        colgar(2 * nodo + 1, mid, hi, a, b, e)
+
+    for e, cierres in enumerate(cerrada_en):
+        inicio = 0
+        for escenario in sorted(set(cierres)) + [q]:
+            if inicio < escenario:
+                colgar(1, 0, q, inicio, escenario, e)
+            inicio = escenario + 1
+
+    dsu = UnionFind(n, rollback=True)
+    resultado = [0] * q
+    # Recorrido iterativo: (nodo, lo, hi, marca); marca None = entrando
+    pila = [(1, 0, q, None)]
+    while pila:
+        nodo, lo, hi, marca = pila.pop()
+        if marca is not None:
+            dsu.rollback(marca)
+            continue
+        marca = dsu.snapshot()
+        for e in arbol[nodo]:
+            dsu.union(*edges[e])
+        pila.append((nodo, lo, hi, marca))  # Para deshacer al salir
+        if hi - lo == 1:
+            resultado[lo] = dsu.count
+        else:
+            mid = (lo + hi) // 2
+            pila.append((2 * nodo + 1, mid, hi, None))
+            pila.append((2 * nodo, lo, mid, None))
+    return resultado
@@ -0,0 +1,51 @@
+"""Grafos de ejemplo y verificaciones que comparten las pruebas de grafos."""
+import random
+from WeightedGraph import WeightedGraph
+from union_find import UnionFind
+
+def grafo_ejemplo():
+    """La red de 6 nodos del ejemplo de WeightedGraph.py."""
+    g = WeightedGraph(6)
+    g.add_edge(0, 1, 10); g.add_edge(0, 2, 5)
+    g.add_edge(1, 3, 3); g.add_edge(2, 3, 2); g.add_edge(2, 4, 8)
+    g.add_edge(3, 4, 4); g.add_edge(1, 5, 15); g.add_edge(4, 5, 7)
+    return g
+
+def grafo_aleatorio(n, m, semilla, min_peso=1, max_peso=50, clase=WeightedGraph):
+    """m aristas al azar (con lazos y paralelas); clase puede ser GraphMST."""
+    rnd = random.Random(semilla)
+    g = clase(n)
+    for _ in range(m):
+        g.add_edge(rnd.randrange(n), rnd.randrange(n), rnd.randint(min_peso, max_peso))
+    return g
+
+def grafo_simple(n, m, semilla, max_peso=20, potencial=0):
+    """
+    Dirigido sin lazos ni paralelas. Con potencial > 0 suma pot[u] - pot[v]
+    a cada peso: hay pesos negativos pero ningun ciclo negativo.
+    """
+    rnd = random.Random(semilla)
+    pot = [rnd.randint(0, potencial) for _ in range(n)]
+    g = WeightedGraph(n)
+    vistas = set()
+    for _ in range(m):
+        u, v = rnd.randrange(n), rnd.randrange(n)
+        if u == v or (u, v) in vistas:
+            continue  # floyd_warshall de Python se queda con la ultima paralela
+        vistas.add((u, v))
+        g.add_edge(u, v, rnd.randint(1, max_peso) + pot[u] - pot[v])
+    return g
+
+def costo_camino(g, camino):
+    total = 0
+    for u, v in zip(camino, camino[1:]):
+        total += min(w for x, w in g.adj[u] if x == v)
+    return total
+
+def es_bosque_generador(g, aristas):
+    """Las aristas de un GraphMST no forman ciclos y conectan lo mismo que g."""
+    uf = UnionFind(g.V)
+    assert all(uf.union(u, v) for u, v, _ in aristas)
+    completo = UnionFind(g.V)
+    completo.union_many((u, v) for u, v, _ in g.edges)
+    return uf.count == completo.count
@@ -1,3 +1,5 @@
+import random
+import threading
 import unittest
 from avl import AVL
 
@@ -156,5 +158,299 @@ class TestAVL(unittest.TestCase):
         # La altura real debe estar cerca de la esperada
         self.assertLessEqual(altura_real, altura_esperada + 5)
 
+
+class TestAVLEstadisticosOrden(unittest.TestCase):
+    
+    def setUp(self):
+        self.avl = AVL()
+        self.valores = list(range(0, 200, 2))  # 0, 2, ..., 198
+        random.Random(1).shuffle(self.valores)
+        for v in self.valores:
+            self.avl.insertar(v)
+        self.valores.sort()
+    
+    def test_tamanos_consistentes(self):
+        """El tamano de cada nodo es 1 + tamano de sus hijos"""
+        def verificar(nodo):
+            if nodo is None:
+                return 0
+            tam = 1 + verificar(nodo.izquierdo) + verificar(nodo.derecho)
+            self.assertEqual(nodo.tamano, tam)
+            return tam
+        self.assertEqual(verificar(self.avl.raiz), 100)
+        self.assertEqual(len(self.avl), 100)
+        self.avl.insertar(50)  # Duplicado: no cambia tamanos
+        self.assertEqual(len(self.avl), 100)
+    
+    def test_rank(self):
+        self.assertEqual(self.avl.rank(0), 0)
+        self.assertEqual(self.avl.rank(1), 1)
+        self.assertEqual(self.avl.rank(2), 1)
+        self.assertEqual(self.avl.rank(100), 50)
+        self.assertEqual(self.avl.rank(1000), 100)
+        self.assertEqual(self.avl.rank(-5), 0)
+    
+    def test_select(self):
+        for k, v in enumerate(self.valores):
+            self.assertEqual(self.avl.select(k), v)
+        self.assertEqual(self.avl.select(-1), 198)
+        with self.assertRaises(IndexError):
+            self.avl.select(100)
+        with self.assertRaises(IndexError):
+            AVL().select(0)
+    
+    def test_range(self):
+        self.assertEqual(self.avl.range(10, 20), [10, 12, 14, 16, 18])
+        self.assertEqual(self.avl.range(11, 13), [12])
+        self.assertEqual(self.avl.range(-10, 3), [0, 2])
+        self.assertEqual(self.avl.range(197, 500), [198])
+        self.assertEqual(self.avl.range(20, 10), [])
+        self.assertEqual(self.avl.range(-1, 1000), self.valores)
+        self.assertEqual(AVL().range(0, 10), [])
+    
+    def test_iteradores(self):
+        self.assertEqual(list(self.avl), self.valores)
+        self.assertEqual(list(reversed(self.avl)), self.valores[::-1])
+        self.assertEqual(list(self.avl.iter_from(191)), [192, 194, 196, 198])
+        self.assertEqual(list(self.avl.iter_from(7, reverso=True)), [6, 4, 2, 0])
+        self.assertEqual(next(self.avl.iter_from(100)), 100)
+        self.assertEqual(list(AVL().iter_from(3)), [])
+    
+    def test_range_aleatorio(self):
+        rnd = random.Random(2)
+        for _ in range(200):
+            lo, hi = rnd.randrange(-10, 210), rnd.randrange(-10, 210)
+            esperado = [v for v in self.valores if lo <= v < hi]
+            self.assertEqual(self.avl.range(lo, hi), esperado)
+            self.assertEqual(self.avl.count_range(lo, hi), len(esperado))
+
+
+class TestAVLEliminarJoinSplit(unittest.TestCase):
+    
+    def verificar(self, arbol, esperado):
+        """Contenido, orden, balance, alturas y tamanos correctos"""
+        def revisar(nodo):
+            if nodo is None:
+                return 0, 0
+            h_izq, t_izq = revisar(nodo.izquierdo)
+            h_der, t_der = revisar(nodo.derecho)
+            self.assertLessEqual(abs(h_izq - h_der), 1)
+            self.assertEqual(nodo.altura, 1 + max(h_izq, h_der))
+            self.assertEqual(nodo.tamano, 1 + t_izq + t_der)
+            return nodo.altura, nodo.tamano
+        revisar(arbol.raiz)
+        self.assertEqual([v for v, fb in arbol.inorden()], sorted(esperado))
+    
+    def test_eliminar_casos(self):
+        avl = AVL()
+        for v in [50, 30, 70, 20, 40, 60, 80, 10]:
+            avl.insertar(v)
+        avl.eliminar(10)   # Hoja
+        avl.eliminar(30)   # Dos hijos
+        avl.eliminar(50)   # Raiz
+        avl.eliminar(999)  # No existe
+        self.verificar(avl, [20, 40, 60, 70, 80])
+    
+    def test_eliminar_rebalancea(self):
+        avl = AVL()
+        for v in [20, 10, 30, 5]:
+            avl.insertar(v)
+        avl.eliminar(30)  # Desbalance LL al borrar
+        self.assertEqual(avl.raiz.valor, 10)
+        self.verificar(avl, [5, 10, 20])
+    
+    def test_eliminar_aleatorio(self):
+        rnd = random.Random(4)
+        avl, esperado = AVL(), set()
+        for _ in range(2000):
+            v = rnd.randrange(300)
+            if rnd.random() < 0.55:
+                avl.insertar(v)
+                esperado.add(v)
+            else:
+                avl.eliminar(v)
+                esperado.discard(v)
+        self.verificar(avl, esperado)
+    
+    def test_from_sorted(self):
+        avl = AVL.from_sorted(range(1000))
+        self.verificar(avl, range(1000))
+        self.assertEqual(avl.altura(avl.raiz), 10)
+        self.assertEqual(avl.select(500), 500)
+        self.verificar(AVL.from_sorted([]), [])
+        with self.assertRaises(ValueError):
+            AVL.from_sorted([1, 3, 3])
+    
+    def test_join(self):
+        for n1, n2 in [(0, 5), (5, 0), (1, 1), (3, 200), (200, 3), (100, 120)]:
+            a = AVL.from_sorted(range(n1))
+            b = AVL.from_sorted(range(1000, 1000 + n2))
+            a.join(b)
+            self.verificar(a, list(range(n1)) + list(range(1000, 1000 + n2)))
+            self.assertIsNone(b.raiz)
+    
+    def test_join_desordenado(self):
+        a = AVL.from_sorted([1, 5])
+        b = AVL.from_sorted([3, 9])
+        with self.assertRaises(ValueError):
+            a.join(b)
+        # Un join rechazado no pierde datos en ninguno de los dos arboles
+        self.verificar(a, [1, 5])
+        self.verificar(b, [3, 9])
+    
+    def test_split(self):
+        for corte in [-5, 0, 1, 250, 499, 500, 10000]:
+            avl = AVL.from_sorted(range(0, 1000, 2))
+            menores, mayores = avl.split(corte)
+            self.verificar(menores, [v for v in range(0, 1000, 2) if v < corte])
+            self.verificar(mayores, [v for v in range(0, 1000, 2) if v >= corte])
+            self.assertIsNone(avl.raiz)
+    
+    def test_split_y_join_vuelven_al_original(self):
+        avl = AVL()
+        valores = random.Random(5).sample(range(5000), 700)
+        for v in valores:
+            avl.insertar(v)
+        menores, mayores = avl.split(2500)
+        menores.join(mayores)
+        self.verificar(menores, valores)
+
+
+class TestAVLPersistente(unittest.TestCase):
+    
+    def contenido(self, arbol):
+        return list(arbol)
+    
+    def ids(self, arbol):
+        return {id(n) for n in arbol._nodos_inorden(arbol.raiz)}
+    
+    def test_buscar(self):
+        avl = AVL()
+        for v in [5, 3, 8]:
+            avl.insertar(v)
+        self.assertTrue(avl.buscar(3))
+        self.assertFalse(avl.buscar(4))
+    
+    def test_snapshots_no_cambian(self):
+        avl = AVL(persistente=True)
+        versiones = []
+        esperado = set()
+        rnd = random.Random(6)
+        for _ in range(1500):
+            v = rnd.randrange(400)
+            if rnd.random() < 0.6:
+                avl.insertar(v)
+                esperado.add(v)
+            else:
+                avl.eliminar(v)
+                esperado.discard(v)
+            if rnd.random() < 0.05:
+                versiones.append((avl.snapshot(), sorted(esperado)))
+        for foto, valores in versiones:
+            self.assertEqual(self.contenido(foto), valores)
+            self.assertEqual(len(foto), len(valores))
+        self.assertEqual(self.contenido(avl), sorted(esperado))
+    
+    def test_copia_solo_el_camino(self):
+        avl = AVL.from_sorted(range(0, 20000, 2), persistente=True)
+        foto = avl.snapshot()
+        antes = self.ids(foto)
+        avl.insertar(7777)
+        nuevos = self.ids(avl) - antes
+        # Camino de ~14 niveles mas los nodos de las rotaciones
+        self.assertLessEqual(len(nuevos), 3 * avl.altura(avl.raiz))
+        self.assertFalse(foto.buscar(7777))
+        self.assertTrue(avl.buscar(7777))
+        avl.eliminar(10000)
+        self.assertTrue(foto.buscar(10000))
+        self.assertLessEqual(len(self.ids(avl) - antes), 6 * avl.altura(avl.raiz))
+    
+    def test_rotaciones_no_copian_dos_veces(self):
+        avl = AVL(persistente=True)
+        copiados = []
+        mutable = avl._mutable
+        def contar(nodo):
+            copia = mutable(nodo)
+            if copia is not nodo:
+                copiados.append(id(nodo))
+            return copia
+        avl._mutable = contar
+        rnd = random.Random(8)
+        for i in range(600):
+            foto, valores = avl.snapshot(), list(avl)
+            antes = self.ids(foto)
+            copiados.clear()
+            if i % 3 == 2:
+                avl.eliminar(rnd.choice(list(avl)))
+            else:
+                avl.insertar(i)  # En orden: rota casi siempre
+            # Solo se copian nodos de la versión anterior, cada uno una vez
+            self.assertLessEqual(set(copiados), antes)
+            self.assertEqual(len(copiados), len(set(copiados)))
+            self.assertEqual(self.contenido(foto), valores)
+    
+    def test_operaciones_no_tocan_versiones_viejas(self):
+        avl = AVL.from_sorted(range(100), persistente=True)
+        foto = avl.snapshot()
+        avl.insertar(100)          # No modifica nada: duplicado no copia
+        avl.insertar(50)
+        avl.eliminar(1000)
+        menores, mayores = avl.split(40)
+        menores.join(mayores)
+        menores.eliminar(0)
+        self.assertEqual(self.contenido(foto), list(range(100)))
+        self.assertEqual(self.contenido(menores), list(range(1, 101)))
+        self.assertTrue(menores.persistente)
+        # La foto tambien es persistente: escribir en ella no afecta al resto
+        foto.insertar(-1)
+        self.assertEqual(self.contenido(menores), list(range(1, 101)))
+    
+    def test_join_entre_modos(self):
+        p = AVL.from_sorted(range(10, 20), persistente=True)
+        foto = p.snapshot()
+        normal = AVL.from_sorted(range(5))
+        with self.assertRaises(ValueError):
+            normal.join(p)
+        self.assertEqual(self.contenido(foto), list(range(10, 20)))
+        self.assertEqual(self.contenido(p), list(range(10, 20)))
+        self.assertEqual(self.contenido(normal), list(range(5)))
+        with self.assertRaises(ValueError):
+            AVL().join(foto)  # Tambien con un arbol vacio
+        # Persistente que absorbe uno normal: las fotos siguen intactas
+        p.join(AVL.from_sorted(range(20, 30)))
+        p.insertar(30)
+        self.assertEqual(self.contenido(foto), list(range(10, 20)))
+        self.assertEqual(self.contenido(p), list(range(10, 31)))
+    
+    def test_snapshot_requiere_modo(self):
+        with self.assertRaises(ValueError):
+            AVL().snapshot()
+    
+    def test_lectores_concurrentes(self):
+        """Lectores recorren snapshots sin lock mientras un hilo inserta"""
+        avl = AVL(persistente=True)
+        terminado = threading.Event()
+        errores = []
+        
+        def escritor():
+            for v in random.Random(7).sample(range(100000), 5000):
+                avl.insertar(v)
+            terminado.set()
+        
+        def lector():
+            while not terminado.is_set():
+                foto = avl.snapshot()
+                valores = list(foto)
+                if valores != sorted(valores) or len(valores) != len(foto):
+                    errores.append(len(valores))
+        
+        hilos = [threading.Thread(target=escritor)] + [threading.Thread(target=lector) for _ in range(3)]
+        for h in hilos:
+            h.start()
+        for h in hilos:
+            h.join()
+        self.assertEqual(errores, [])
+        self.assertEqual(len(avl), 5000)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
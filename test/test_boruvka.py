@@ -0,0 +1,62 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from mst import GraphMST
+from boruvka import boruvka_mst
+from grafos_prueba import es_bosque_generador, grafo_aleatorio
+
+def test_ejemplo():
+    g = GraphMST(4)
+    g.add_edge(0, 1, 10)
+    g.add_edge(0, 2, 6)
+    g.add_edge(0, 3, 5)
+    g.add_edge(1, 3, 15)
+    g.add_edge(2, 3, 4)
+    edges, cost = g.boruvka_mst()
+    assert cost == 19
+    assert sorted(edges) == sorted(g.kruskal_mst()[0])
+
+@pytest.mark.parametrize("semilla", range(5))
+def test_igual_costo_que_kruskal(semilla):
+    # Pesos de 1 a 10: muchos empates
+    g = grafo_aleatorio(150, 600, semilla, max_peso=10, clase=GraphMST)
+    edges, cost = g.boruvka_mst()
+    assert cost == g.kruskal_mst()[1]
+    assert es_bosque_generador(g, edges)
+
+def test_no_conexo_y_pesos_flotantes():
+    g = GraphMST(7)
+    g.add_edge(0, 1, 0.5); g.add_edge(1, 2, 0.25); g.add_edge(0, 2, 0.1)
+    g.add_edge(4, 5, 2.5); g.add_edge(5, 5, 0.0)
+    edges, cost = g.boruvka_mst()
+    assert cost == pytest.approx(g.kruskal_mst()[1])
+    assert len(edges) == 3
+    assert es_bosque_generador(g, edges)
+
+def test_sin_aristas():
+    assert GraphMST(3).boruvka_mst() == ([], 0)
+
+def test_en_procesos():
+    g = grafo_aleatorio(300, 2000, semilla=9, max_peso=20, clase=GraphMST)
+    edges, cost = boruvka_mst(g, workers=2, parallel_threshold=1)
+    assert cost == g.kruskal_mst()[1]
+    assert es_bosque_generador(g, edges)
+
+def test_bosque_en_procesos():
+    # Dos componentes: las aristas vivas se acaban antes de llegar a n - 1
+    g = GraphMST(6)
+    g.add_edge(0, 1, 3); g.add_edge(1, 2, 1); g.add_edge(0, 2, 2)
+    g.add_edge(3, 4, 5); g.add_edge(4, 5, 4); g.add_edge(3, 5, 6)
+    edges, cost = boruvka_mst(g, workers=3, parallel_threshold=1)
+    assert cost == g.kruskal_mst()[1] == 12
+    assert es_bosque_generador(g, edges)
+
+def test_nodo_fuera_de_rango():
+    g = GraphMST(2)
+    g.edges.append((0, 5, 1))
+    with pytest.raises(IndexError):
+        g.boruvka_mst()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,90 @@
+import pytest
+import random
+from bplus_tree import BPlusTree, _Interno
+
+def verificar(arbol, esperado):
+    """Invariantes: claves ordenadas, ocupacion minima, hojas a igual nivel y enlazadas."""
+    esperado = sorted(esperado)
+    niveles_hoja = set()
+    pila = [(arbol.raiz, 1, None, None)]
+    while pila:
+        nodo, nivel, lo, hi = pila.pop()
+        claves = list(nodo.claves)
+        assert claves == sorted(set(claves))
+        assert all((lo is None or lo <= c) and (hi is None or c < hi) for c in claves)
+        es_raiz = nodo is arbol.raiz
+        if isinstance(nodo, _Interno):
+            assert len(nodo.hijos) == len(claves) + 1 <= arbol.orden
+            assert es_raiz or len(claves) >= arbol._min_interno
+            limites = [lo] + claves + [hi]
+            for i, hijo in enumerate(nodo.hijos):
+                pila.append((hijo, nivel + 1, limites[i], limites[i + 1]))
+        else:
+            assert len(claves) <= arbol.orden
+            assert es_raiz or len(claves) >= arbol._min_hoja
+            niveles_hoja.add(nivel)
+    assert len(niveles_hoja) == 1
+    assert list(arbol) == esperado
+    assert len(arbol) == len(esperado)
+
+@pytest.mark.parametrize("orden", [3, 4, 5, 64])
+@pytest.mark.parametrize("typecode", [None, 'q'])
+def test_operaciones_aleatorias(orden, typecode):
+    rnd = random.Random(orden)
+    arbol, esperado = BPlusTree(orden, typecode), set()
+    for paso in range(3000):
+        v = rnd.randrange(600)
+        if rnd.random() < 0.6:
+            arbol.insertar(v)
+            esperado.add(v)
+        else:
+            arbol.eliminar(v)
+            esperado.discard(v)
+        if paso % 300 == 0:
+            verificar(arbol, esperado)
+    verificar(arbol, esperado)
+    for v in range(-1, 601, 7):
+        assert arbol.buscar(v) == (v in esperado)
+    # Vaciar por completo
+    for v in list(esperado):
+        arbol.eliminar(v)
+    verificar(arbol, [])
+
+def test_interfaz_como_bst():
+    arbol = BPlusTree(orden=4)
+    assert arbol.inorden() == []
+    assert arbol.minimo() is None and arbol.maximo() is None
+    for v in [50, 30, 70, 20, 40, 60, 80, 50]:
+        arbol.insertar(v)
+    assert arbol.inorden() == [20, 30, 40, 50, 60, 70, 80]
+    assert arbol.minimo() == 20 and arbol.maximo() == 80
+    assert arbol.buscar(40) and not arbol.buscar(45)
+    arbol.eliminar(50)
+    arbol.eliminar(999)
+    assert arbol.inorden() == [20, 30, 40, 60, 70, 80]
+
+def test_rangos():
+    arbol = BPlusTree(orden=5, typecode='q')
+    for v in range(0, 1000, 3):
+        arbol.insertar(v)
+    assert arbol.range(10, 20) == [12, 15, 18]
+    assert arbol.range(-5, 4) == [0, 3]
+    assert arbol.range(995, 2000) == [996, 999]
+    assert arbol.range(20, 10) == []
+    assert arbol.range(0, 1000) == list(range(0, 1000, 3))
+    assert list(arbol.iter_from(991)) == [993, 996, 999]
+    assert next(arbol.iter_from(500)) == 501
+
+def test_altura_con_orden_grande():
+    arbol = BPlusTree(orden=64, typecode='q')
+    for v in range(100000):
+        arbol.insertar(v)
+    assert arbol.altura() <= 4
+    assert arbol.buscar(99999)
+
+def test_orden_invalido():
+    with pytest.raises(ValueError):
+        BPlusTree(orden=2)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
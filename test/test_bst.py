@@ -1,3 +1,6 @@
+import itertools
+import math
+import random
 import unittest
 from bst import BST
 
@@ -152,5 +155,107 @@ class TestBST(unittest.TestCase):
         self.assertEqual(self.bst.minimo(), 10)
         self.assertEqual(self.bst.maximo(), 50)
 
+    def test_insercion_ordenada_grande_sin_recursion(self):
+        """Miles de claves ordenadas ya no agotan el limite de recursion"""
+        n = 5000
+        for v in range(n):
+            self.bst.insertar(v)
+        self.assertEqual(len(self.bst), n)
+        self.assertEqual(self.bst.altura(), n)
+        self.assertTrue(self.bst.buscar(n - 1))
+        self.assertEqual(self.bst.inorden(), list(range(n)))
+        self.assertEqual(self.bst.postorden()[-1], 0)
+        self.bst.eliminar(0)
+        self.assertEqual(self.bst.minimo(), 1)
+    
+    def test_nodos_con_slots(self):
+        """Los nodos no tienen __dict__"""
+        self.bst.insertar(1)
+        self.assertFalse(hasattr(self.bst.raiz, "__dict__"))
+    
+    def test_iteradores(self):
+        """__iter__, reversed e iter_from producen los valores sin listas"""
+        valores = [50, 30, 70, 20, 40, 60, 80]
+        for v in valores:
+            self.bst.insertar(v)
+        self.assertEqual(list(self.bst), sorted(valores))
+        self.assertEqual(list(reversed(self.bst)), sorted(valores, reverse=True))
+        self.assertEqual(list(self.bst.iter_from(45)), [50, 60, 70, 80])
+        self.assertEqual(list(self.bst.iter_from(40)), [40, 50, 60, 70, 80])
+        self.assertEqual(list(self.bst.iter_from(45, reverso=True)), [40, 30, 20])
+        self.assertEqual(list(self.bst.iter_from(99)), [])
+        self.assertEqual(list(self.bst.iter_from(5, reverso=True)), [])
+        self.assertEqual(list(BST()), [])
+    
+    def test_iter_from_aleatorio(self):
+        """iter_from coincide con filtrar la lista ordenada"""
+        rnd = random.Random(8)
+        valores = rnd.sample(range(1000), 300)
+        for v in valores:
+            self.bst.insertar(v)
+        ordenados = sorted(valores)
+        for inicio in range(-5, 1005, 37):
+            self.assertEqual(list(self.bst.iter_from(inicio)),
+                             [v for v in ordenados if v >= inicio])
+            self.assertEqual(list(self.bst.iter_from(inicio, reverso=True)),
+                             [v for v in reversed(ordenados) if v <= inicio])
+    
+    def test_iteracion_perezosa_arbol_degenerado(self):
+        """Los primeros elementos salen sin recorrer todo el arbol"""
+        for v in range(3000):
+            self.bst.insertar(v)
+        self.assertEqual(list(itertools.islice(self.bst.iter_from(2990), 3)),
+                         [2990, 2991, 2992])
+        self.assertEqual(next(iter(self.bst)), 0)
+        self.assertEqual(next(reversed(self.bst)), 2999)
+        self.assertEqual(next(self.bst.iter_postorden()), 2999)
+
+
+class TestBSTScapegoat(unittest.TestCase):
+    
+    def setUp(self):
+        self.bst = BST(scapegoat=True)
+    
+    def assertAlturaLogaritmica(self):
+        n = len(self.bst)
+        limite = math.floor(math.log(max(n, 1)) / math.log(1 / self.bst.alpha)) + 1
+        self.assertLessEqual(self.bst.altura(), limite)
+    
+    def test_insercion_ordenada_balanceada(self):
+        """Claves ordenadas: la profundidad queda en O(log n)"""
+        for v in range(10000):
+            self.bst.insertar(v)
+        self.assertAlturaLogaritmica()
+        self.assertEqual(self.bst.inorden(), list(range(10000)))
+    
+    def test_operaciones_aleatorias(self):
+        """Mismo contenido que un set y altura acotada tras cada operacion"""
+        rnd = random.Random(3)
+        esperado = set()
+        for _ in range(3000):
+            v = rnd.randrange(500)
+            if rnd.random() < 0.6:
+                self.bst.insertar(v)
+                esperado.add(v)
+            else:
+                self.bst.eliminar(v)
+                esperado.discard(v)
+            self.assertAlturaLogaritmica()
+        self.assertEqual(self.bst.inorden(), sorted(esperado))
+        self.assertEqual(len(self.bst), len(esperado))
+    
+    def test_rebalancear(self):
+        """rebalancear deja un arbol perfectamente balanceado"""
+        arbol = BST()
+        for v in range(15):
+            arbol.insertar(v)
+        arbol.rebalancear()
+        self.assertEqual(arbol.altura(), 4)
+        self.assertEqual(arbol.preorden()[0], 7)
+    
+    def test_alpha_invalido(self):
+        with self.assertRaises(ValueError):
+            BST(scapegoat=True, alpha=0.5)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,68 @@
+import pytest
+import math
+from WeightedGraph import WeightedGraph
+from contraction_hierarchies import ContractionHierarchy
+from grafos_prueba import costo_camino, grafo_aleatorio
+
+def red_ciudad():
+    """Red de datos/red_ciudad.txt, con calles en ambos sentidos."""
+    aristas = [(0, 1, 5.2), (0, 2, 8.1), (1, 2, 3.5), (1, 3, 6.7), (2, 4, 4.8),
+               (3, 4, 2.9), (3, 5, 7.3), (4, 5, 5.6), (4, 6, 8.9), (5, 7, 6.4),
+               (6, 7, 3.2), (6, 8, 9.1), (7, 8, 4.7), (7, 9, 5.8), (8, 9, 3.3)]
+    g = WeightedGraph(10)
+    for u, v, w in aristas:
+        g.add_edge(u, v, w)
+        g.add_edge(v, u, w)
+    return g
+
+def verificar_contra_dijkstra(g, ch):
+    for src in range(g.n):
+        dist, _ = g.dijkstra(src)
+        for dst in range(g.n):
+            d, camino = ch.query(src, dst)
+            if math.isinf(dist[dst]):
+                assert math.isinf(d) and camino == []
+            else:
+                assert d == pytest.approx(dist[dst])
+                assert camino[0] == src and camino[-1] == dst
+                assert costo_camino(g, camino) == pytest.approx(d)
+
+def test_red_ciudad():
+    g = red_ciudad()
+    ch = ContractionHierarchy.build(g)
+    verificar_contra_dijkstra(g, ch)
+    assert ch.distance(0, 9) == pytest.approx(g.dijkstra(0)[0][9])
+
+@pytest.mark.parametrize("semilla", [1, 2, 3])
+def test_grafo_dirigido_aleatorio(semilla):
+    g = grafo_aleatorio(30, 90, semilla)
+    verificar_contra_dijkstra(g, ContractionHierarchy.build(g))
+
+def test_limite_testigo_bajo_sigue_siendo_exacto():
+    g = grafo_aleatorio(25, 80, 4)
+    verificar_contra_dijkstra(g, ContractionHierarchy.build(g, max_settled=1))
+
+def test_rangos_son_permutacion():
+    ch = ContractionHierarchy.build(red_ciudad())
+    assert sorted(ch.rank) == list(range(10))
+    for u in range(10):
+        assert all(ch.rank[x] > ch.rank[u] for x, _ in ch.up[u])
+        assert all(ch.rank[x] > ch.rank[u] for x, _ in ch.down[u])
+
+def test_guardar_y_cargar(tmp_path):
+    g = red_ciudad()
+    ch = ContractionHierarchy.build(g)
+    ruta = tmp_path / "ciudad.ch.json"
+    ch.save(str(ruta))
+    cargada = ContractionHierarchy.load(str(ruta))
+    assert cargada.rank == ch.rank
+    verificar_contra_dijkstra(g, cargada)
+
+def test_pesos_negativos():
+    g = WeightedGraph(2)
+    g.add_edge(0, 1, -1)
+    with pytest.raises(ValueError):
+        ContractionHierarchy.build(g)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,51 @@
+import pytest
+import math
+from WeightedGraph import WeightedGraph
+from csr_graph import CSRGraph
+from grafos_prueba import grafo_ejemplo
+
+def test_estructura_csr():
+    csr = grafo_ejemplo().to_csr()
+    assert csr.n == 6
+    assert csr.m == 8
+    assert list(csr.offsets) == [0, 2, 4, 6, 7, 8, 8]
+    assert list(csr.neighbors(2)) == [(3, 2.0), (4, 8.0)]
+    assert csr.degree(5) == 0
+
+def test_dijkstra_igual_que_weighted_graph():
+    g = grafo_ejemplo()
+    csr = g.to_csr()
+    assert csr.dijkstra(0) == g.dijkstra(0)
+    assert csr.dijkstra(0)[0][5] == 18
+
+def test_dijkstra_disconnected():
+    g = WeightedGraph(3)
+    g.add_edge(0, 1, 10)
+    dist, parent = g.to_csr().dijkstra(0)
+    assert math.isinf(dist[2])
+    assert parent[2] == -1
+
+def test_floyd_warshall_igual_que_weighted_graph():
+    g = grafo_ejemplo()
+    assert g.to_csr().floyd_warshall() == g.floyd_warshall()
+
+def test_floyd_warshall_negative_cycle():
+    g = WeightedGraph(2)
+    g.add_edge(0, 1, -2)
+    g.add_edge(1, 0, -1)
+    with pytest.raises(ValueError):
+        g.to_csr().floyd_warshall()
+
+def test_from_edges_y_reverse():
+    csr = CSRGraph.from_edges(3, [(2, 0, 1.5), (0, 1, 2.0), (0, 2, 4.0)])
+    assert list(csr.neighbors(0)) == [(1, 2.0), (2, 4.0)]
+    rev = csr.reverse()
+    assert sorted(rev.edges()) == [(0, 2, 1.5), (1, 0, 2.0), (2, 0, 4.0)]
+
+def test_memoria_compacta():
+    csr = grafo_ejemplo().to_csr()
+    # 7 offsets de 8 bytes + 8 aristas de 4 + 8 bytes
+    assert csr.nbytes() == 7 * 8 + 8 * (4 + 8)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,69 @@
+import pytest
+import math
+import random
+
+np = pytest.importorskip("numpy")
+
+from WeightedGraph import WeightedGraph
+from delta_stepping import delta_stepping
+from grafos_prueba import grafo_aleatorio, grafo_ejemplo
+
+def padres_consistentes(g, dist, parent):
+    for v, p in enumerate(parent):
+        if p != -1:
+            assert dist[v] == dist[p] + min(w for x, w in g.adj[p] if x == v)
+
+def test_ejemplo():
+    g = grafo_ejemplo()
+    dist, parent = delta_stepping(g, 0, delta=3)
+    assert dist.tolist() == g.dijkstra(0)[0]
+    assert parent.tolist() == [-1, 0, 0, 2, 3, 4]
+
+@pytest.mark.parametrize("delta", [None, 0.5, 1, 7, 25, 1000])
+def test_igual_que_dijkstra(delta):
+    g = grafo_aleatorio(200, 900, semilla=1, min_peso=0)
+    for src in (0, 50, 199):
+        dist, parent = delta_stepping(g, src, delta=delta)
+        assert dist.tolist() == g.dijkstra(src)[0]
+        padres_consistentes(g, dist, parent)
+
+def test_pesos_flotantes_y_csr():
+    rnd = random.Random(2)
+    g = WeightedGraph(100)
+    for _ in range(400):
+        g.add_edge(rnd.randrange(100), rnd.randrange(100), rnd.random() * 10)
+    dist, _ = delta_stepping(g.to_csr(), 3, delta=2.5)
+    assert dist.tolist() == g.dijkstra(3)[0]
+
+def test_en_procesos():
+    g = grafo_aleatorio(300, 1500, semilla=3, min_peso=0)
+    dist, parent = delta_stepping(g, 0, delta=10, workers=2, parallel_threshold=1)
+    assert dist.tolist() == g.dijkstra(0)[0]
+    padres_consistentes(g, dist, parent)
+
+def test_inalcanzable():
+    g = WeightedGraph(3)
+    g.add_edge(0, 1, 4)
+    dist, parent = delta_stepping(g, 0)
+    assert math.isinf(dist[2]) and parent[2] == -1
+
+def test_redondeo_en_borde_de_cubeta():
+    # (floor(d / delta) + 1) * delta redondeaba a d y el ciclo no terminaba
+    g = WeightedGraph(2)
+    g.add_edge(0, 1, 2498.745)
+    dist, parent = g.delta_stepping(0, delta=0.005)
+    assert dist.tolist() == [0, 2498.745]
+    assert parent.tolist() == [-1, 0]
+
+def test_errores():
+    g = WeightedGraph(2)
+    g.add_edge(0, 1, -1)
+    with pytest.raises(ValueError):
+        delta_stepping(g, 0)
+    with pytest.raises(ValueError):
+        delta_stepping(grafo_ejemplo(), 0, delta=0)
+    with pytest.raises(IndexError):
+        delta_stepping(grafo_ejemplo(), 6)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
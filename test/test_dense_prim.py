@@ -0,0 +1,56 @@
+import pytest
+import math
+import random
+
+np = pytest.importorskip("numpy")
+
+from mst import GraphMST
+from dense_prim import adjacency_matrix, prim_dense
+
+def test_ejemplo():
+    g = GraphMST(4)
+    g.add_edge(0, 1, 10)
+    g.add_edge(0, 2, 6)
+    g.add_edge(0, 3, 5)
+    g.add_edge(1, 3, 15)
+    g.add_edge(2, 3, 4)
+    edges, cost = g.prim_dense()
+    assert cost == 19
+    assert sorted((min(u, v), max(u, v)) for u, v, _ in edges) == [(0, 1), (0, 3), (2, 3)]
+
+def test_grafo_completo_igual_que_kruskal():
+    rnd = random.Random(4)
+    puntos = [(rnd.random(), rnd.random()) for _ in range(120)]
+    g = GraphMST(len(puntos))
+    for i in range(len(puntos)):
+        for j in range(i + 1, len(puntos)):
+            g.add_edge(i, j, math.dist(puntos[i], puntos[j]))
+    edges, cost = g.prim_dense(start_node=17)
+    assert len(edges) == 119
+    assert cost == pytest.approx(g.kruskal_mst()[1])
+
+def test_matriz_directa_y_paralelas():
+    g = GraphMST(3)
+    g.add_edge(0, 1, 5)
+    g.add_edge(1, 0, 2)
+    g.add_edge(1, 2, 3)
+    g.add_edge(2, 2, 0)
+    W = adjacency_matrix(g)
+    assert W[0, 1] == W[1, 0] == 2
+    assert math.isinf(W[2, 2])
+    assert prim_dense(W)[1] == 5
+
+def test_componente_de_inicio():
+    g = GraphMST(5)
+    g.add_edge(0, 1, 1)
+    g.add_edge(3, 4, 2)
+    assert g.prim_dense(3) == ([(3, 4, 2.0)], 2.0)
+
+def test_errores():
+    with pytest.raises(ValueError):
+        prim_dense(np.zeros((2, 3)))
+    with pytest.raises(IndexError):
+        prim_dense(np.zeros((2, 2)), 2)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,60 @@
+import pytest
+import math
+import random
+
+np = pytest.importorskip("numpy")
+
+from WeightedGraph import WeightedGraph
+from contraction_hierarchies import ContractionHierarchy
+from distance_matrix import distance_table
+from grafos_prueba import grafo_aleatorio
+
+def esperada(g, origenes, destinos):
+    filas = []
+    for s in origenes:
+        dist, _ = g.dijkstra(s)
+        filas.append([dist[t] for t in destinos])
+    return np.array(filas, dtype=np.float32)
+
+@pytest.fixture(scope="module")
+def caso():
+    g = grafo_aleatorio(60, 220, 1, max_peso=40)
+    rnd = random.Random(2)
+    origenes = [rnd.randrange(60) for _ in range(25)]
+    destinos = [rnd.randrange(60) for _ in range(18)]
+    return g, ContractionHierarchy.build(g), origenes, destinos
+
+def test_con_dijkstra(caso):
+    g, _, origenes, destinos = caso
+    tabla = distance_table(g, origenes, destinos)
+    assert tabla.dtype == np.float32
+    assert tabla.shape == (25, 18)
+    np.testing.assert_array_equal(tabla, esperada(g, origenes, destinos))
+
+def test_con_cubetas_ch(caso):
+    g, ch, origenes, destinos = caso
+    tabla = distance_table(ch, origenes, destinos)
+    np.testing.assert_array_equal(tabla, esperada(g, origenes, destinos))
+
+@pytest.mark.parametrize("usar_ch", [False, True])
+def test_lotes_en_procesos(caso, usar_ch):
+    g, ch, origenes, destinos = caso
+    tabla = distance_table(ch if usar_ch else g, origenes, destinos, workers=2, batch_size=4)
+    np.testing.assert_array_equal(tabla, esperada(g, origenes, destinos))
+
+def test_destinos_repetidos_e_inalcanzables():
+    g = WeightedGraph(4)
+    g.add_edge(0, 1, 2); g.add_edge(1, 2, 3)
+    tabla = distance_table(g, [0, 3], [2, 2, 3])
+    assert tabla[0].tolist() == [5, 5, math.inf]
+    assert tabla[1].tolist() == [math.inf, math.inf, 0]
+
+def test_sin_origenes():
+    assert distance_table(WeightedGraph(3), [], [0, 1]).shape == (0, 2)
+
+def test_nodo_invalido():
+    with pytest.raises(IndexError):
+        distance_table(WeightedGraph(3), [0], [5])
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,81 @@
+import pytest
+import random
+from mst import GraphMST
+from dynamic_mst import DynamicMST, LinkCutTree
+from union_find import UnionFind
+
+def costo_kruskal(n, aristas):
+    g = GraphMST(n)
+    for u, v, w in aristas:
+        g.add_edge(u, v, w)
+    return g.kruskal_mst()[1]
+
+def test_desde_graphmst():
+    g = GraphMST(4)
+    g.add_edge(0, 1, 10)
+    g.add_edge(0, 2, 6)
+    g.add_edge(0, 3, 5)
+    g.add_edge(1, 3, 15)
+    g.add_edge(2, 3, 4)
+    dm = DynamicMST.from_graph(g)
+    assert dm.cost == 19
+    assert sorted(dm.mst_edges()) == sorted(g.kruskal_mst()[0])
+    # Cerrar 0-3 obliga a usar 0-2
+    assert dm.delete_edge(3, 0) == 20
+    # Una calle nueva barata reemplaza a la mas cara del ciclo (0-1, peso 10)
+    assert dm.insert_edge(1, 2, 1) == 11
+    assert len(dm) == 5
+
+def test_borrar_no_arbol_y_paralelas():
+    dm = DynamicMST(3)
+    dm.insert_edge(0, 1, 5)
+    dm.insert_edge(0, 1, 2)
+    dm.insert_edge(1, 2, 3)
+    assert dm.cost == 5
+    assert dm.delete_edge(0, 1) == 5    # Se va la paralela cara (no-arbol)
+    assert dm.delete_edge(1, 0, 2) == 3  # Sin reemplazo: bosque
+    assert sorted(dm.mst_edges()) == [(1, 2, 3)]
+
+def test_errores():
+    dm = DynamicMST(3)
+    dm.insert_edge(0, 1, 1)
+    with pytest.raises(ValueError):
+        dm.delete_edge(1, 2)
+    with pytest.raises(ValueError):
+        dm.delete_edge(0, 1, 7)
+    with pytest.raises(IndexError):
+        dm.insert_edge(0, 3, 1)
+
+def test_actualizaciones_aleatorias_igual_que_reconstruir():
+    rnd = random.Random(3)
+    n = 40
+    dm = DynamicMST(n)
+    vivas = []
+    for paso in range(1500):
+        if vivas and rnd.random() < 0.45:
+            u, v, w = vivas.pop(rnd.randrange(len(vivas)))
+            dm.delete_edge(u, v, w)
+        else:
+            u, v, w = rnd.randrange(n), rnd.randrange(n), rnd.randint(1, 25)
+            vivas.append((u, v, w))
+            dm.insert_edge(u, v, w)
+        if paso % 25 == 0:
+            assert dm.cost == costo_kruskal(n, vivas)
+            uf = UnionFind(n)
+            assert all(uf.union(u, v) for u, v, _ in dm.mst_edges())
+    assert dm.cost == costo_kruskal(n, vivas)
+
+def test_link_cut_tree_camino_largo():
+    # Cadena de 50000 nodos: sin recursion en splay/access
+    n = 50000
+    lct = LinkCutTree(range(n))
+    for i in range(n - 1):
+        lct.link(i, i + 1)
+    assert lct.connected(0, n - 1)
+    assert lct.path_max(0, n // 2) == n // 2
+    lct.cut(100, 101)
+    assert not lct.connected(0, n - 1)
+    assert lct.find_root(5) == lct.find_root(100)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
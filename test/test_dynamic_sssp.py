@@ -0,0 +1,95 @@
+import pytest
+import math
+import random
+from WeightedGraph import WeightedGraph
+from dynamic_sssp import DynamicSSSP
+from grafos_prueba import grafo_ejemplo
+
+def verificar(sssp):
+    """Distancias iguales a un Dijkstra nuevo y padres consistentes."""
+    g = sssp.graph
+    esperado, _ = g.dijkstra(sssp.src)
+    assert sssp.dist == esperado
+    for v, p in enumerate(sssp.parent):
+        if p != -1:
+            assert v in sssp.children[p]
+            assert sssp.dist[v] == sssp.dist[p] + min(w for x, w in g.adj[p] if x == v)
+
+def test_cerrar_calle_del_arbol():
+    sssp = DynamicSSSP(grafo_ejemplo(), 0)
+    assert sssp.path(5) == [0, 2, 3, 4, 5]
+    cambiados = sssp.remove_edge(2, 3)
+    assert sssp.dist[5] == 20  # 0-1-3-4-5 (10+3+4+7=24) vs 0-2-4-5 (5+8+7=20)
+    assert cambiados == 3       # 3, 4 y 5
+    verificar(sssp)
+
+def test_cerrar_calle_fuera_del_arbol():
+    sssp = DynamicSSSP(grafo_ejemplo(), 0)
+    assert sssp.remove_edge(1, 5) == 0
+    verificar(sssp)
+
+def test_reabrir_calle():
+    sssp = DynamicSSSP(grafo_ejemplo(), 0)
+    sssp.remove_edge(2, 3)
+    sssp.add_edge(2, 3, 2)
+    assert sssp.dist[5] == 18
+    verificar(sssp)
+
+def test_subir_y_bajar_peso():
+    sssp = DynamicSSSP(grafo_ejemplo(), 0)
+    sssp.update_weight(0, 2, 20)
+    verificar(sssp)
+    sssp.update_weight(0, 2, 1)
+    assert sssp.dist[5] == 14
+    verificar(sssp)
+    assert sssp.update_weight(0, 2, 1) == 0
+
+def test_nodo_queda_inalcanzable():
+    g = WeightedGraph(3)
+    g.add_edge(0, 1, 1)
+    g.add_edge(1, 2, 1)
+    sssp = DynamicSSSP(g, 0)
+    sssp.remove_edge(0, 1)
+    assert math.isinf(sssp.dist[1]) and math.isinf(sssp.dist[2])
+    assert sssp.path(2) == []
+    verificar(sssp)
+
+def test_arista_inexistente():
+    sssp = DynamicSSSP(grafo_ejemplo(), 0)
+    with pytest.raises(ValueError):
+        sssp.remove_edge(5, 0)
+
+@pytest.mark.parametrize("semilla", [1, 2, 3])
+def test_secuencia_aleatoria(semilla):
+    rnd = random.Random(semilla)
+    g = WeightedGraph(30)
+    for _ in range(100):
+        g.add_edge(rnd.randrange(30), rnd.randrange(30), rnd.randint(1, 20))
+    sssp = DynamicSSSP(g, 0)
+    for _ in range(150):
+        u = rnd.randrange(30)
+        op = rnd.random()
+        if op < 0.35 and g.adj[u]:
+            sssp.remove_edge(u, rnd.choice(g.adj[u])[0])
+        elif op < 0.7 and g.adj[u]:
+            sssp.update_weight(u, rnd.choice(g.adj[u])[0], rnd.randint(1, 20))
+        else:
+            sssp.add_edge(u, rnd.randrange(30), rnd.randint(1, 20))
+        verificar(sssp)
+
+def test_cambio_por_fuera_recalcula():
+    g = grafo_ejemplo()
+    sssp = DynamicSSSP(g, 0)
+    g.add_edge(0, 5, 1)  # Directo sobre el grafo, sin pasar por sssp
+    assert sssp.path(5) == [0, 5]
+    assert sssp.recomputes == 1
+    verificar(sssp)
+    # Los cambios propios no fuerzan recalcular
+    sssp.remove_edge(2, 3)
+    g.update_weight(0, 5, 30)
+    sssp.update_weight(0, 1, 1)
+    assert sssp.recomputes == 2
+    verificar(sssp)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,60 @@
+import pytest
+from mst import GraphMST
+from filter_kruskal import filter_kruskal, streaming_mst, read_edges, write_edges
+from grafos_prueba import es_bosque_generador, grafo_aleatorio
+
+def test_ejemplo():
+    g = GraphMST(4)
+    g.add_edge(0, 1, 10)
+    g.add_edge(0, 2, 6)
+    g.add_edge(0, 3, 5)
+    g.add_edge(1, 3, 15)
+    g.add_edge(2, 3, 4)
+    edges, cost = g.filter_kruskal_mst(threshold=1)
+    assert cost == 19
+    assert sorted(edges) == sorted(g.kruskal_mst()[0])
+
+@pytest.mark.parametrize("threshold", [1, 8, 64, 10000])
+def test_igual_costo_que_kruskal(threshold):
+    g = grafo_aleatorio(200, 3000, semilla=threshold, max_peso=30, clase=GraphMST)
+    edges, cost = g.filter_kruskal_mst(threshold)
+    assert cost == g.kruskal_mst()[1]
+    assert es_bosque_generador(g, edges)
+
+def test_pesos_iguales():
+    g = grafo_aleatorio(50, 400, semilla=1, max_peso=1, clase=GraphMST)
+    edges, cost = filter_kruskal(g.V, g.edges, threshold=2)
+    assert cost == g.kruskal_mst()[1]
+    assert es_bosque_generador(g, edges)
+
+@pytest.mark.parametrize("chunk_size", [1, 37, 500, 100000])
+def test_streaming_desde_archivo(tmp_path, chunk_size):
+    g = grafo_aleatorio(120, 2000, semilla=4, max_peso=100, clase=GraphMST)
+    ruta = tmp_path / "aristas.txt"
+    write_edges(ruta, g.edges)
+    edges, cost = streaming_mst(ruta, g.V, chunk_size=chunk_size)
+    assert cost == g.kruskal_mst()[1]
+    assert es_bosque_generador(g, edges)
+
+def test_streaming_desde_iterable_no_conexo():
+    aristas = [(0, 1, 2.5), (1, 2, 1.0), (0, 2, 0.5), (3, 4, 7.0)]
+    edges, cost = streaming_mst(iter(aristas), 6, chunk_size=2)
+    assert cost == pytest.approx(8.5)
+    assert len(edges) == 3
+
+def test_read_edges(tmp_path):
+    ruta = tmp_path / "aristas.txt"
+    ruta.write_text("# u v w\n0 1 3\n\n1 2 0.5\n")
+    assert list(read_edges(ruta)) == [(0, 1, 3), (1, 2, 0.5)]
+    ruta.write_text("0 1\n")
+    with pytest.raises(ValueError):
+        list(read_edges(ruta))
+
+def test_errores():
+    with pytest.raises(ValueError):
+        streaming_mst([(0, 1, 1)], 2, chunk_size=0)
+    with pytest.raises(IndexError):
+        streaming_mst([(0, 2, 1)], 2)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,122 @@
+import pytest
+import math
+
+np = pytest.importorskip("numpy")
+
+from WeightedGraph import WeightedGraph
+from floyd_warshall import RouteTable, floyd_warshall_numpy, save_tables
+from grafos_prueba import costo_camino, grafo_ejemplo, grafo_simple
+
+def mismas_distancias(fw_lista, fw_np):
+    n = len(fw_lista)
+    for i in range(n):
+        for j in range(n):
+            if math.isinf(fw_lista[i][j]):
+                assert math.isinf(fw_np[i][j])
+            else:
+                assert fw_np[i][j] == pytest.approx(fw_lista[i][j])
+
+def test_numpy_simple():
+    g = WeightedGraph(3)
+    g.add_edge(0, 1, 4)
+    g.add_edge(1, 2, 2)
+    g.add_edge(2, 0, 3)
+    fw = g.floyd_warshall(engine="numpy")
+    assert fw[0][2] == 6  # 0-1-2
+
+@pytest.mark.parametrize("block_size", [None, 1, 4, 7, 100])
+def test_numpy_igual_que_python(block_size):
+    g = grafo_simple(23, 80, semilla=1, max_peso=30)
+    mismas_distancias(g.floyd_warshall(), floyd_warshall_numpy(g, block_size=block_size))
+
+@pytest.mark.parametrize("block_size", [None, 5])
+def test_pesos_negativos_sin_ciclo(block_size):
+    g = grafo_simple(17, 60, semilla=2, max_peso=30, potencial=20)
+    mismas_distancias(g.floyd_warshall(), floyd_warshall_numpy(g, block_size=block_size))
+
+@pytest.mark.parametrize("block_size", [None, 1])
+def test_numpy_negative_cycle(block_size):
+    g = WeightedGraph(3)
+    g.add_edge(0, 1, -2)
+    g.add_edge(1, 0, -1)
+    with pytest.raises(ValueError):
+        floyd_warshall_numpy(g, block_size=block_size)
+
+def test_float32_y_csr():
+    g = grafo_simple(12, 40, semilla=3, max_peso=30)
+    fw = floyd_warshall_numpy(g.to_csr(), dtype=np.float32, block_size=4)
+    assert fw.dtype == np.float32
+    mismas_distancias(g.floyd_warshall(), fw)
+
+def test_motor_desconocido():
+    with pytest.raises(ValueError):
+        WeightedGraph(2).floyd_warshall(engine="fortran")
+
+def rutas_validas(g, D, N):
+    for i in range(g.n):
+        for j in range(g.n):
+            camino = WeightedGraph.route(N, i, j)
+            if math.isinf(D[i][j]):
+                assert camino == []
+            else:
+                assert camino[0] == i and camino[-1] == j
+                assert costo_camino(g, camino) == pytest.approx(D[i][j])
+
+def test_floyd_warshall_next_hop():
+    g = grafo_ejemplo()
+    dist, nxt = g.floyd_warshall(next_hop=True)
+    assert dist == g.floyd_warshall()
+    assert WeightedGraph.route(nxt, 0, 5) == [0, 2, 3, 4, 5]
+    assert WeightedGraph.route(nxt, 4, 4) == [4]
+    assert WeightedGraph.route(nxt, 5, 0) == []
+    for i in range(6):
+        for j in range(6):
+            camino = WeightedGraph.route(nxt, i, j)
+            if camino:
+                assert costo_camino(g, camino) == dist[i][j]
+
+def test_route_con_next_hop_corrupto():
+    nxt = [[0, 1, 1], [0, 1, 0], [-1, -1, 2]]  # 0 -> 2 rebota entre 0 y 1
+    with pytest.raises(ValueError):
+        WeightedGraph.route(nxt, 0, 2)
+    nxt = [[0, 1, 1], [0, 1, -1], [-1, -1, 2]]  # 1 no sabe seguir hacia 2
+    with pytest.raises(ValueError):
+        WeightedGraph.route(nxt, 0, 2)
+
+@pytest.mark.parametrize("block_size", [None, 1, 4, 9])
+def test_next_hop_numpy(block_size):
+    g = grafo_simple(20, 70, semilla=5, max_peso=30, potencial=20)
+    D, N = floyd_warshall_numpy(g, block_size=block_size, next_hop=True)
+    assert N.dtype == np.int32
+    mismas_distancias(g.floyd_warshall(), D)
+    rutas_validas(g, D, N)
+
+def test_next_hop_motor_numpy():
+    g = grafo_simple(10, 30, semilla=6, max_peso=30)
+    D, N = g.floyd_warshall(engine="numpy", next_hop=True)
+    rutas_validas(g, D, N)
+
+def test_tablas_en_disco(tmp_path):
+    g = grafo_simple(15, 50, semilla=7, max_peso=30)
+    D, N = floyd_warshall_numpy(g, next_hop=True)
+    save_tables(str(tmp_path / "tablas"), D, N)
+    tabla = RouteTable.load(str(tmp_path / "tablas"))
+    assert isinstance(tabla.dist, np.memmap) and tabla.dist.dtype == np.float32
+    assert isinstance(tabla.next, np.memmap) and tabla.next.dtype == np.int32
+    for i in range(g.n):
+        for j in range(g.n):
+            assert tabla.route(i, j) == WeightedGraph.route(N, i, j)
+            if not math.isinf(D[i][j]):
+                assert tabla.distance(i, j) == pytest.approx(D[i][j])
+
+def test_route_table_en_memoria():
+    g = WeightedGraph(3)
+    g.add_edge(0, 1, 4)
+    g.add_edge(1, 2, 2)
+    tabla = RouteTable.from_graph(g)
+    assert tabla.route(0, 2) == [0, 1, 2]
+    assert tabla.route(2, 0) == []
+    assert tabla.distance(0, 2) == 6
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,55 @@
+import pytest
+import random
+from WeightedGraph import WeightedGraph
+from grafos_prueba import grafo_ejemplo
+
+def test_radio_simple():
+    dist, parent = grafo_ejemplo().dijkstra_bounded(0, 10)
+    assert dist == {0: 0, 2: 5, 3: 7, 1: 10}
+    assert parent == {0: -1, 2: 0, 3: 2, 1: 0}
+
+def test_radio_cero():
+    dist, parent = grafo_ejemplo().dijkstra_bounded(3, 0)
+    assert dist == {3: 0}
+
+def test_igual_que_filtrar_dijkstra():
+    rnd = random.Random(3)
+    g = WeightedGraph(80)
+    for _ in range(300):
+        g.add_edge(rnd.randrange(80), rnd.randrange(80), rnd.randint(1, 15))
+    completo, _ = g.dijkstra(0)
+    for radio in (0, 5, 12, 30, 1000):
+        dist, parent = g.dijkstra_bounded(0, radio)
+        assert dist == {v: d for v, d in enumerate(completo) if d <= radio}
+        for v, p in parent.items():
+            if p != -1:
+                assert p in dist
+
+def test_multiples_origenes():
+    g = grafo_ejemplo()
+    dist, origin = g.multi_source_bounded([0, 4], 7)
+    assert dist == {0: 0, 4: 0, 2: 5, 3: 7, 5: 7}
+    assert origin == {0: 0, 4: 4, 2: 0, 3: 0, 5: 4}
+
+def test_multiples_origenes_igual_que_minimo():
+    rnd = random.Random(4)
+    g = WeightedGraph(50)
+    for _ in range(200):
+        g.add_edge(rnd.randrange(50), rnd.randrange(50), rnd.randint(1, 10))
+    fuentes = [0, 10, 20]
+    tablas = {s: g.dijkstra(s)[0] for s in fuentes}
+    dist, origin = g.multi_source_bounded(fuentes, 8)
+    for v in range(50):
+        mejor = min(tablas[s][v] for s in fuentes)
+        if mejor <= 8:
+            assert dist[v] == mejor
+            assert tablas[origin[v]][v] == mejor
+        else:
+            assert v not in dist
+
+def test_origen_invalido():
+    with pytest.raises(IndexError):
+        grafo_ejemplo().dijkstra_bounded(9, 5)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
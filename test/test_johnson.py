@@ -0,0 +1,51 @@
+import pytest
+import math
+from WeightedGraph import WeightedGraph
+from johnson import bellman_ford_potentials, johnson, johnson_rows
+from grafos_prueba import grafo_simple
+
+def igual_a_floyd(g, matriz):
+    fw = g.floyd_warshall()
+    for i in range(g.n):
+        for j in range(g.n):
+            if math.isinf(fw[i][j]):
+                assert math.isinf(matriz[i][j])
+            else:
+                assert matriz[i][j] == pytest.approx(fw[i][j])
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_igual_que_floyd_warshall(workers):
+    g = grafo_simple(30, 120, 1, potencial=15)
+    igual_a_floyd(g, johnson(g, workers=workers))
+
+def test_generador_por_filas_en_orden():
+    g = grafo_simple(20, 60, 2, potencial=15)
+    fuentes = [src for src, _ in g.johnson(workers=2)]
+    assert fuentes == list(range(20))
+
+def test_fuentes_parciales():
+    g = grafo_simple(15, 50, 3, potencial=15)
+    filas = dict(johnson_rows(g, workers=1, sources=[4, 9]))
+    assert sorted(filas) == [4, 9]
+    assert list(filas[4]) == pytest.approx(g.floyd_warshall()[4])
+
+def test_potenciales_no_negativos():
+    g = grafo_simple(25, 90, 4, potencial=15)
+    csr = g.to_csr()
+    h = bellman_ford_potentials(csr)
+    for u, v, w in csr.edges():
+        assert w + h[u] - h[v] >= -1e-9
+
+def test_ciclo_negativo():
+    g = WeightedGraph(3)
+    g.add_edge(0, 1, 1)
+    g.add_edge(1, 2, -3)
+    g.add_edge(2, 0, 1)
+    with pytest.raises(ValueError):
+        johnson(g, workers=1)
+
+def test_grafo_vacio():
+    assert johnson(WeightedGraph(0), workers=1) == []
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
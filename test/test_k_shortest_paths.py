@@ -0,0 +1,65 @@
+import pytest
+import random
+from WeightedGraph import WeightedGraph
+from k_shortest_paths import yen_k_shortest_paths
+from grafos_prueba import grafo_ejemplo
+
+def todos_los_caminos(g, src, dst):
+    """Fuerza bruta: costos de todos los caminos simples, ordenados."""
+    # Un camino es una secuencia de nodos: de las paralelas cuenta la mas barata
+    vecinos = [{} for _ in range(g.n)]
+    for u in range(g.n):
+        for v, w in g.adj[u]:
+            vecinos[u][v] = min(w, vecinos[u].get(v, w))
+    costos = []
+    def dfs(u, visitados, costo):
+        if u == dst:
+            costos.append(costo)
+            return
+        for v, w in vecinos[u].items():
+            if v not in visitados:
+                visitados.add(v)
+                dfs(v, visitados, costo + w)
+                visitados.remove(v)
+    dfs(src, {src}, 0)
+    return sorted(costos)
+
+def test_rutas_ejemplo():
+    rutas = list(grafo_ejemplo().k_shortest_paths(0, 5, k=3))
+    assert rutas == [(18, [0, 2, 3, 4, 5]), (20, [0, 2, 4, 5]), (24, [0, 1, 3, 4, 5])]
+
+def test_generador_perezoso():
+    rutas = grafo_ejemplo().k_shortest_paths(0, 5)
+    assert next(rutas) == (18, [0, 2, 3, 4, 5])
+    assert next(rutas)[0] == 20
+
+def test_todas_las_rutas():
+    g = grafo_ejemplo()
+    rutas = list(g.k_shortest_paths(0, 5))
+    assert [c for c, _ in rutas] == todos_los_caminos(g, 0, 5)
+    assert len({tuple(p) for _, p in rutas}) == len(rutas)
+
+@pytest.mark.parametrize("semilla", [1, 2, 3, 4])
+def test_contra_fuerza_bruta(semilla):
+    rnd = random.Random(semilla)
+    g = WeightedGraph(9)
+    for _ in range(25):
+        u, v = rnd.randrange(9), rnd.randrange(9)
+        if u != v:
+            g.add_edge(u, v, rnd.randint(1, 9))
+    esperado = todos_los_caminos(g, 0, 8)
+    for k in (1, 3, 7, None):
+        rutas = list(yen_k_shortest_paths(g, 0, 8, k))
+        assert [c for c, _ in rutas] == esperado[:k]
+        for costo, camino in rutas:
+            assert camino[0] == 0 and camino[-1] == 8
+            assert len(set(camino)) == len(camino)
+
+def test_sin_ruta():
+    assert list(grafo_ejemplo().k_shortest_paths(5, 0, k=3)) == []
+
+def test_mismo_nodo():
+    assert list(grafo_ejemplo().k_shortest_paths(2, 2, k=3)) == [(0, [2])]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
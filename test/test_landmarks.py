@@ -0,0 +1,69 @@
+import pytest
+import math
+from WeightedGraph import WeightedGraph
+from landmarks import LandmarkOracle
+from grafos_prueba import grafo_aleatorio
+
+@pytest.mark.parametrize("strategy", ["farthest", "degree"])
+def test_cotas_validas(strategy):
+    g = grafo_aleatorio(40, 150, 1, max_peso=30)
+    oraculo = LandmarkOracle(g, k=4, strategy=strategy)
+    assert len(oraculo.landmarks) == 4
+    assert len(set(oraculo.landmarks)) == 4
+    for u in range(g.n):
+        dist, _ = g.dijkstra(u)
+        for t in range(g.n):
+            lo, hi = oraculo.estimate(u, t)
+            assert lo <= dist[t] <= hi
+
+@pytest.mark.parametrize("strategy", ["farthest", "degree"])
+def test_rutas_exactas(strategy):
+    g = grafo_aleatorio(40, 150, 2, max_peso=30)
+    oraculo = LandmarkOracle(g, k=3, strategy=strategy)
+    for u in range(0, 40, 3):
+        dist, _ = g.dijkstra(u)
+        for t in range(40):
+            d, camino = oraculo.shortest_path(u, t)
+            assert d == dist[t]
+            if camino:
+                assert camino[0] == u and camino[-1] == t
+
+def test_landmark_da_distancia_exacta():
+    g = WeightedGraph(4)
+    g.add_edge(0, 1, 2); g.add_edge(1, 2, 3); g.add_edge(2, 3, 4)
+    oraculo = LandmarkOracle(g, k=1, strategy="degree")
+    L = oraculo.landmarks[0]
+    assert oraculo.estimate(L, 3) == (g.dijkstra(L)[0][3], g.dijkstra(L)[0][3])
+
+def test_inalcanzable():
+    g = WeightedGraph(3)
+    g.add_edge(0, 1, 1)
+    oraculo = LandmarkOracle(g, k=2)
+    d, camino = oraculo.shortest_path(1, 0)
+    assert math.isinf(d) and camino == []
+
+def test_tablas_compactas():
+    g = grafo_aleatorio(10, 30, 3, max_peso=30)
+    oraculo = LandmarkOracle(g, k=2)
+    assert oraculo.nbytes() == 2 * 2 * 10 * 8
+
+def test_estrategia_desconocida():
+    with pytest.raises(ValueError):
+        LandmarkOracle(WeightedGraph(2), strategy="azar")
+
+def test_se_recalcula_si_cambia_el_grafo():
+    g = WeightedGraph(4)
+    g.add_edge(0, 1, 10); g.add_edge(1, 2, 10); g.add_edge(2, 3, 10)
+    oraculo = LandmarkOracle(g, k=2)
+    assert oraculo.lower_bound(0, 3) == 30
+    # Un atajo baja las distancias: las cotas viejas ya no serian admisibles
+    g.add_edge(0, 3, 1)
+    assert oraculo.lower_bound(0, 3) <= 1
+    assert oraculo.rebuilds == 1
+    assert oraculo.shortest_path(0, 3) == (1, [0, 3])
+    g.update_weight(0, 3, 50)
+    assert oraculo.shortest_path(0, 3) == (30, [0, 1, 2, 3])
+    assert oraculo.rebuilds == 2
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
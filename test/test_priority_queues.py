@@ -0,0 +1,128 @@
+import pytest
+import random
+from WeightedGraph import WeightedGraph
+from mst import GraphMST
+from huffman import Huffman
+from priority_queues import BucketQueue, COLAS, IndexedBinaryHeap, make_queue
+
+NOMBRES = list(COLAS)
+
+@pytest.mark.parametrize("nombre", NOMBRES)
+def test_pop_en_orden(nombre):
+    q = make_queue(nombre)
+    for item, p in [("a", 5), ("b", 1), ("c", 3), ("d", 4)]:
+        q.push(item, p)
+    assert len(q) == 4
+    assert [q.pop() for _ in range(4)] == [("b", 1), ("c", 3), ("d", 4), ("a", 5)]
+    assert len(q) == 0
+    with pytest.raises(IndexError):
+        q.pop()
+
+@pytest.mark.parametrize("nombre", NOMBRES)
+def test_decrease_key(nombre):
+    q = make_queue(nombre)
+    q.push("a", 10)
+    q.push("b", 7)
+    q.push("a", 2)
+    q.push("b", 9)  # No es menor: se ignora
+    assert q.priority("a") == 2 and q.priority("b") == 7
+    assert len(q) == 2
+    assert q.pop() == ("a", 2)
+    assert "a" not in q and "b" in q
+
+@pytest.mark.parametrize("nombre", NOMBRES)
+def test_operaciones_aleatorias(nombre):
+    rnd = random.Random(5)
+    q = make_queue(nombre)
+    referencia = {}
+    for _ in range(2000):
+        if referencia and rnd.random() < 0.3:
+            item, p = q.pop()
+            assert p == min(referencia.values())
+            assert referencia.pop(item) == p
+        else:
+            item, p = rnd.randrange(200), rnd.randrange(1000)
+            q.push(item, p)
+            if item not in referencia or p < referencia[item]:
+                referencia[item] = p
+        assert len(q) == len(referencia)
+
+@pytest.mark.parametrize("nombre", NOMBRES)
+def test_dijkstra_con_cola(nombre):
+    rnd = random.Random(1)
+    g = WeightedGraph(60)
+    for _ in range(300):
+        g.add_edge(rnd.randrange(60), rnd.randrange(60), rnd.randint(0, 20))
+    for src in (0, 17, 42):
+        assert g.dijkstra(src, queue=nombre)[0] == g.dijkstra(src)[0]
+
+@pytest.mark.parametrize("nombre", NOMBRES)
+def test_prim_con_cola(nombre):
+    rnd = random.Random(2)
+    g = GraphMST(40)
+    for v in range(1, 40):
+        g.add_edge(rnd.randrange(v), v, rnd.randint(1, 50))
+    for _ in range(100):
+        g.add_edge(rnd.randrange(40), rnd.randrange(40), rnd.randint(1, 50))
+    edges, cost = g.prim_mst(0, queue=nombre)
+    assert cost == g.kruskal_mst()[1]
+    assert len(edges) == 39
+
+@pytest.mark.parametrize("nombre", NOMBRES)
+def test_huffman_con_cola(nombre):
+    texto = "ABRACADABRA y algo mas de texto"
+    huff = Huffman()
+    huff.construir_arbol(texto, queue=nombre)
+    assert huff.decodificar(huff.codificar(texto)) == texto
+    referencia = Huffman()
+    referencia.construir_arbol(texto)
+    assert len(huff.codificar(texto)) == len(referencia.codificar(texto))
+
+def test_cola_sin_duplicados():
+    cola = IndexedBinaryHeap()
+    g = WeightedGraph(4)
+    g.add_edge(0, 1, 10); g.add_edge(0, 2, 1); g.add_edge(2, 1, 1)
+    g.add_edge(1, 3, 1); g.add_edge(2, 3, 5)
+    g.dijkstra(0, queue=cola)
+    assert cola.max_size <= 4
+    assert cola.pushes == 6  # 4 inserciones + 2 decrease-key
+
+def test_bucket_solo_enteros():
+    q = BucketQueue()
+    with pytest.raises(ValueError):
+        q.push("a", 1.5)
+    with pytest.raises(ValueError):
+        q.push("a", -1)
+
+def test_bucket_memoria_acotada_por_peso_maximo():
+    # Camino largo: distancias hasta ~50000 con pesos <= 10
+    n = 10000
+    g = WeightedGraph(n)
+    rnd = random.Random(2)
+    for u in range(n - 1):
+        g.add_edge(u, u + 1, rnd.randint(1, 10))
+        g.add_edge(u, min(n - 1, u + 3), rnd.randint(1, 10))
+    cola = BucketQueue()
+    assert g.dijkstra(0, queue=cola)[0] == g.dijkstra(0)[0]
+    assert len(cola._cubetas) <= 64
+
+def test_bucket_ventana_crece_y_retrocede():
+    # Prioridades que retroceden (como en Prim) y saltos mayores que el anillo
+    rnd = random.Random(5)
+    q, vivos = BucketQueue(cubetas=2), {}
+    for paso in range(3000):
+        if vivos and rnd.random() < 0.4:
+            item, prio = q.pop()
+            assert prio == min(vivos.values()) == vivos.pop(item)
+        else:
+            item, prio = rnd.randrange(200), rnd.randrange(1000)
+            q.push(item, prio)
+            vivos[item] = min(prio, vivos.get(item, prio))
+        assert len(q) == len(vivos)
+
+def test_cola_desconocida():
+    with pytest.raises(ValueError):
+        make_queue("fibonacci")
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,73 @@
+import pytest
+import math
+import random
+from WeightedGraph import WeightedGraph
+from grafos_prueba import costo_camino, grafo_ejemplo
+
+METODOS = ["dijkstra", "bidirectional", "astar"]
+
+def sin_heuristica(u, t):
+    return 0
+
+@pytest.mark.parametrize("method", METODOS)
+def test_ruta_simple(method):
+    d, camino = grafo_ejemplo().shortest_path(0, 5, method, sin_heuristica)
+    assert d == 18
+    assert camino == [0, 2, 3, 4, 5]
+
+@pytest.mark.parametrize("method", METODOS)
+def test_mismo_nodo(method):
+    assert grafo_ejemplo().shortest_path(3, 3, method, sin_heuristica) == (0, [3])
+
+@pytest.mark.parametrize("method", METODOS)
+def test_inalcanzable(method):
+    d, camino = grafo_ejemplo().shortest_path(5, 0, method, sin_heuristica)
+    assert math.isinf(d)
+    assert camino == []
+
+@pytest.mark.parametrize("method", METODOS)
+def test_igual_que_dijkstra_completo(method):
+    rnd = random.Random(7)
+    g = WeightedGraph(40)
+    for _ in range(160):
+        g.add_edge(rnd.randrange(40), rnd.randrange(40), rnd.randint(1, 20))
+    for src in range(0, 40, 5):
+        dist, _ = g.dijkstra(src)
+        for dst in range(40):
+            d, camino = g.shortest_path(src, dst, method, sin_heuristica)
+            assert d == dist[dst]
+            if camino:
+                assert camino[0] == src and camino[-1] == dst
+                assert costo_camino(g, camino) == d
+
+def test_astar_heuristica_euclidiana():
+    # Cuadricula 5x5 con pesos = distancia euclidiana entre celdas vecinas
+    coords = {r * 5 + c: (r, c) for r in range(5) for c in range(5)}
+    g = WeightedGraph(25)
+    for u, (r, c) in coords.items():
+        for dr, dc in ((0, 1), (1, 0), (1, 1)):
+            if r + dr < 5 and c + dc < 5:
+                g.add_edge(u, (r + dr) * 5 + c + dc, math.hypot(dr, dc))
+    h = lambda u, t: math.dist(coords[u], coords[t])
+    d, camino = g.shortest_path(0, 24, "astar", h)
+    assert d == pytest.approx(4 * math.sqrt(2))
+    assert camino == [0, 6, 12, 18, 24]
+
+def test_reverse_adj_se_mantiene():
+    g = grafo_ejemplo()
+    g.reverse_adj()
+    g.add_edge(5, 0, 1)
+    assert (5, 1) in g.reverse_adj()[0]
+    assert g.shortest_path(4, 2, "bidirectional")[0] == 13
+
+def test_errores():
+    g = grafo_ejemplo()
+    with pytest.raises(ValueError):
+        g.shortest_path(0, 5, "astar")
+    with pytest.raises(ValueError):
+        g.shortest_path(0, 5, "bfs")
+    with pytest.raises(IndexError):
+        g.shortest_path(0, 6)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,47 @@
+import pytest
+from sp_cache import ShortestPathCache
+from grafos_prueba import grafo_ejemplo
+
+def test_hit_y_miss():
+    g = grafo_ejemplo()
+    cache = ShortestPathCache(g)
+    primero = cache.get(0)
+    segundo = cache.get(0)
+    assert primero == g.dijkstra(0)
+    assert segundo is not None and segundo[0] is primero[0]
+    assert cache.hits == 1 and cache.misses == 1
+    assert cache.stats()["hit_rate"] == 0.5
+
+def test_lru_expulsa_el_menos_usado():
+    cache = ShortestPathCache(grafo_ejemplo(), max_entries=2)
+    cache.get(0)
+    cache.get(1)
+    cache.get(0)  # 0 pasa a ser el mas reciente
+    cache.get(2)  # expulsa a 1
+    assert 0 in cache and 2 in cache and 1 not in cache
+    assert cache.evictions == 1
+
+def test_presupuesto_de_bytes():
+    g = grafo_ejemplo()
+    cache = ShortestPathCache(g, max_bytes=1)
+    cache.get(0)
+    cache.get(1)
+    assert len(cache) == 1  # Siempre queda al menos la ultima entrada
+    assert 1 in cache
+
+def test_add_edge_invalida():
+    g = grafo_ejemplo()
+    cache = ShortestPathCache(g)
+    assert cache.get(0)[0][5] == 18
+    g.add_edge(0, 5, 1)
+    assert 0 not in cache
+    assert cache.get(0)[0][5] == 1
+    assert cache.invalidations == 1
+    assert cache.misses == 2
+
+def test_max_entries_invalido():
+    with pytest.raises(ValueError):
+        ShortestPathCache(grafo_ejemplo(), max_entries=0)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
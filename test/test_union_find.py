@@ -0,0 +1,100 @@
+import pytest
+import random
+from union_find import UnionFind, components_after_closures
+from mst import GraphMST
+
+def test_union_find_basico():
+    uf = UnionFind(6)
+    assert uf.count == 6
+    assert uf.union(0, 1)
+    assert uf.union(1, 2)
+    assert not uf.union(0, 2)
+    assert uf.connected(0, 2)
+    assert not uf.connected(0, 3)
+    assert uf.count == 4
+    assert uf.component_size(2) == 3
+    assert len(uf) == 6
+
+def test_bulk():
+    uf = UnionFind(8)
+    assert uf.union_many([(0, 1), (2, 3), (1, 0), (1, 3), (6, 7)]) == 4
+    raices = uf.find_many([0, 1, 2, 3, 4, 6, 7])
+    assert len(set(raices[:4])) == 1
+    assert raices[5] == raices[6] != raices[0]
+    assert uf.count == 4
+
+def test_cadena_larga_sin_recursion():
+    # Con la version recursiva este orden agotaba el limite de recursion
+    n = 200000
+    uf = UnionFind(n)
+    for i in range(n - 1):
+        uf.parent[i] = i + 1  # Cadena degenerada forzada
+    assert uf.find(0) == n - 1
+    assert uf.find(0) == n - 1
+
+def test_dsu_de_graphmst_es_union_find():
+    dsu = GraphMST.DSU(3)
+    assert isinstance(dsu, UnionFind)
+    assert dsu.union(0, 1) and not dsu.union(1, 0)
+
+def test_rollback():
+    uf = UnionFind(5, rollback=True)
+    uf.union(0, 1)
+    marca = uf.snapshot()
+    uf.union(2, 3)
+    uf.union(1, 3)
+    assert uf.connected(0, 2) and uf.count == 2
+    uf.rollback(marca)
+    assert uf.connected(0, 1)
+    assert not uf.connected(0, 2) and not uf.connected(2, 3)
+    assert uf.count == 4
+    assert uf.component_size(0) == 2 and uf.component_size(3) == 1
+    uf.rollback()
+    assert uf.count == 5
+
+def test_rollback_requiere_modo():
+    with pytest.raises(ValueError):
+        UnionFind(3).snapshot()
+    with pytest.raises(ValueError):
+        UnionFind(3).rollback()
+
+def test_rollback_aleatorio_igual_que_reconstruir():
+    rnd = random.Random(5)
+    n = 60
+    uf = UnionFind(n, rollback=True)
+    historial = []
+    for _ in range(300):
+        if historial and rnd.random() < 0.3:
+            uf.rollback(rnd.choice(range(len(uf._log) + 1)))
+            historial = historial[:len(uf._log)]
+        else:
+            a, b = rnd.randrange(n), rnd.randrange(n)
+            if uf.union(a, b):
+                historial.append((a, b))
+        nuevo = UnionFind(n)
+        nuevo.union_many(historial)
+        assert nuevo.count == uf.count
+        for i in range(0, n, 7):
+            assert uf.connected(i, 0) == nuevo.connected(i, 0)
+
+def test_cierres_que_desconectan():
+    # Ciudad: ciclo 0-1-2-3-0 con un puente 3-4
+    edges = [(0, 1), (1, 2), (2, 3), (3, 0), (3, 4)]
+    closures = [[], [0], [4], [0, 2], [1, 3], [0, 1, 2, 3]]
+    assert components_after_closures(5, edges, closures) == [1, 1, 2, 2, 2, 4]
+    assert components_after_closures(5, edges, []) == []
+
+def test_cierres_aleatorios():
+    rnd = random.Random(11)
+    n = 30
+    edges = [(rnd.randrange(n), rnd.randrange(n)) for _ in range(60)]
+    closures = [rnd.sample(range(len(edges)), rnd.randint(0, 20)) for _ in range(40)]
+    esperado = []
+    for cerradas in closures:
+        uf = UnionFind(n)
+        uf.union_many(e for i, e in enumerate(edges) if i not in cerradas)
+        esperado.append(uf.count)
+    assert components_after_closures(n, edges, closures) == esperado
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])